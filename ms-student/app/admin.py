@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import DocumentType, Student
+from .models import DocumentType, Job, OrphanedSpecialty, OutboxEvent, Student
 
 
 @admin.register(Student)
@@ -40,3 +40,37 @@ class DocumentTypeAdmin(admin.ModelAdmin):
     list_filter = ("name",)
     search_fields = ("name", "description")
     ordering = ("name",)
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ("id", "event_type", "aggregate_id", "created_at", "published_at")
+    list_filter = ("event_type",)
+    search_fields = ("aggregate_id",)
+    ordering = ("-id",)
+    readonly_fields = ("event_type", "aggregate_id", "payload", "created_at", "published_at")
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "kind",
+        "status",
+        "processed",
+        "total",
+        "attempts",
+        "created_at",
+        "finished_at",
+    )
+    list_filter = ("kind", "status")
+    ordering = ("-id",)
+    readonly_fields = ("checkpoint", "result", "error", "worker", "lease_expires_at")
+
+
+@admin.register(OrphanedSpecialty)
+class OrphanedSpecialtyAdmin(admin.ModelAdmin):
+    list_display = ("specialty_id", "student_count", "job", "created_at")
+    list_filter = ("job",)
+    search_fields = ("specialty_id",)
+    ordering = ("-job_id", "specialty_id")
@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class AppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app"
+
+    def ready(self):
+        from django.conf import settings
+
+        if settings.EDGE_PURGE_URL:
+            from app.utils.cache import tags_invalidated
+            from app.utils.edge_purge import queue_surrogate_keys
+
+            tags_invalidated.connect(queue_surrogate_keys, dispatch_uid="edge_purge")
@@ -0,0 +1,120 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import BigIntegerField, Max
+from django.db.models.functions import Cast
+
+from app.models import DocumentType, Student
+from app.utils.student_generator import (
+    DOCUMENT_NUMBER_BASE,
+    REFERENCE_DATE,
+    StudentGenerator,
+    bulk_insert,
+    copy_insert,
+)
+
+
+def _parse_ids(value: str) -> list[int]:
+    """Accept "1-10", "1,3,7" or a mix such as "1-4,9"."""
+    ids = []
+    for part in value.split(","):
+        start, _, end = part.strip().partition("-")
+        ids.extend(range(int(start), int(end or start) + 1))
+    if not ids or min(ids) < 1:
+        raise CommandError("Specialty IDs must be positive integers")
+    return ids
+
+
+class Command(BaseCommand):
+    help = "Generate synthetic students for benchmarking and load testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument("count", type=int, help="Number of students to generate")
+        parser.add_argument(
+            "--specialties", default="1-10", help='Specialty IDs, e.g. "1-10" or "1,4,7"'
+        )
+        parser.add_argument(
+            "--document-types",
+            default=",".join(name for name, _label in DocumentType.DOCUMENT_TYPE_CHOICES),
+            help="Comma-separated document type names; missing ones are created",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--today",
+            type=date.fromisoformat,
+            default=REFERENCE_DATE,
+            help=f"Reference date for birth and enrollment dates (default: {REFERENCE_DATE})",
+        )
+        parser.add_argument(
+            "--start-number",
+            type=int,
+            help="First student number (default: one past the current maximum)",
+        )
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument(
+            "--method",
+            choices=["auto", "bulk", "copy"],
+            default="auto",
+            help="copy uses PostgreSQL COPY; auto picks it when available",
+        )
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        if count < 1:
+            raise CommandError("count must be positive")
+
+        document_type_ids = []
+        for name in options["document_types"].split(","):
+            name = name.strip().upper()
+            if name not in dict(DocumentType.DOCUMENT_TYPE_CHOICES):
+                raise CommandError(f"Unknown document type {name}")
+            document_type_ids.append(DocumentType.objects.get_or_create(name=name)[0].id)
+
+        start_number = options["start_number"]
+        if start_number is None:
+            start_number = (
+                Student.objects.aggregate(Max("student_number"))["student_number__max"] or 0
+            ) + 1
+
+        # Document numbers start past every numeric one in the table, so seeding a table
+        # that already has rows cannot repeat one.
+        max_document = (
+            Student.objects.filter(document_number__regex=r"^[0-9]{1,18}$")
+            .annotate(number=Cast("document_number", BigIntegerField()))
+            .aggregate(Max("number"))["number__max"]
+        )
+        first_document_number = max(DOCUMENT_NUMBER_BASE + start_number, (max_document or 0) + 1)
+
+        method = options["method"]
+        if method == "auto":
+            method = "copy" if connection.vendor == "postgresql" else "bulk"
+        if method == "copy" and connection.vendor != "postgresql":
+            raise CommandError("--method copy requires PostgreSQL")
+
+        generator = StudentGenerator(
+            document_type_ids=document_type_ids,
+            specialty_ids=_parse_ids(options["specialties"]),
+            seed=options["seed"],
+            start_number=start_number,
+            today=options["today"],
+            first_document_number=first_document_number,
+        )
+        insert = copy_insert if method == "copy" else bulk_insert
+
+        started = time.perf_counter()
+
+        def progress(written):
+            rate = written / max(time.perf_counter() - started, 1e-9)
+            self.stdout.write(f"  {written}/{count} students ({rate:,.0f}/s)")
+
+        written = insert(
+            generator.generate(count), batch_size=options["batch_size"], progress=progress
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {written} students via {method} in {time.perf_counter() - started:.1f}s "
+                f"(student numbers {start_number}-{start_number + written - 1})"
+            )
+        )
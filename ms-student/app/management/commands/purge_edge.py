@@ -0,0 +1,44 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from app.utils.cache_backend import REDIS_UNAVAILABLE
+from app.utils.edge_purge import purge_pending
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Send the surrogate keys queued by writes to the edge cache purge endpoint."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=settings.EDGE_PURGE_BATCH_SIZE)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.EDGE_PURGE_INTERVAL,
+            help="Pause between drains (s); keys invalidated meanwhile are purged once",
+        )
+        parser.add_argument("--once", action="store_true", help="Drain the queue and exit")
+
+    def _drain(self, batch_size: int) -> int:
+        total = 0
+        while True:
+            purged = purge_pending(batch_size)
+            total += purged
+            if purged < batch_size:
+                return total
+
+    def handle(self, *args, **options):
+        while True:
+            try:
+                purged = self._drain(options["batch_size"])
+                if purged:
+                    self.stdout.write(f"Purged {purged} surrogate keys")
+            except REDIS_UNAVAILABLE as e:
+                logger.warning(f"Edge purge queue unavailable: {e!r}")
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
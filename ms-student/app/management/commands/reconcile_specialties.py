@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from app.services import JobService
+from app.services.student_jobs import ReconcileSpecialtiesJob
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue a reconciliation of students against the academic service's specialties. "
+        "Schedule it periodically (cron); run_jobs workers execute it."
+    )
+
+    def handle(self, *args, **options):
+        service = JobService()
+        job = service.find_pending(ReconcileSpecialtiesJob.kind)
+        if job is not None:
+            self.stdout.write(f"Reconciliation job {job.id} is already {job.status}")
+            return
+        job = service.enqueue(ReconcileSpecialtiesJob.kind, {})
+        self.stdout.write(f"Queued reconciliation job {job.id} for {job.total} specialties")
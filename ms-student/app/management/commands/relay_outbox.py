@@ -0,0 +1,67 @@
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from redis.exceptions import LockError
+
+from app.services import OutboxService
+
+logger = logging.getLogger(__name__)
+
+RELAY_LOCK_KEY = "sysacad:outbox:relay"
+
+
+class Command(BaseCommand):
+    help = "Publish pending outbox events to the Redis Stream in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=settings.OUTBOX_BATCH_SIZE)
+        parser.add_argument("--interval", type=float, default=1.0, help="Idle poll interval (s)")
+        parser.add_argument("--once", action="store_true", help="Drain the outbox and exit")
+        parser.add_argument(
+            "--purge-after-days",
+            type=int,
+            default=7,
+            help="Delete events published longer ago than this (0 disables)",
+        )
+        parser.add_argument("--lock-timeout", type=int, default=30)
+
+    def _drain(self, service: OutboxService, batch_size: int, lock) -> int:
+        total = 0
+        while True:
+            published = service.publish_pending(batch_size)
+            total += published
+            lock.reacquire()
+            if published < batch_size:
+                return total
+
+    def handle(self, *args, **options):
+        service = OutboxService()
+        # Only one relay publishes at a time, which keeps per-student ordering; extra
+        # replicas wait on the lock as hot standbys.
+        lock = service.redis_client.lock(RELAY_LOCK_KEY, timeout=options["lock_timeout"])
+        purge_after = timedelta(days=options["purge_after_days"])
+        last_purge = 0.0
+
+        while True:
+            published = 0
+            if lock.owned() or lock.acquire(blocking=False):
+                try:
+                    published = self._drain(service, options["batch_size"], lock)
+                    if published:
+                        self.stdout.write(f"Published {published} events")
+                    if options["purge_after_days"] and time.monotonic() - last_purge > 3600:
+                        purged = service.purge_published(purge_after)
+                        last_purge = time.monotonic()
+                        if purged:
+                            self.stdout.write(f"Purged {purged} published events")
+                except LockError:
+                    logger.warning("Outbox relay lost its lock; another relay took over")
+                finally:
+                    if options["once"] and lock.owned():
+                        lock.release()
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,56 @@
+import os
+import signal
+import socket
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from app.services import JobService
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs (POST /api/v1/jobs/), one at a time, in chunks."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.JOB_POLL_INTERVAL,
+            help="Idle poll interval (s)",
+        )
+        parser.add_argument("--once", action="store_true", help="Run the queued jobs and exit")
+        parser.add_argument(
+            "--worker-id",
+            default=f"{socket.gethostname()}:{os.getpid()}",
+            help="Name recorded on claimed jobs",
+        )
+
+    def handle(self, *args, **options):
+        service = JobService()
+        stopping = False
+
+        def stop(signum, frame):
+            nonlocal stopping
+            stopping = True
+            self.stdout.write("Stopping after the current chunk")
+
+        # SIGTERM (e.g. a deploy) finishes the chunk in progress and requeues the job, so
+        # the next worker resumes it from its checkpoint.
+        previous = {sig: signal.signal(sig, stop) for sig in (signal.SIGTERM, signal.SIGINT)}
+        try:
+            while not stopping:
+                close_old_connections()
+                job = service.run_next(options["worker_id"], should_stop=lambda: stopping)
+                if job is not None:
+                    self.stdout.write(
+                        f"Job {job.id} ({job.kind}) {job.status}: {job.processed} processed"
+                    )
+                    continue
+                if options["once"]:
+                    return
+                time.sleep(options["interval"])
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
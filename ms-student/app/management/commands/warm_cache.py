@@ -0,0 +1,45 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from app.services import CacheWarmupService
+from app.services.cache_warmup import RateLimiter
+
+
+class Command(BaseCommand):
+    help = "Preload document types, the first student list pages and the most-read students."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pages", type=int, default=settings.CACHE_WARMUP_PAGES)
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=settings.REST_FRAMEWORK["PAGE_SIZE"],
+            help="Must match the API page size for the pages to be hit",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=settings.CACHE_WARMUP_TOP_STUDENTS,
+            help="Most-read students to preload",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=settings.CACHE_WARMUP_RATE,
+            help="Max rows loaded per second (0 = unlimited)",
+        )
+        parser.add_argument("--batch-size", type=int, default=100)
+
+    def handle(self, *args, **options):
+        service = CacheWarmupService(
+            limiter=RateLimiter(options["rate"]), batch_size=options["batch_size"]
+        )
+        started = time.monotonic()
+        summary = service.warm(options["pages"], options["page_size"], options["top"])
+        self.stdout.write(
+            f"Warmed {summary['document_types']} document types, "
+            f"{summary['page_students']} students on list pages and "
+            f"{summary['hot_students']} most-read students in {time.monotonic() - started:.1f}s"
+        )
@@ -0,0 +1,11 @@
+from .deadline import DeadlineMiddleware
+from .idempotency import IdempotencyMiddleware
+from .query_budget import QueryBudgetMiddleware
+from .server_timing import ServerTimingMiddleware
+
+__all__ = [
+    "ServerTimingMiddleware",
+    "QueryBudgetMiddleware",
+    "IdempotencyMiddleware",
+    "DeadlineMiddleware",
+]
@@ -0,0 +1,26 @@
+from django.conf import settings
+
+from app.utils.deadline import deadline_scope
+
+
+class DeadlineMiddleware:
+    """
+    Starts every request's deadline (app.utils.deadline). A caller may ask for a shorter
+    one in seconds with X-Request-Timeout, e.g. a peer service forwarding what it has left.
+    """
+
+    HEADER = "HTTP_X_REQUEST_TIMEOUT"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        seconds = settings.REQUEST_DEADLINE_SECONDS
+        try:
+            requested = float(request.META.get(self.HEADER, ""))
+        except ValueError:
+            requested = None
+        if requested is not None and requested > 0:
+            seconds = min(seconds, requested)
+        with deadline_scope(seconds):
+            return self.get_response(request)
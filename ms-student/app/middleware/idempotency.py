@@ -0,0 +1,119 @@
+import hashlib
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+
+from app.utils.deadline import remaining
+
+logger = logging.getLogger(__name__)
+
+HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+# Headers replayed with a stored response besides its body and status.
+REPLAYED_HEADERS = ("Content-Type", "ETag", "Location")
+POLL_INTERVAL = 0.05
+
+
+def _cache_key(request, key: str) -> str:
+    digest = hashlib.sha256(f"{request.method}:{request.path}:{key}".encode()).hexdigest()
+    return f"idempotency:{digest[:40]}"
+
+
+def _fingerprint(request) -> str:
+    return hashlib.sha256(request.body).hexdigest()
+
+
+class IdempotencyMiddleware:
+    """
+    `Idempotency-Key` support for the viewset actions listed in `idempotent_actions`,
+    so a retried POST (traefik retries, client timeouts) does not run twice.
+
+    The first request with a key holds a short lock while it runs; its response (unless
+    a 5xx, which stays retryable) is stored for IDEMPOTENCY_TTL and replayed with
+    `Idempotent-Replayed: true` to every later request with the same key, method and
+    path. Concurrent duplicates wait up to IDEMPOTENCY_WAIT_TIMEOUT (never past the
+    request's deadline) for that response, then get 409. Reusing a key with a different
+    body is a 422.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        pending = getattr(request, "_idempotency", None)
+        if pending is None:
+            return response
+        cache_key, fingerprint = pending
+        try:
+            if response.status_code < 500:
+                cache.set(
+                    cache_key,
+                    {
+                        "fingerprint": fingerprint,
+                        "status": response.status_code,
+                        "headers": {
+                            h: response[h] for h in REPLAYED_HEADERS if response.has_header(h)
+                        },
+                        "content": response.content.decode(),
+                    },
+                    timeout=settings.IDEMPOTENCY_TTL,
+                )
+        finally:
+            cache.delete(f"{cache_key}:lock")
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        key = request.headers.get(HEADER)
+        if not key:
+            return None
+        actions = getattr(view_func, "actions", None) or {}
+        action = actions.get(request.method.lower())
+        if action not in getattr(getattr(view_func, "cls", None), "idempotent_actions", ()):
+            return None
+        if len(key) > MAX_KEY_LENGTH:
+            return JsonResponse(
+                {"error": f"{HEADER} must be at most {MAX_KEY_LENGTH} characters"}, status=400
+            )
+
+        cache_key = _cache_key(request, key)
+        fingerprint = _fingerprint(request)
+        wait = settings.IDEMPOTENCY_WAIT_TIMEOUT
+        left = remaining()
+        if left is not None:
+            wait = min(wait, left)
+        deadline = time.monotonic() + wait
+        while True:
+            stored = cache.get(cache_key)
+            if stored is not None:
+                return self._replay(stored, fingerprint)
+            if cache.add(
+                f"{cache_key}:lock", fingerprint, timeout=settings.IDEMPOTENCY_LOCK_TIMEOUT
+            ):
+                request._idempotency = (cache_key, fingerprint)
+                return None
+            if time.monotonic() >= deadline:
+                logger.info(
+                    f"{HEADER} still in progress after waiting: {request.method} {request.path}"
+                )
+                response = JsonResponse(
+                    {"error": f"A request with this {HEADER} is still in progress"}, status=409
+                )
+                response["Retry-After"] = "1"
+                return response
+            time.sleep(POLL_INTERVAL)
+
+    @staticmethod
+    def _replay(stored: dict, fingerprint: str) -> HttpResponse:
+        if stored["fingerprint"] != fingerprint:
+            return JsonResponse(
+                {"error": f"{HEADER} was already used with a different request body"}, status=422
+            )
+        response = HttpResponse(stored["content"], status=stored["status"])
+        for header, value in stored["headers"].items():
+            response[header] = value
+        response["Idempotent-Replayed"] = "true"
+        return response
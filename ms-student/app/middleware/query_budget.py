@@ -0,0 +1,46 @@
+import logging
+
+from django.conf import settings
+
+from app.utils.query_budget import QueryRecorder, get_query_budget
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetMiddleware:
+    """
+    Dev-mode guard: counts the queries of every request and logs a warning when a view
+    action runs more than its declared `query_budgets`. With DEBUG on, the warning
+    includes the SQL and the stack that issued each query.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, "QUERY_BUDGET_ENABLED", False):
+            return self.get_response(request)
+
+        with QueryRecorder(capture_stacks=settings.DEBUG) as recorder:
+            response = self.get_response(request)
+
+        budget = getattr(request, "_query_budget", None)
+        if budget is not None:
+            response["X-Query-Count"] = str(recorder.count)
+            if recorder.count > budget:
+                message = (
+                    f"Query budget exceeded for {request.method} {request.path}: "
+                    f"{recorder.count} queries, budget is {budget}"
+                )
+                if settings.DEBUG:
+                    message = f"{message}\n{recorder.format_queries()}"
+                logger.warning(message)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # DRF viewset views expose the class and the method -> action mapping.
+        actions = getattr(view_func, "actions", None) or {}
+        request._query_budget = get_query_budget(
+            getattr(view_func, "cls", None), actions.get(request.method.lower())
+        )
+        return None
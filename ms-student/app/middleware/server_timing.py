@@ -0,0 +1,62 @@
+import hmac
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from app.utils import server_timing
+from app.utils.server_timing import ServerTimings, timed
+
+
+def _timed_execute(execute, sql, params, many, context):
+    with timed("db"):
+        return execute(sql, params, many, context)
+
+
+class ServerTimingMiddleware:
+    """
+    Emits a Server-Timing header splitting the request into db, cache, academic,
+    serialize and render phases. Enabled globally with SERVER_TIMING_ENABLED or per
+    request by sending SERVER_TIMING_TOKEN in the X-Server-Timing-Token header.
+    """
+
+    TOKEN_HEADER = "HTTP_X_SERVER_TIMING_TOKEN"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def _is_enabled(self, request) -> bool:
+        if getattr(settings, "SERVER_TIMING_ENABLED", False):
+            return True
+        token = getattr(settings, "SERVER_TIMING_TOKEN", "")
+        supplied = request.META.get(self.TOKEN_HEADER)
+        return bool(token and supplied) and hmac.compare_digest(token.encode(), supplied.encode())
+
+    def __call__(self, request):
+        if not self._is_enabled(request):
+            return self.get_response(request)
+
+        timings = ServerTimings()
+        token = server_timing.activate(timings)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_timed_execute))
+                response = self.get_response(request)
+        finally:
+            server_timing.deactivate(token)
+
+        response["Server-Timing"] = timings.header_value(time.perf_counter() - start)
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered after the view returns; time that step too.
+        timings = server_timing.current()
+        if timings is not None:
+            render_start = time.perf_counter()
+            response.add_post_render_callback(
+                lambda _response: timings.add("render", time.perf_counter() - render_start)
+            )
+        return response
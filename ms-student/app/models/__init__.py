@@ -1,4 +1,7 @@
 from .document_type import DocumentType
+from .job import Job
+from .orphaned_specialty import OrphanedSpecialty
+from .outbox_event import OutboxEvent
 from .student import Student
 
-__all__ = ["Student", "DocumentType"]
+__all__ = ["Student", "DocumentType", "OutboxEvent", "Job", "OrphanedSpecialty"]
@@ -0,0 +1,69 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import Q
+
+
+class Job(models.Model):
+    """
+    A background job, queued in this table and run in chunks by `manage.py run_jobs`.
+    `checkpoint` is the handler's position after the last committed chunk; a job whose
+    worker dies (its lease expires) is claimed again and resumes from there.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (SUCCEEDED, "Succeeded"),
+        (FAILED, "Failed"),
+    ]
+
+    kind = models.CharField(max_length=50)
+    params = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=QUEUED)
+
+    total = models.PositiveIntegerField(null=True, blank=True)
+    processed = models.PositiveIntegerField(default=0)
+    checkpoint = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(blank=True, default="")
+
+    attempts = models.PositiveSmallIntegerField(default=0)
+    worker = models.CharField(max_length=100, blank=True, default="")
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "jobs"
+        verbose_name = "Job"
+        verbose_name_plural = "Jobs"
+        ordering = ["id"]
+        indexes = [
+            # Worker poll: only queued and running jobs are indexed.
+            models.Index(
+                fields=["id"],
+                condition=Q(status__in=["queued", "running"]),
+                name="jobs_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.id} ({self.status})"
+
+    def __repr__(self):
+        return f"<Job: {self.kind} {self.id} {self.status}>"
+
+    @property
+    def progress(self) -> float | None:
+        if self.status == self.SUCCEEDED:
+            return 1.0
+        if not self.total:
+            return None
+        return min(self.processed / self.total, 1.0)
@@ -0,0 +1,32 @@
+from django.db import models
+
+from .job import Job
+
+
+class OrphanedSpecialty(models.Model):
+    """
+    A specialty_id still held by active students that the academic service no longer
+    knows, as found by a reconciliation job (students.reconcile_specialties).
+    """
+
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="orphaned_specialties")
+    specialty_id = models.IntegerField()
+    student_count = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "orphaned_specialties"
+        verbose_name = "Orphaned specialty"
+        verbose_name_plural = "Orphaned specialties"
+        ordering = ["job_id", "specialty_id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["job", "specialty_id"], name="orphaned_specialties_job_specialty_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"Specialty {self.specialty_id} ({self.student_count} students)"
+
+    def __repr__(self):
+        return f"<OrphanedSpecialty: {self.specialty_id} job={self.job_id}>"
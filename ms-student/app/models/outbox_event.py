@@ -0,0 +1,37 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import Q
+
+
+class OutboxEvent(models.Model):
+    EVENT_TYPE_CHOICES = [
+        ("student.created", "Student created"),
+        ("student.updated", "Student updated"),
+        ("student.deleted", "Student deleted"),
+    ]
+
+    event_type = models.CharField(max_length=50, choices=EVENT_TYPE_CHOICES)
+    aggregate_id = models.BigIntegerField(help_text="ID of the student the event refers to")
+    payload = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    published_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "outbox_events"
+        verbose_name = "Outbox Event"
+        verbose_name_plural = "Outbox Events"
+        ordering = ["id"]
+        indexes = [
+            # Relay scan: only the (small) unpublished tail is indexed.
+            models.Index(
+                fields=["id"], condition=Q(published_at__isnull=True), name="outbox_unpublished_idx"
+            ),
+            models.Index(fields=["published_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} #{self.aggregate_id}"
+
+    def __repr__(self):
+        return f"<OutboxEvent: {self.event_type} {self.aggregate_id}>"
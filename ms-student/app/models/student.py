@@ -3,6 +3,8 @@ from datetime import date
 from django.core.validators import MinValueValidator
 from django.db import models
 
+_ACTIVE = models.Q(is_active=True, deleted_at__isnull=True)
+
 
 class Student(models.Model):
     first_name = models.CharField(max_length=50)
@@ -34,6 +36,10 @@ class Student(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Optimistic concurrency: goes up on every write. StudentRepository.update writes
+    # only if the row is still at the version it was read at.
+    version = models.PositiveIntegerField(default=1, db_default=1)
+
     class Meta:
         db_table = "students"
         verbose_name = "Student"
@@ -45,6 +51,17 @@ class Student(models.Model):
             models.Index(fields=["last_name", "first_name"]),
             models.Index(fields=["specialty_id"]),
             models.Index(fields=["is_active", "deleted_at"]),
+            # Existence checks (/students/exists/) only look at active rows; partial
+            # indexes on them let those queries be answered from the index alone.
+            models.Index(fields=["id"], condition=_ACTIVE, name="students_active_id_idx"),
+            models.Index(
+                fields=["student_number"], condition=_ACTIVE, name="students_active_number_idx"
+            ),
+            models.Index(
+                fields=["document_number"], condition=_ACTIVE, name="students_active_document_idx"
+            ),
+            # Keyset order of the change feed; includes soft-deleted rows as tombstones.
+            models.Index(fields=["updated_at", "id"]),
         ]
 
     def __str__(self):
@@ -53,6 +70,13 @@ class Student(models.Model):
     def __repr__(self):
         return f"<Student: {self.last_name}, {self.first_name}>"
 
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            self.version += 1
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "version"}
+        super().save(*args, **kwargs)
+
     @property
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}"
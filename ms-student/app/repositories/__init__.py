@@ -1,4 +1,13 @@
 from .document_type import DocumentTypeRepository
+from .job import JobRepository
+from .orphaned_specialty import OrphanedSpecialtyRepository
+from .outbox_event import OutboxEventRepository
 from .student import StudentRepository
 
-__all__ = ["StudentRepository", "DocumentTypeRepository"]
+__all__ = [
+    "StudentRepository",
+    "DocumentTypeRepository",
+    "OutboxEventRepository",
+    "JobRepository",
+    "OrphanedSpecialtyRepository",
+]
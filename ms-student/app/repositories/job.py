@@ -0,0 +1,86 @@
+from datetime import timedelta
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from app.models import Job
+
+
+class JobRepository:
+    @staticmethod
+    def create(kind: str, params: dict, total: int | None = None) -> Job:
+        return Job.objects.create(kind=kind, params=params, total=total)
+
+    @staticmethod
+    def find_by_id(id: int) -> Job | None:
+        return Job.objects.filter(id=id).first()
+
+    @staticmethod
+    def find_pending(kind: str) -> Job | None:
+        return Job.objects.filter(kind=kind, status__in=[Job.QUEUED, Job.RUNNING]).first()
+
+    @staticmethod
+    def claim_next(worker: str, lease: timedelta, max_attempts: int) -> Job | None:
+        """
+        Take the oldest queued job, or a running one whose worker let its lease expire.
+        SKIP LOCKED lets concurrent workers claim different jobs without waiting.
+        """
+        with transaction.atomic():
+            now = timezone.now()
+            job = (
+                Job.objects.select_for_update(skip_locked=True)
+                .filter(
+                    Q(status=Job.QUEUED) | Q(status=Job.RUNNING, lease_expires_at__lt=now),
+                    attempts__lt=max_attempts,
+                )
+                .order_by("id")
+                .first()
+            )
+            if job is None:
+                return None
+            job.status = Job.RUNNING
+            job.worker = worker
+            job.lease_expires_at = now + lease
+            job.attempts += 1
+            job.started_at = job.started_at or now
+            job.save(
+                update_fields=[
+                    "status",
+                    "worker",
+                    "lease_expires_at",
+                    "attempts",
+                    "started_at",
+                    "updated_at",
+                ]
+            )
+            return job
+
+    @staticmethod
+    def fail_abandoned(max_attempts: int) -> int:
+        """Fail running jobs whose lease expired after their last allowed attempt."""
+        now = timezone.now()
+        return Job.objects.filter(
+            status=Job.RUNNING, lease_expires_at__lt=now, attempts__gte=max_attempts
+        ).update(
+            status=Job.FAILED,
+            error="Worker lost the job too many times",
+            finished_at=now,
+            updated_at=now,
+        )
+
+    @staticmethod
+    def save_progress(job: Job, lease: timedelta, **fields: Any) -> bool:
+        """
+        Store progress fields and extend the lease, only while `job.worker` still holds
+        it. False means another worker took the job over.
+        """
+        now = timezone.now()
+        fields.setdefault("lease_expires_at", now + lease)
+        written = Job.objects.filter(id=job.id, status=Job.RUNNING, worker=job.worker).update(
+            **fields, updated_at=now
+        )
+        for name, value in fields.items():
+            setattr(job, name, value)
+        return bool(written)
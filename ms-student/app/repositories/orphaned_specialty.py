@@ -0,0 +1,15 @@
+from app.models import OrphanedSpecialty
+
+
+class OrphanedSpecialtyRepository:
+    @staticmethod
+    def create_many(job_id: int, student_counts: dict[int, int]) -> list[OrphanedSpecialty]:
+        """One row per {specialty_id: student_count}, in a single INSERT."""
+        return OrphanedSpecialty.objects.bulk_create(
+            OrphanedSpecialty(job_id=job_id, specialty_id=specialty_id, student_count=count)
+            for specialty_id, count in student_counts.items()
+        )
+
+    @staticmethod
+    def find_by_job(job_id: int) -> list[OrphanedSpecialty]:
+        return list(OrphanedSpecialty.objects.filter(job_id=job_id).order_by("specialty_id"))
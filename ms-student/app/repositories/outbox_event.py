@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from django.utils import timezone
+
+from app.models import OutboxEvent
+
+
+class OutboxEventRepository:
+    @staticmethod
+    def create(event_type: str, aggregate_id: int, payload: dict) -> OutboxEvent:
+        return OutboxEvent.objects.create(
+            event_type=event_type, aggregate_id=aggregate_id, payload=payload
+        )
+
+    @staticmethod
+    def create_many(event_type: str, payloads: dict[int, dict]) -> list[OutboxEvent]:
+        """One event per {aggregate_id: payload}, in a single INSERT."""
+        return OutboxEvent.objects.bulk_create(
+            OutboxEvent(event_type=event_type, aggregate_id=aggregate_id, payload=payload)
+            for aggregate_id, payload in payloads.items()
+        )
+
+    @staticmethod
+    def find_unpublished(limit: int) -> list[OutboxEvent]:
+        return list(OutboxEvent.objects.filter(published_at__isnull=True).order_by("id")[:limit])
+
+    @staticmethod
+    def mark_published(ids: list[int]) -> int:
+        return OutboxEvent.objects.filter(id__in=ids).update(published_at=timezone.now())
+
+    @staticmethod
+    def delete_published_before(before: datetime) -> int:
+        deleted, _ = OutboxEvent.objects.filter(published_at__lt=before).delete()
+        return deleted
@@ -1,7 +1,9 @@
+from collections.abc import Iterable
+from datetime import datetime
 from typing import Any
 
 from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
-from django.db.models import QuerySet
+from django.db.models import Count, F, Q, QuerySet
 from django.utils import timezone
 
 from app.models import Student
@@ -22,35 +24,150 @@ class StudentRepository:
     @staticmethod
     def find_by_id(id: int) -> Student | None:
         try:
-            return StudentRepository._get_active_queryset().select_related("document_type").get(id=id)
+            return StudentRepository._get_active_queryset().get(id=id)
         except ObjectDoesNotExist:
             return None
 
     @staticmethod
     def find_by_student_number(student_number: int) -> Student | None:
         try:
-            return StudentRepository._get_active_queryset().select_related("document_type").get(
-                student_number=student_number
-            )
+            return StudentRepository._get_active_queryset().get(student_number=student_number)
         except (ObjectDoesNotExist, MultipleObjectsReturned):
             return None
 
+    @staticmethod
+    def find_by_ids(ids: list[int]) -> list[Student]:
+        return list(StudentRepository._get_active_queryset().filter(id__in=ids))
+
+    @staticmethod
+    def find_ids_by_student_numbers(student_numbers: list[int]) -> dict[int, int]:
+        return dict(
+            StudentRepository._get_active_queryset()
+            .filter(student_number__in=student_numbers)
+            .values_list("student_number", "id")
+        )
+
+    @staticmethod
+    def find_existing(field: str, values: list) -> set:
+        """Which of `values` an active student has in `field` (id, student_number or document_number)."""
+        return set(
+            StudentRepository._get_active_queryset()
+            .filter(**{f"{field}__in": values})
+            .values_list(field, flat=True)
+        )
+
     @staticmethod
     def find_all() -> QuerySet[Student]:
-        return StudentRepository._get_active_queryset().select_related("document_type")
+        return StudentRepository._get_active_queryset()
 
     @staticmethod
     def find_by_specialty(specialty_id: int) -> QuerySet[Student]:
-        return StudentRepository._get_active_queryset().filter(
-            specialty_id=specialty_id
-        ).select_related("document_type")
+        return StudentRepository._get_active_queryset().filter(specialty_id=specialty_id)
 
     @staticmethod
-    def update(student: Student) -> Student:
+    def find_changed_since(
+        updated_at: datetime | None, id: int, until: datetime, limit: int
+    ) -> list[Student]:
+        queryset = Student.objects.filter(updated_at__lte=until)
+        if updated_at is not None:
+            queryset = queryset.filter(
+                Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=id)
+            )
+        return list(queryset.order_by("updated_at", "id")[:limit])
+
+    @staticmethod
+    def update(student: Student, fields: Iterable[str] | None = None) -> Student | None:
+        """
+        Write `fields` (every field by default) with a single
+        UPDATE ... WHERE id = ? AND version = ?, bumping version and updated_at. Returns
+        None, leaving the row alone, when another write changed it since `student` was read.
+        """
         student.full_clean()
-        student.save()
+        if fields is None:
+            fields = [
+                field.name for field in Student._meta.concrete_fields if not field.primary_key
+            ]
+        values = {
+            attname: getattr(student, attname)
+            for attname in (Student._meta.get_field(name).attname for name in fields)
+            if attname not in ("version", "updated_at")
+        }
+        now = timezone.now()
+        written = (
+            StudentRepository._get_active_queryset()
+            .filter(id=student.id, version=student.version)
+            .update(**values, version=student.version + 1, updated_at=now)
+        )
+        if not written:
+            return None
+        student.version += 1
+        student.updated_at = now
         return student
 
+    @staticmethod
+    def _selection(ids: list[int] | None, filters: dict[str, Any]) -> QuerySet[Student]:
+        queryset = StudentRepository._get_active_queryset().filter(**filters)
+        if ids is not None:
+            queryset = queryset.filter(id__in=ids)
+        return queryset
+
+    @staticmethod
+    def find_ids(
+        ids: list[int] | None = None, after_id: int = 0, limit: int | None = None, **filters
+    ) -> list[int]:
+        """
+        Ids of the active students among `ids` (all when None) matching `filters`, in id
+        order. `after_id` and `limit` page through them by keyset.
+        """
+        queryset = StudentRepository._selection(ids, filters)
+        if after_id:
+            queryset = queryset.filter(id__gt=after_id)
+        queryset = queryset.order_by("id").values_list("id", flat=True)
+        return list(queryset[:limit] if limit is not None else queryset)
+
+    @staticmethod
+    def count(ids: list[int] | None = None, **filters) -> int:
+        return StudentRepository._selection(ids, filters).count()
+
+    @staticmethod
+    def count_specialties() -> int:
+        return StudentRepository._get_active_queryset().values("specialty_id").distinct().count()
+
+    @staticmethod
+    def count_by_specialty(after_specialty_id: int, limit: int) -> dict[int, int]:
+        """{specialty_id: active students} for the next `limit` specialties, in id order."""
+        return dict(
+            StudentRepository._get_active_queryset()
+            .filter(specialty_id__gt=after_specialty_id)
+            .values("specialty_id")
+            .annotate(students=Count("id"))
+            .order_by("specialty_id")
+            .values_list("specialty_id", "students")[:limit]
+        )
+
+    @staticmethod
+    def update_many(ids: list[int], changes: dict[str, Any]) -> int:
+        """Apply `changes` to the active rows among `ids` in one UPDATE, bumping version."""
+        return (
+            StudentRepository._get_active_queryset()
+            .filter(id__in=ids)
+            .update(**changes, version=F("version") + 1, updated_at=timezone.now())
+        )
+
+    @staticmethod
+    def delete_many(ids: list[int]) -> int:
+        """Soft-delete the active rows among `ids` in one UPDATE, bumping version."""
+        now = timezone.now()
+        return (
+            StudentRepository._get_active_queryset()
+            .filter(id__in=ids)
+            .update(is_active=False, deleted_at=now, version=F("version") + 1, updated_at=now)
+        )
+
+    @staticmethod
+    def find_values(ids: list[int], fields: list[str]) -> list[dict[str, Any]]:
+        return list(Student.objects.filter(id__in=ids).order_by("id").values(*fields))
+
     @staticmethod
     def delete_by_id(id: int) -> bool:
         try:
@@ -1,4 +1,17 @@
 from .document_type import DocumentTypeSerializer
+from .job import JobSerializer
 from .student import StudentSerializer
+from .student_bulk_update import StudentBulkUpdateSerializer
+from .student_change import StudentChangeSerializer
+from .student_exists import StudentExistsQuerySerializer
+from .student_lookup import StudentLookupSerializer
 
-__all__ = ["StudentSerializer", "DocumentTypeSerializer"]
+__all__ = [
+    "StudentSerializer",
+    "DocumentTypeSerializer",
+    "StudentChangeSerializer",
+    "StudentLookupSerializer",
+    "StudentExistsQuerySerializer",
+    "StudentBulkUpdateSerializer",
+    "JobSerializer",
+]
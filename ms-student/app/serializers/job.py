@@ -0,0 +1,57 @@
+from rest_framework import serializers
+
+from app.models import Job
+from app.serializers.student_bulk_update import (
+    StudentBulkUpdateSerializer,
+    StudentSelectionSerializer,
+)
+
+# Job kinds accepted by POST /api/v1/jobs/, with the serializer of their params.
+JOB_PARAMS_SERIALIZERS = {
+    "students.bulk_update": StudentBulkUpdateSerializer,
+    "students.delete": StudentSelectionSerializer,
+    "students.reconcile_specialties": serializers.Serializer,
+}
+
+
+class JobSerializer(serializers.ModelSerializer):
+    kind = serializers.ChoiceField(choices=sorted(JOB_PARAMS_SERIALIZERS))
+    params = serializers.DictField()
+    progress = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = Job
+        fields = [
+            "id",
+            "kind",
+            "params",
+            "status",
+            "total",
+            "processed",
+            "progress",
+            "result",
+            "error",
+            "attempts",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = [
+            "id",
+            "status",
+            "total",
+            "processed",
+            "result",
+            "error",
+            "attempts",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+
+    def validate(self, attrs):
+        params = JOB_PARAMS_SERIALIZERS[attrs["kind"]](data=attrs["params"])
+        if not params.is_valid():
+            raise serializers.ValidationError({"params": params.errors})
+        attrs["params"] = params.validated_data
+        return attrs
@@ -111,6 +111,26 @@ class StudentSerializer(serializers.ModelSerializer):
 
         return data
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # ?expand=: the view passes the related data of the page in the context.
+        specialties = self.context.get("specialties")
+        if specialties is not None:
+            data["specialty"] = specialties.get(instance.specialty_id)
+        document_types = self.context.get("document_types")
+        if document_types is not None:
+            # A relation loaded with the row wins over the catalog snapshot.
+            if Student.document_type.is_cached(instance):
+                document_type = instance.document_type
+            else:
+                document_type = document_types.get(instance.document_type_id)
+            data["document_type"] = document_type and {
+                "id": document_type.id,
+                "name": document_type.name,
+                "description": document_type.description,
+            }
+        return data
+
     class Meta:
         model = Student
         fields = [
@@ -126,5 +146,6 @@ class StudentSerializer(serializers.ModelSerializer):
             "specialty_id",
             "created_at",
             "updated_at",
+            "version",
         ]
-        read_only_fields = ["id", "created_at", "updated_at"]
+        read_only_fields = ["id", "created_at", "updated_at", "version"]
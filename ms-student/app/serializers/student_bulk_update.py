@@ -0,0 +1,40 @@
+from rest_framework import serializers
+
+# Fields a bulk update may select on and change; all are foreign ids and none is unique
+# or validated against the rest of the row.
+BULK_FILTER_FIELDS = ("specialty_id", "document_type_id")
+BULK_UPDATABLE_FIELDS = ("specialty_id", "document_type_id")
+
+
+class StudentSelectionSerializer(serializers.Serializer):
+    """A set of students: explicit ids, or a filter on BULK_FILTER_FIELDS."""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, allow_empty=False
+    )
+    filter = serializers.DictField(child=serializers.IntegerField(min_value=1), required=False)
+
+    def _validate_fields(self, value: dict, allowed: tuple[str, ...]) -> dict:
+        if not value:
+            raise serializers.ValidationError("This field may not be empty.")
+        unknown = sorted(set(value) - set(allowed))
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unsupported fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}."
+            )
+        return value
+
+    def validate_filter(self, value):
+        return self._validate_fields(value, BULK_FILTER_FIELDS)
+
+    def validate(self, attrs):
+        if ("ids" in attrs) == ("filter" in attrs):
+            raise serializers.ValidationError("Provide exactly one of ids or filter.")
+        return attrs
+
+
+class StudentBulkUpdateSerializer(StudentSelectionSerializer):
+    changes = serializers.DictField(child=serializers.IntegerField(min_value=1))
+
+    def validate_changes(self, value):
+        return self._validate_fields(value, BULK_UPDATABLE_FIELDS)
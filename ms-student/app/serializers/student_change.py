@@ -0,0 +1,20 @@
+from rest_framework import serializers
+
+from app.serializers.student import StudentSerializer
+
+
+class StudentChangeSerializer(serializers.BaseSerializer):
+    """Full representation for live students, a tombstone for soft-deleted ones."""
+
+    def to_representation(self, instance):
+        if instance.is_active and instance.deleted_at is None:
+            return {**StudentSerializer(instance).data, "deleted": False}
+        return {
+            "id": instance.id,
+            "student_number": instance.student_number,
+            "deleted": True,
+            "deleted_at": serializers.DateTimeField().to_representation(instance.deleted_at)
+            if instance.deleted_at
+            else None,
+            "updated_at": serializers.DateTimeField().to_representation(instance.updated_at),
+        }
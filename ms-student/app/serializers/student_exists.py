@@ -0,0 +1,34 @@
+from django.conf import settings
+from rest_framework import serializers
+
+
+class StudentExistsQuerySerializer(serializers.Serializer):
+    """Query of /students/exists/: comma-separated (or repeated) values per field."""
+
+    id = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+    student_number = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False
+    )
+    document_number = serializers.ListField(
+        child=serializers.CharField(max_length=50), required=False
+    )
+
+    def to_internal_value(self, data):
+        values = {
+            field: [value for raw in data.getlist(field) for value in raw.split(",") if value]
+            for field in self.fields
+            if field in data
+        }
+        return super().to_internal_value(values)
+
+    def validate(self, attrs):
+        total = sum(len(values) for values in attrs.values())
+        if total == 0:
+            raise serializers.ValidationError(
+                "Provide at least one of id, student_number or document_number."
+            )
+        if total > settings.STUDENT_LOOKUP_MAX_ITEMS:
+            raise serializers.ValidationError(
+                f"At most {settings.STUDENT_LOOKUP_MAX_ITEMS} identifiers per request."
+            )
+        return attrs
@@ -0,0 +1,19 @@
+from django.conf import settings
+from rest_framework import serializers
+
+
+class StudentLookupSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+    student_numbers = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False
+    )
+
+    def validate(self, attrs):
+        total = len(attrs.get("ids", [])) + len(attrs.get("student_numbers", []))
+        if total == 0:
+            raise serializers.ValidationError("Provide at least one of ids or student_numbers.")
+        if total > settings.STUDENT_LOOKUP_MAX_ITEMS:
+            raise serializers.ValidationError(
+                f"At most {settings.STUDENT_LOOKUP_MAX_ITEMS} identifiers per lookup."
+            )
+        return attrs
@@ -1,4 +1,17 @@
+# Registers the student job handlers with JobService.
+from . import student_jobs  # noqa: F401
+from .cache_warmup import CacheWarmupService
 from .document_type import DocumentTypeService
+from .job import JobService
+from .outbox import OutboxService
+from .specialty import SpecialtyService
 from .student import StudentService
 
-__all__ = ["StudentService", "DocumentTypeService"]
+__all__ = [
+    "StudentService",
+    "DocumentTypeService",
+    "OutboxService",
+    "CacheWarmupService",
+    "JobService",
+    "SpecialtyService",
+]
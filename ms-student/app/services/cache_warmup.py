@@ -0,0 +1,119 @@
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from itertools import batched
+
+from django.conf import settings
+from django.db import connection
+from django_redis import get_redis_connection
+
+from app.services.document_type import DocumentTypeService
+from app.services.student import StudentService
+from app.utils.hot_keys import HotKeyTracker, student_reads
+
+logger = logging.getLogger(__name__)
+
+WARMUP_LOCK_KEY = "sysacad:cache:warmup"
+# Held (not released) for this long, so workers and replicas that start during a
+# rollout skip the warm-up instead of repeating it.
+WARMUP_LOCK_TIMEOUT = 300
+
+
+class RateLimiter:
+    """Paces work to at most `rate` units (rows) per second; 0 disables the limit."""
+
+    def __init__(self, rate: float, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.clock = clock
+        self.sleep = sleep
+        self._available_at = 0.0
+
+    def wait(self, units: int):
+        if self.rate <= 0:
+            return
+        now = self.clock()
+        if self._available_at > now:
+            self.sleep(self._available_at - now)
+            now = self._available_at
+        self._available_at = now + units / self.rate
+
+
+class CacheWarmupService:
+    """
+    Preloads the cache after a deploy or a Redis flush through the services' own read
+    paths, so entries use the same keys and tags as regular traffic: document types,
+    the first list pages and the most-read students (sampled by StudentService).
+    """
+
+    def __init__(
+        self,
+        student_service: StudentService = None,
+        document_type_service: DocumentTypeService = None,
+        read_tracker: HotKeyTracker = None,
+        limiter: RateLimiter = None,
+        batch_size: int = 100,
+    ):
+        self.student_service = student_service or StudentService()
+        self.document_type_service = document_type_service or DocumentTypeService()
+        self.read_tracker = read_tracker or student_reads
+        self.limiter = limiter or RateLimiter(settings.CACHE_WARMUP_RATE)
+        self.batch_size = batch_size
+
+    def warm_document_types(self) -> int:
+        document_types = self.document_type_service.find_all()
+        self.limiter.wait(len(document_types))
+        self.document_type_service.cache_each(document_types)
+        return len(document_types)
+
+    def warm_student_pages(self, pages: int, page_size: int) -> int:
+        warmed = 0
+        for page in range(1, pages + 1):
+            self.limiter.wait(page_size)
+            students, count = self.student_service.find_page(page, page_size)
+            warmed += len(students)
+            if page * page_size >= count:
+                break
+        return warmed
+
+    def warm_students(self, ids: Iterable[int]) -> int:
+        warmed = 0
+        for batch in batched(ids, self.batch_size, strict=False):
+            self.limiter.wait(len(batch))
+            warmed += len(self.student_service.find_by_ids(batch))
+        return warmed
+
+    def warm(self, pages: int, page_size: int, top_students: int) -> dict:
+        hot_ids = [int(id) for id in self.read_tracker.top(top_students)]
+        return {
+            "document_types": self.warm_document_types(),
+            "page_students": self.warm_student_pages(pages, page_size),
+            "hot_students": self.warm_students(hot_ids),
+        }
+
+
+def start_background_warmup() -> threading.Thread:
+    """Warm the cache from a daemon thread; only the worker holding the lock does it."""
+
+    def run():
+        try:
+            lock = get_redis_connection("default").lock(
+                WARMUP_LOCK_KEY, timeout=WARMUP_LOCK_TIMEOUT
+            )
+            if not lock.acquire(blocking=False):
+                return
+            started = time.monotonic()
+            summary = CacheWarmupService().warm(
+                settings.CACHE_WARMUP_PAGES,
+                settings.REST_FRAMEWORK["PAGE_SIZE"],
+                settings.CACHE_WARMUP_TOP_STUDENTS,
+            )
+            logger.info(f"Cache warm-up finished in {time.monotonic() - started:.1f}s: {summary}")
+        except Exception:
+            logger.exception("Cache warm-up failed")
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=run, name="cache-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -1,13 +1,29 @@
 import logging
 
-from django.core.cache import cache
 from django.db import transaction
 
 from app.models import DocumentType
 from app.repositories import DocumentTypeRepository
+from app.utils.cache import (
+    DOCUMENT_TYPE_LIST,
+    document_type_key,
+    document_type_list_key,
+    document_type_tag,
+    get_many_tagged,
+    get_tagged,
+    invalidate_tags_on_commit,
+    set_many_tagged,
+    set_tagged,
+    tag_versions,
+)
 
 logger = logging.getLogger(__name__)
 
+DOCUMENT_TYPE_CACHE_TIMEOUT = 600  # 10 minutes
+
+# Process-local copy of the catalog: (DOCUMENT_TYPE_LIST version it was read under, {id: row}).
+_snapshot: tuple[int, dict[int, DocumentType]] | None = None
+
 
 class DocumentTypeService:
     def __init__(self, repository: DocumentTypeRepository = None):
@@ -16,36 +32,72 @@ class DocumentTypeService:
     @transaction.atomic
     def create(self, document_type_data: dict) -> DocumentType:
         doc_type = self.repository.create(document_type_data)
-        # Invalidate cache
-        cache.delete("document_types:all")
+        invalidate_tags_on_commit([DOCUMENT_TYPE_LIST])
         return doc_type
 
     def find_by_id(self, id: int) -> DocumentType | None:
-        cache_key = f"document_type:{id}"
-        cached = cache.get(cache_key)
+        cache_key = document_type_key(id)
+        cached, stamp = get_tagged(cache_key, [document_type_tag(id)])
         if cached:
-            logger.debug(f"Cache hit for document_type:{id}")
+            logger.debug(f"Cache hit for {cache_key}")
             return cached
-        
+
         doc_type = self.repository.find_by_id(id)
         if doc_type:
-            cache.set(cache_key, doc_type, timeout=600)  # 10 minutes
+            set_tagged(cache_key, doc_type, stamp, timeout=DOCUMENT_TYPE_CACHE_TIMEOUT)
         return doc_type
 
     def find_by_name(self, name: str) -> DocumentType | None:
         return self.repository.find_by_name(name)
 
+    def list_generation(self) -> int:
+        """Changes whenever the document type list changes; see app.utils.etag."""
+        return tag_versions([DOCUMENT_TYPE_LIST])[DOCUMENT_TYPE_LIST]
+
     def find_all(self) -> list[DocumentType]:
-        cache_key = "document_types:all"
-        cached = cache.get(cache_key)
-        if cached:
-            logger.debug("Cache hit for document_types:all")
+        cache_key = document_type_list_key()
+        cached, stamp = get_tagged(cache_key, [DOCUMENT_TYPE_LIST])
+        if cached is not None:
+            logger.debug(f"Cache hit for {cache_key}")
             return cached
-        
+
         doc_types = list(self.repository.find_all())
-        cache.set(cache_key, doc_types, timeout=600)  # 10 minutes
+        set_tagged(cache_key, doc_types, stamp, timeout=DOCUMENT_TYPE_CACHE_TIMEOUT)
         return doc_types
 
+    def cache_each(self, doc_types: list[DocumentType]):
+        """
+        Store each of `doc_types`, as returned by find_all, under its find_by_id key with
+        one set_many_tagged call (cache warm-up). Skipped once the list has been
+        invalidated: every change to a document type retires the list too, so while it is
+        still current the per-id stamps read here are not newer than the rows.
+        """
+        list_key = document_type_list_key()
+        found = get_many_tagged(
+            {
+                list_key: [DOCUMENT_TYPE_LIST],
+                **{document_type_key(d.id): [document_type_tag(d.id)] for d in doc_types},
+            }
+        )
+        if found[list_key][0] is None:
+            return
+        set_many_tagged(
+            {document_type_key(d.id): (d, found[document_type_key(d.id)][1]) for d in doc_types},
+            timeout=DOCUMENT_TYPE_CACHE_TIMEOUT,
+        )
+
+    def snapshot(self) -> dict[int, DocumentType]:
+        """
+        {id: document type} from a process-local copy of the catalog. Each call costs one
+        cache read (the list's tag version); the copy is reloaded only after the list is
+        invalidated, so embedding document types runs no queries while it is unchanged.
+        """
+        global _snapshot
+        generation = self.list_generation()
+        if _snapshot is None or _snapshot[0] != generation:
+            _snapshot = (generation, {doc_type.id: doc_type for doc_type in self.find_all()})
+        return _snapshot[1]
+
     def _update_entity_fields(self, entity, data: dict):
         for key, value in data.items():
             if hasattr(entity, key):
@@ -61,9 +113,7 @@ class DocumentTypeService:
 
         self._update_entity_fields(existing_document_type, document_type_data)
         updated = self.repository.update(existing_document_type)
-        # Invalidate cache
-        cache.delete(f"document_type:{id}")
-        cache.delete("document_types:all")
+        invalidate_tags_on_commit([document_type_tag(id), DOCUMENT_TYPE_LIST])
         return updated
 
     @transaction.atomic
@@ -72,7 +122,5 @@ class DocumentTypeService:
             logger.error(f"Document type with id {id} not found for deletion")
             raise ValueError(f"Document type with id {id} does not exist")
         result = self.repository.delete_by_id(id)
-        # Invalidate cache
-        cache.delete(f"document_type:{id}")
-        cache.delete("document_types:all")
+        invalidate_tags_on_commit([document_type_tag(id), DOCUMENT_TYPE_LIST])
         return result
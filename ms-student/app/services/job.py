@@ -0,0 +1,143 @@
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from app.models import Job
+from app.repositories import JobRepository
+
+logger = logging.getLogger(__name__)
+
+
+class JobHandler(ABC):
+    """
+    Runs one kind of job in chunks. `run_chunk` gets the job, whose `checkpoint` is the
+    one of the last committed chunk (None at the start), and returns (rows processed, next
+    checkpoint, done). The last checkpoint is kept, so `result` can report from it. Each
+    chunk commits together with the job's progress, so a chunk is either fully applied
+    and recorded or rolled back and run again by whichever worker resumes the job.
+    Slow reads such as remote calls go in `fetch_chunk`, which runs before the chunk's
+    transaction opens; its result is passed to `run_chunk`.
+    """
+
+    kind: str = ""
+
+    def prepare(self, params: dict):
+        """Business checks at enqueue time; raise ValueError to reject the job."""
+        return None
+
+    def count(self, params: dict) -> int | None:
+        """Rows the job will process, for progress; None when unknown."""
+        return None
+
+    def fetch_chunk(self, job: Job) -> Any:
+        """Data the next chunk needs, gathered outside its transaction."""
+        return None
+
+    @abstractmethod
+    def run_chunk(self, job: Job, fetched: Any) -> tuple[int, Any, bool]:
+        """Process the next chunk after `job.checkpoint`."""
+
+    def result(self, job: Job) -> dict:
+        return {"processed": job.processed}
+
+
+JOB_HANDLERS: dict[str, type[JobHandler]] = {}
+
+
+def register_job_handler(handler: type[JobHandler]) -> type[JobHandler]:
+    JOB_HANDLERS[handler.kind] = handler
+    return handler
+
+
+class LeaseLost(Exception):
+    """Another worker took the job over after this one's lease expired."""
+
+
+class JobService:
+    def __init__(
+        self,
+        repository: JobRepository = None,
+        handlers: dict[str, type[JobHandler]] | None = None,
+    ):
+        self.repository = repository or JobRepository()
+        self.handlers = JOB_HANDLERS if handlers is None else handlers
+
+    def _get_handler(self, kind: str) -> JobHandler:
+        handler = self.handlers.get(kind)
+        if handler is None:
+            raise ValueError(f"Unknown job kind {kind!r}")
+        return handler()
+
+    def find_by_id(self, id: int) -> Job | None:
+        return self.repository.find_by_id(id)
+
+    def find_pending(self, kind: str) -> Job | None:
+        """A queued or running job of `kind`, if any."""
+        return self.repository.find_pending(kind)
+
+    def enqueue(self, kind: str, params: dict) -> Job:
+        handler = self._get_handler(kind)
+        handler.prepare(params)
+        job = self.repository.create(kind, params, total=handler.count(params))
+        logger.info(f"Queued job {job.id} ({kind}) for {job.total} rows")
+        return job
+
+    def run_next(self, worker: str, should_stop: Callable[[], bool] = lambda: False) -> Job | None:
+        """Claim the next job and run it until it finishes or `should_stop()` is true."""
+        self.repository.fail_abandoned(settings.JOB_MAX_ATTEMPTS)
+        lease = timedelta(seconds=settings.JOB_LEASE_SECONDS)
+        job = self.repository.claim_next(worker, lease, settings.JOB_MAX_ATTEMPTS)
+        if job is not None:
+            self.run(job, lease, should_stop)
+        return job
+
+    def run(self, job: Job, lease: timedelta, should_stop: Callable[[], bool]):
+        try:
+            handler = self._get_handler(job.kind)
+            while not should_stop():
+                fetched = handler.fetch_chunk(job)
+                with transaction.atomic():
+                    processed, checkpoint, done = handler.run_chunk(job, fetched)
+                    if not self.repository.save_progress(
+                        job, lease, processed=job.processed + processed, checkpoint=checkpoint
+                    ):
+                        raise LeaseLost
+                if done:
+                    self.repository.save_progress(
+                        job,
+                        lease,
+                        status=Job.SUCCEEDED,
+                        result=handler.result(job),
+                        finished_at=timezone.now(),
+                        lease_expires_at=None,
+                    )
+                    logger.info(f"Job {job.id} ({job.kind}) succeeded: {job.processed} processed")
+                    return
+            # Stopped between chunks: hand the job back without spending an attempt.
+            self.repository.save_progress(
+                job,
+                lease,
+                status=Job.QUEUED,
+                worker="",
+                attempts=job.attempts - 1,
+                lease_expires_at=None,
+            )
+            logger.info(f"Job {job.id} ({job.kind}) requeued at {job.processed} processed")
+        except LeaseLost:
+            logger.warning(f"Job {job.id} ({job.kind}) was taken over by another worker")
+        except Exception as e:
+            logger.exception(f"Job {job.id} ({job.kind}) failed")
+            self.repository.save_progress(
+                job,
+                lease,
+                status=Job.FAILED,
+                error=f"{type(e).__name__}: {e}",
+                finished_at=timezone.now(),
+                lease_expires_at=None,
+            )
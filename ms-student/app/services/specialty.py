@@ -0,0 +1,60 @@
+import logging
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from app.utils.academic_client import AcademicServiceClient, academic_service_client
+from app.utils.cache import specialty_key
+
+logger = logging.getLogger(__name__)
+
+SPECIALTY_CACHE_TIMEOUT = 600  # 10 minutes
+# Unknown or unreachable specialties are remembered briefly, so an academic service outage
+# costs one round of requests per specialty and minute instead of one per page.
+SPECIALTY_MISS_CACHE_TIMEOUT = 60
+# Cached in place of a specialty that could not be fetched (None reads as a cache miss).
+NOT_FOUND = False
+
+
+class SpecialtyService:
+    """
+    Read-only access to specialties, which live in the academic service. Entries are
+    cached with a TTL only: the academic service does not tell us when one changes.
+    """
+
+    def __init__(self, academic_client: AcademicServiceClient = None):
+        self.academic_client = academic_client or academic_service_client
+
+    def find_by_ids(self, ids: Iterable[int]) -> dict[int, dict | None]:
+        """
+        {id: specialty} for the distinct `ids`: one cache get_many, then the misses
+        fetched concurrently. Unknown or unreachable specialties map to None and are
+        cached for SPECIALTY_MISS_CACHE_TIMEOUT only.
+        """
+        keys = {id: specialty_key(id) for id in sorted(set(ids))}
+        cached = cache.get_many(list(keys.values()))
+        specialties = {id: cached.get(key) for id, key in keys.items()}
+
+        missing = [id for id, specialty in specialties.items() if specialty is None]
+        if missing:
+            fetched = self.academic_client.get_specialties(
+                missing, settings.SPECIALTY_FETCH_CONCURRENCY
+            )
+            found = {id: specialty for id, specialty in fetched.items() if specialty is not None}
+            if found:
+                cache.set_many(
+                    {keys[id]: specialty for id, specialty in found.items()},
+                    timeout=SPECIALTY_CACHE_TIMEOUT,
+                )
+            if len(found) < len(missing):
+                cache.set_many(
+                    {keys[id]: NOT_FOUND for id in missing if id not in found},
+                    timeout=SPECIALTY_MISS_CACHE_TIMEOUT,
+                )
+            specialties.update(fetched)
+            logger.debug(f"Fetched {len(missing)} specialties, {len(found)} found")
+        return {
+            id: None if specialty is NOT_FOUND else specialty
+            for id, specialty in specialties.items()
+        }
@@ -1,25 +1,75 @@
+import base64
 import logging
+from collections.abc import Iterable
+from copy import copy
+from datetime import datetime, timedelta
+from itertools import batched
 
-from django.core.cache import cache
+from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
 
 from app.models import Student
 from app.repositories import DocumentTypeRepository, StudentRepository
+from app.services.outbox import STUDENT_PAYLOAD_FIELDS, OutboxService
 from app.utils.academic_client import AcademicServiceClient, academic_service_client
+from app.utils.cache import (
+    STUDENT_ENTRIES,
+    STUDENT_LIST,
+    document_number_tag,
+    exists_key,
+    get_many_tagged,
+    get_tagged,
+    invalidate_tags_on_commit,
+    refresh_on_commit,
+    set_many_tagged,
+    set_tagged,
+    specialty_tag,
+    student_entry_tags,
+    student_key,
+    student_number_key,
+    student_number_tag,
+    student_page_key,
+    student_tag,
+    student_tags,
+    students_by_specialty_key,
+    tag_versions,
+)
+from app.utils.etag import ConcurrentUpdateError, PreconditionFailed, check_if_match, entity_etag
+from app.utils.hot_keys import HotKeyTracker, student_reads
 
 logger = logging.getLogger(__name__)
 
+STUDENT_CACHE_TIMEOUT = 300  # 5 minutes
+
+# Optimistic update attempts before giving up with ConcurrentUpdateError.
+UPDATE_ATTEMPTS = 3
+
+# Ids per UPDATE (and per outbox INSERT) in bulk_update.
+BULK_BATCH_SIZE = 1000
+
+# Fields exists() accepts, with the tag that a change to that value invalidates.
+EXISTS_TAGS = {
+    "id": student_tag,
+    "student_number": student_number_tag,
+    "document_number": document_number_tag,
+}
+
 
 class StudentService:
     def __init__(
         self,
         student_repository: StudentRepository = None,
         document_type_repository: DocumentTypeRepository = None,
-        academic_client: AcademicServiceClient = None
+        academic_client: AcademicServiceClient = None,
+        outbox_service: OutboxService = None,
+        read_tracker: HotKeyTracker = None,
     ):
         self.student_repository = student_repository or StudentRepository()
         self.document_type_repository = document_type_repository or DocumentTypeRepository()
         self.academic_client = academic_client or academic_service_client
+        self.outbox_service = outbox_service or OutboxService()
+        self.read_tracker = read_tracker or student_reads
 
     def _validate_unique_student_number(self, student_number: int, exclude_id: int = None):
         existing = self.student_repository.find_by_student_number(student_number)
@@ -48,6 +98,21 @@ class StudentService:
                 setattr(entity, key, value)
         return entity
 
+    def _invalidate_cached(self, student: Student, *previous: Student):
+        """Invalidate every cache tag `student` (and its previous state) is registered under."""
+        tags = student_tags(student, *previous)
+        if settings.CACHE_WRITE_THROUGH:
+            refresh_on_commit(
+                student_key(student.id),
+                student,
+                student_entry_tags(student.id),
+                STUDENT_CACHE_TIMEOUT,
+                invalidate=tags,
+                version=lambda cached: cached.version,
+            )
+        else:
+            invalidate_tags_on_commit(tags)
+
     @transaction.atomic
     def create(self, student_data: dict) -> Student:
         self._validate_unique_student_number(student_data.get("student_number"))
@@ -59,48 +124,207 @@ class StudentService:
         
         self._validate_document_type_exists(student_data.get("document_type_id"))
         student = self.student_repository.create(student_data)
-        # Invalidate cache
-        cache.delete("students:all")
+        self.outbox_service.record_student_created(student)
+        self._invalidate_cached(student)
         return student
 
     def find_by_id(self, id: int) -> Student | None:
-        cache_key = f"student:{id}"
-        cached = cache.get(cache_key)
+        self.read_tracker.record(id)
+        cache_key = student_key(id)
+        cached, stamp = get_tagged(cache_key, student_entry_tags(id))
         if cached:
-            logger.debug(f"Cache hit for student:{id}")
+            logger.debug(f"Cache hit for {cache_key}")
             return cached
-        
+
         student = self.student_repository.find_by_id(id)
         if student:
-            cache.set(cache_key, student, timeout=300)  # 5 minutes
+            set_tagged(cache_key, student, stamp, timeout=STUDENT_CACHE_TIMEOUT)
         return student
 
+    def find_by_ids(self, ids: Iterable[int]) -> dict[int, Student]:
+        """Students by id, read from the cache in one batch; ids that do not exist are left out."""
+        ids = list(dict.fromkeys(ids))
+        found = get_many_tagged({student_key(id): student_entry_tags(id) for id in ids})
+        students, stamps = {}, {}
+        for id in ids:
+            cached, stamp = found[student_key(id)]
+            if cached:
+                students[id] = cached
+            else:
+                stamps[id] = stamp
+
+        if stamps:
+            loaded = self.student_repository.find_by_ids(list(stamps))
+            set_many_tagged(
+                {student_key(student.id): (student, stamps[student.id]) for student in loaded},
+                timeout=STUDENT_CACHE_TIMEOUT,
+            )
+            students.update((student.id, student) for student in loaded)
+        return {id: students[id] for id in ids if id in students}
+
+    def find_by_student_numbers(self, student_numbers: Iterable[int]) -> dict[int, Student]:
+        """
+        Students by student number, through find_by_ids. Numbers resolve to ids from
+        cached student_number:{n} entries; the rest with one query that only reads ids,
+        so the rows themselves are cached under their student_key like any other read.
+        """
+        student_numbers = list(dict.fromkeys(student_numbers))
+        found = get_many_tagged(
+            {student_number_key(n): [student_number_tag(n)] for n in student_numbers}
+        )
+        ids, stamps = {}, {}
+        for number in student_numbers:
+            cached, stamp = found[student_number_key(number)]
+            if cached is not None:
+                ids[number] = cached
+            else:
+                stamps[number] = stamp
+
+        if stamps:
+            loaded = self.student_repository.find_ids_by_student_numbers(list(stamps))
+            set_many_tagged(
+                {student_number_key(n): (id, stamps[n]) for n, id in loaded.items()},
+                timeout=STUDENT_CACHE_TIMEOUT,
+            )
+            ids.update(loaded)
+        students = self.find_by_ids(ids.values())
+        return {
+            number: students[ids[number]]
+            for number in student_numbers
+            if number in ids and ids[number] in students
+        }
+
+    def exists(self, field: str, values: Iterable) -> dict:
+        """
+        {value: bool} for active students by `field` (a key of EXISTS_TAGS). Answers are
+        cached, negative ones included; creating, updating or deleting a student
+        invalidates the tags of its values, so a cached False never hides a new student.
+        """
+        values = list(dict.fromkeys(values))
+        tag = EXISTS_TAGS[field]
+        found = get_many_tagged({exists_key(field, value): [tag(value)] for value in values})
+        results, stamps = {}, {}
+        for value in values:
+            cached, stamp = found[exists_key(field, value)]
+            if cached is not None:
+                results[value] = cached
+            else:
+                stamps[value] = stamp
+
+        if stamps:
+            existing = self._find_existing(field, list(stamps))
+            checked = {value: value in existing for value in stamps}
+            set_many_tagged(
+                {
+                    exists_key(field, value): (checked[value], stamp)
+                    for value, stamp in stamps.items()
+                },
+                timeout=STUDENT_CACHE_TIMEOUT,
+            )
+            results.update(checked)
+        return {value: results[value] for value in values}
+
+    def _find_existing(self, field: str, values: list) -> set:
+        if len(values) == 1:
+            exists_by = getattr(self.student_repository, f"exists_by_{field}")
+            return set(values) if exists_by(values[0]) else set()
+        return self.student_repository.find_existing(field, values)
+
     def find_by_student_number(self, student_number: int) -> Student | None:
         return self.student_repository.find_by_student_number(student_number)
 
-    def find_all(self) -> list[Student]:
+    def find_all(self):
+        return self.student_repository.find_all()
+
+    def list_generation(self) -> int:
+        """Changes whenever any student list changes; see app.utils.etag."""
+        return tag_versions([STUDENT_LIST])[STUDENT_LIST]
 
-        cache_key = "students:all"
-        cached = cache.get(cache_key)
+    def find_page(self, page: int, page_size: int) -> tuple[list[Student], int]:
+        cache_key = student_page_key(page, page_size)
+        cached, stamp = get_tagged(cache_key, [STUDENT_LIST])
         if cached:
-            logger.debug("Cache hit for students:all")
+            logger.debug(f"Cache hit for {cache_key}")
             return cached
-        
-        students = list(self.student_repository.find_all())
-        cache.set(cache_key, students, timeout=600)  # 10 minutes
-        return students
 
-    def find_by_specialty(self, specialty_id: int):
+        queryset = self.student_repository.find_all()
+        count = queryset.count()
+        students = list(queryset[(page - 1) * page_size : page * page_size]) if count else []
+        set_tagged(cache_key, (students, count), stamp, timeout=600)  # 10 minutes
+        return students, count
+
+    @staticmethod
+    def _encode_cursor(student: Student) -> str:
+        raw = f"{student.updated_at.isoformat()}|{student.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            updated_at, id = raw.rsplit("|", 1)
+            return datetime.fromisoformat(updated_at), int(id)
+        except ValueError as e:
+            raise ValueError("Invalid change feed cursor") from e
+
+    def find_changes(self, cursor: str | None, limit: int) -> tuple[list[Student], str | None]:
+        """
+        Students created, updated or soft-deleted after `cursor`, oldest first. Rows newer
+        than CHANGE_FEED_SETTLE_SECONDS are held back so a transaction that commits late
+        with an earlier updated_at cannot slip behind a cursor already handed out.
+        """
+        updated_at, id = self._decode_cursor(cursor) if cursor else (None, 0)
+        until = timezone.now() - timedelta(seconds=settings.CHANGE_FEED_SETTLE_SECONDS)
+        students = self.student_repository.find_changed_since(updated_at, id, until, limit)
+        next_cursor = self._encode_cursor(students[-1]) if students else cursor
+        return students, next_cursor
+
+    def find_by_specialty(self, specialty_id: int) -> list[Student]:
         self._validate_specialty_exists(specialty_id)
-        return self.student_repository.find_by_specialty(specialty_id)
+        cache_key = students_by_specialty_key(specialty_id)
+        cached, stamp = get_tagged(cache_key, [specialty_tag(specialty_id), STUDENT_ENTRIES])
+        if cached is not None:
+            logger.debug(f"Cache hit for {cache_key}")
+            return cached
+
+        students = list(self.student_repository.find_by_specialty(specialty_id))
+        set_tagged(cache_key, students, stamp, timeout=600)  # 10 minutes
+        return students
 
     @transaction.atomic
-    def update(self, id: int, student_data: dict) -> Student:
-        existing_student = self.student_repository.find_by_id(id)
-        if not existing_student:
-            logger.error(f"Student with id {id} not found for update")
-            raise ValueError(f"Student with id {id} does not exist")
+    def update(self, id: int, student_data: dict, if_match: list[str] | None = None) -> Student:
+        """
+        Optimistic: the row is only written if it is still at the version read here
+        (StudentRepository.update). With `if_match` (parsed If-Match ETags), a client
+        writing from a stale read gets PreconditionFailed; without it, a concurrent write
+        makes the update re-read and re-apply, up to UPDATE_ATTEMPTS times.
+        """
+        for _ in range(UPDATE_ATTEMPTS):
+            existing_student = self.student_repository.find_by_id(id)
+            if not existing_student:
+                logger.error(f"Student with id {id} not found for update")
+                raise ValueError(f"Student with id {id} does not exist")
+            check_if_match(if_match, entity_etag(existing_student))
+            self._validate_changes(existing_student, student_data)
 
+            previous = copy(existing_student)
+            self._update_entity_fields(existing_student, student_data)
+            fields = [key for key in student_data if hasattr(existing_student, key)]
+            updated = self.student_repository.update(existing_student, fields)
+            if updated is not None:
+                break
+            if if_match is not None:
+                raise PreconditionFailed(f"Student with id {id} was modified since it was read")
+            logger.info(f"Student {id} changed concurrently, retrying update")
+        else:
+            raise ConcurrentUpdateError(f"Student with id {id} is being modified concurrently")
+
+        self.outbox_service.record_student_updated(updated)
+        self._invalidate_cached(updated, previous)
+        return updated
+
+    def _validate_changes(self, existing_student: Student, student_data: dict):
+        id = existing_student.id
         student_number = student_data.get("student_number")
         if student_number and student_number != existing_student.student_number:
             self._validate_unique_student_number(student_number, exclude_id=id)
@@ -117,20 +341,91 @@ class StudentService:
         if specialty_id and specialty_id != existing_student.specialty_id:
             self._validate_specialty_exists(specialty_id)
 
-        self._update_entity_fields(existing_student, student_data)
-        updated = self.student_repository.update(existing_student)
-        # Invalidate cache
-        cache.delete(f"student:{id}")
-        cache.delete("students:all")
+    def find_ids(
+        self,
+        ids: list[int] | None = None,
+        filters: dict | None = None,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> list[int]:
+        return self.student_repository.find_ids(ids, after_id, limit, **(filters or {}))
+
+    def count(self, ids: list[int] | None = None, filters: dict | None = None) -> int:
+        return self.student_repository.count(ids, **(filters or {}))
+
+    def count_specialties(self) -> int:
+        return self.student_repository.count_specialties()
+
+    def count_by_specialty(self, after_specialty_id: int, limit: int) -> dict[int, int]:
+        return self.student_repository.count_by_specialty(after_specialty_id, limit)
+
+    def validate_bulk_changes(self, changes: dict):
+        if "specialty_id" in changes:
+            self._validate_specialty_exists(changes["specialty_id"])
+        if "document_type_id" in changes:
+            self._validate_document_type_exists(changes["document_type_id"])
+
+    def bulk_update(
+        self,
+        changes: dict,
+        ids: list[int] | None = None,
+        filters: dict | None = None,
+        validate: bool = True,
+    ) -> int:
+        """
+        Apply the same `changes` to many students, e.g. moving a cohort to a merged
+        specialty. The new values are validated once (one academic service call), rows are
+        written with one set-based UPDATE per BULK_BATCH_SIZE ids (each bumping version),
+        and every cached student entry and list is retired with one tag bump per batch on
+        commit. Each batch commits on its own, with its outbox events, so no commit lands
+        long after the updated_at it stamps (the change feed waits only
+        CHANGE_FEED_SETTLE_SECONDS for late commits); a failure leaves earlier batches
+        applied. Background jobs validate at enqueue time and pass `validate=False` per chunk.
+        """
+        if validate:
+            self.validate_bulk_changes(changes)
+
+        target_ids = self.student_repository.find_ids(ids, **(filters or {}))
+        if len(target_ids) > settings.STUDENT_BULK_MAX_ROWS:
+            raise ValueError(
+                f"Bulk update matches {len(target_ids)} students, "
+                f"more than the {settings.STUDENT_BULK_MAX_ROWS} allowed"
+            )
+
+        updated = 0
+        for batch in batched(target_ids, BULK_BATCH_SIZE, strict=False):
+            batch = list(batch)
+            with transaction.atomic():
+                batch_updated = self.student_repository.update_many(batch, changes)
+                self.outbox_service.record_students_updated(
+                    self.student_repository.find_values(batch, STUDENT_PAYLOAD_FIELDS)
+                )
+                if batch_updated:
+                    invalidate_tags_on_commit([STUDENT_LIST, STUDENT_ENTRIES])
+            updated += batch_updated
+        logger.info(f"Bulk update of {updated} students: {changes}")
         return updated
 
+    @transaction.atomic
+    def delete_many(self, ids: list[int]) -> int:
+        """Soft-delete the active students among `ids` with one UPDATE and one outbox INSERT."""
+        students = self.student_repository.find_by_ids(ids)
+        if not students:
+            return 0
+        deleted_ids = [student.id for student in students]
+        deleted = self.student_repository.delete_many(deleted_ids)
+        self.outbox_service.record_students_deleted(deleted_ids)
+        invalidate_tags_on_commit(student_tags(*students))
+        return deleted
+
     @transaction.atomic
     def delete_by_id(self, id: int) -> bool:
-        if not self.student_repository.exists_by_id(id):
+        student = self.student_repository.find_by_id(id)
+        if not student:
             logger.error(f"Student with id {id} not found for deletion")
             raise ValueError(f"Student with id {id} does not exist")
         result = self.student_repository.delete_by_id(id)
-        # Invalidate cache
-        cache.delete(f"student:{id}")
-        cache.delete("students:all")
+        if result:
+            self.outbox_service.record_student_deleted(id)
+        invalidate_tags_on_commit(student_tags(student))
         return result
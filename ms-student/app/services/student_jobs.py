@@ -0,0 +1,128 @@
+from abc import abstractmethod
+from typing import Any
+
+from django.conf import settings
+
+from app.models import Job
+from app.repositories import OrphanedSpecialtyRepository
+from app.services.job import JobHandler, register_job_handler
+from app.services.student import StudentService
+from app.utils.academic_client import AcademicServiceClient, academic_service_client
+
+
+class StudentSelectionJob(JobHandler):
+    """
+    Works through a selection of students ({"ids": [...]} or {"filter": {...}}) by id
+    keyset, JOB_CHUNK_SIZE students per chunk; the checkpoint is the last id handled.
+    Students created or changed to match the filter while the job runs are included if
+    their id is past the checkpoint.
+    """
+
+    def __init__(self, student_service: StudentService = None):
+        self.student_service = student_service or StudentService()
+
+    def count(self, params: dict) -> int:
+        return self.student_service.count(params.get("ids"), params.get("filter"))
+
+    def run_chunk(self, job: Job, fetched: Any) -> tuple[int, Any, bool]:
+        params = job.params
+        ids = self.student_service.find_ids(
+            params.get("ids"),
+            params.get("filter"),
+            after_id=job.checkpoint or 0,
+            limit=settings.JOB_CHUNK_SIZE,
+        )
+        if not ids:
+            return 0, job.checkpoint, True
+        processed = self.apply(params, ids)
+        return processed, ids[-1], len(ids) < settings.JOB_CHUNK_SIZE
+
+    @abstractmethod
+    def apply(self, params: dict, ids: list[int]) -> int:
+        """Apply the job to the students `ids`; returns how many were changed."""
+
+
+@register_job_handler
+class BulkUpdateStudentsJob(StudentSelectionJob):
+    """PATCH /students/bulk/ for selections larger than STUDENT_BULK_MAX_ROWS."""
+
+    kind = "students.bulk_update"
+
+    def prepare(self, params: dict):
+        self.student_service.validate_bulk_changes(params["changes"])
+
+    def apply(self, params: dict, ids: list[int]) -> int:
+        return self.student_service.bulk_update(params["changes"], ids=ids, validate=False)
+
+
+@register_job_handler
+class DeleteStudentsJob(StudentSelectionJob):
+    kind = "students.delete"
+
+    def apply(self, params: dict, ids: list[int]) -> int:
+        return self.student_service.delete_many(ids)
+
+
+@register_job_handler
+class ReconcileSpecialtiesJob(JobHandler):
+    """
+    Finds the specialty_ids of active students that the academic service no longer
+    knows. Students are grouped by specialty in the database, so the service gets one
+    call per distinct specialty (RECONCILE_CONCURRENCY in flight), RECONCILE_CHUNK_SIZE
+    specialties per chunk, checked before the chunk's transaction opens. Orphans are stored
+    as OrphanedSpecialty rows of the job; ids that could not be checked are carried in the
+    checkpoint and reported as unverified.
+    """
+
+    kind = "students.reconcile_specialties"
+
+    def __init__(
+        self,
+        student_service: StudentService = None,
+        academic_client: AcademicServiceClient = None,
+        orphan_repository: OrphanedSpecialtyRepository = None,
+    ):
+        self.student_service = student_service or StudentService()
+        self.academic_client = academic_client or academic_service_client
+        self.orphan_repository = orphan_repository or OrphanedSpecialtyRepository()
+
+    def count(self, params: dict) -> int:
+        return self.student_service.count_specialties()
+
+    def fetch_chunk(self, job: Job) -> tuple[dict[int, int], dict[int, bool | None]]:
+        # The academic calls (with their retries and backoff) run before the chunk's
+        # transaction opens, so they never hold it or the job's lease row.
+        after = (job.checkpoint or {"after": 0})["after"]
+        students = self.student_service.count_by_specialty(after, settings.RECONCILE_CHUNK_SIZE)
+        if not students:
+            return students, {}
+        return students, self.academic_client.check_specialties(
+            students, settings.RECONCILE_CONCURRENCY
+        )
+
+    def run_chunk(self, job: Job, fetched: Any) -> tuple[int, Any, bool]:
+        checkpoint = job.checkpoint or {"after": 0, "unverified": []}
+        students, found = fetched
+        if not students:
+            return 0, checkpoint, True
+        self.orphan_repository.create_many(
+            job.id, {id: students[id] for id, exists in found.items() if exists is False}
+        )
+        checkpoint = {
+            "after": max(students),
+            "unverified": checkpoint["unverified"]
+            + sorted(id for id, exists in found.items() if exists is None),
+        }
+        return len(students), checkpoint, len(students) < settings.RECONCILE_CHUNK_SIZE
+
+    def result(self, job: Job) -> dict:
+        orphans = self.orphan_repository.find_by_job(job.id)
+        return {
+            "specialties": job.processed,
+            "orphans": [
+                {"specialty_id": orphan.specialty_id, "students": orphan.student_count}
+                for orphan in orphans
+            ],
+            "orphaned_students": sum(orphan.student_count for orphan in orphans),
+            "unverified": (job.checkpoint or {}).get("unverified", []),
+        }
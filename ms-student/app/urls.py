@@ -1,11 +1,12 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import DocumentTypeViewSet, StudentViewSet, health_check
+from .views import DocumentTypeViewSet, JobViewSet, StudentViewSet, health_check
 
 router = DefaultRouter()
 router.register(r"students", StudentViewSet, basename="student")
 router.register(r"document-types", DocumentTypeViewSet, basename="document-type")
+router.register(r"jobs", JobViewSet, basename="job")
 
 urlpatterns = [
     path("health/", health_check, name="health-check"),
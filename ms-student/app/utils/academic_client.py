@@ -1,11 +1,59 @@
 import logging
+import math
 import os
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from contextvars import copy_context
 
 import requests
+from django.conf import settings
 from pybreaker import CircuitBreaker
 
+from app.utils.deadline import DeadlineExceeded, call_timeout, remaining
+from app.utils.server_timing import timed
+
 logger = logging.getLogger(__name__)
 
+# Answers worth another attempt: the service, or the proxy in front of it, is overloaded
+# or restarting.
+RETRY_STATUSES = {502, 503, 504}
+TRANSIENT_ERRORS = (requests.Timeout, requests.ConnectionError)
+
+
+class LatencyTracker:
+    """Latencies of the last `size` answered calls, for the hedging delay."""
+
+    MIN_SAMPLES = 20
+
+    def __init__(self, size: int = 200):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, p: float) -> float | None:
+        """None until MIN_SAMPLES calls were seen."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if len(samples) < self.MIN_SAMPLES:
+            return None
+        return samples[max(math.ceil(p / 100 * len(samples)) - 1, 0)]
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+
+def _in_context(fn: Callable) -> Callable:
+    """`fn` bound to a copy of the caller's context (deadline, Server-Timing) for a thread."""
+    return lambda *args: copy_context().run(fn, *args)
+
 
 class AcademicServiceClient:
 
@@ -17,8 +65,84 @@ class AcademicServiceClient:
         fail_max=5,  # Open circuit after 5 failures
         reset_timeout=60,  # Try to recover after 60 seconds
         listeners=[],  # Add listeners for monitoring if needed
+        # Running out of the caller's own deadline says nothing about the service.
+        exclude=[DeadlineExceeded],
         name="academic_service_breaker"
     )
+    latencies = LatencyTracker()
+
+    def _fetch(self, url: str) -> requests.Response:
+        """One GET, its timeout capped to the request's remaining deadline."""
+        timeout = call_timeout(self.TIMEOUT)
+        # Propagate the deadline so the service can give up when we would.
+        headers = {"X-Request-Timeout": f"{timeout:.3f}"} if remaining() is not None else {}
+        started = time.monotonic()
+        with timed("academic"):
+            response = requests.get(url, timeout=timeout, headers=headers)
+        if response.status_code not in RETRY_STATUSES:
+            self.latencies.add(time.monotonic() - started)
+        return response
+
+    def _hedged_fetch(self, url: str, delay: float) -> requests.Response:
+        """
+        _fetch, plus a second identical GET if the first has not answered after `delay`;
+        the first answer wins. Only used for idempotent reads.
+        """
+        pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="academic-hedge")
+        try:
+            futures = [pool.submit(_in_context(self._fetch), url)]
+            if not wait(futures, timeout=delay).done:
+                futures.append(pool.submit(_in_context(self._fetch), url))
+            error = None
+            for future in as_completed(futures):
+                try:
+                    return future.result()
+                except Exception as e:
+                    error = e
+            raise error
+        finally:
+            # The losing request finishes in the background.
+            pool.shutdown(wait=False)
+
+    def _send(self, url: str) -> requests.Response:
+        percentile = settings.ACADEMIC_SERVICE_HEDGE_PERCENTILE
+        delay = self.latencies.percentile(percentile) if percentile else None
+        if delay is None:
+            return self._fetch(url)
+        return self._hedged_fetch(url, delay)
+
+    def _get(self, url: str) -> requests.Response:
+        """
+        GET with bounded retries: connection errors, timeouts and 502/503/504 are retried
+        up to ACADEMIC_SERVICE_RETRIES times after a full-jitter exponential backoff, and
+        neither an attempt nor a sleep starts if the request's deadline would pass first.
+        """
+        attempt = 0
+        while True:
+            error = None
+            try:
+                response = self._send(url)
+                if response.status_code not in RETRY_STATUSES:
+                    return response
+            except TRANSIENT_ERRORS as e:
+                error = e
+            backoff = random.uniform(
+                0,
+                min(
+                    settings.ACADEMIC_SERVICE_BACKOFF_MAX,
+                    settings.ACADEMIC_SERVICE_BACKOFF * 2**attempt,
+                ),
+            )
+            left = remaining()
+            out_of_time = left is not None and backoff >= left
+            if attempt >= settings.ACADEMIC_SERVICE_RETRIES or out_of_time:
+                if error is not None:
+                    raise error
+                return response
+            attempt += 1
+            reason = repr(error) if error is not None else f"status {response.status_code}"
+            logger.warning(f"Retrying {url} in {backoff:.3f}s (attempt {attempt + 1}): {reason}")
+            time.sleep(backoff)
 
     def validate_specialty(self, specialty_id: int) -> bool:
         try:
@@ -27,10 +151,30 @@ class AcademicServiceClient:
             logger.error(f"Circuit breaker open or error validating specialty {specialty_id}: {str(e)}")
             raise
 
+    def check_specialties(
+        self, specialty_ids: Iterable[int], max_workers: int
+    ) -> dict[int, bool | None]:
+        """
+        validate_specialty for many ids with at most `max_workers` requests in flight.
+        None marks the ids that could not be checked (timeout, error or open breaker).
+        """
+
+        def check(specialty_id: int) -> bool | None:
+            try:
+                return self.validate_specialty(specialty_id)
+            except Exception:
+                return None
+
+        specialty_ids = list(specialty_ids)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="academic") as pool:
+            return dict(
+                zip(specialty_ids, pool.map(_in_context(check), specialty_ids), strict=True)
+            )
+
     def _call_validate_specialty(self, specialty_id: int) -> bool:
         try:
             url = f"{self.BASE_URL}/especialidades/{specialty_id}"
-            response = requests.get(url, timeout=self.TIMEOUT)
+            response = self._get(url)
 
             if response.status_code == 200:
                 return True
@@ -50,10 +194,28 @@ class AcademicServiceClient:
             logger.error(f"Circuit breaker open or error fetching specialty {specialty_id}: {str(e)}")
             return None
 
+    def get_specialties(
+        self, specialty_ids: Iterable[int], max_workers: int
+    ) -> dict[int, dict | None]:
+        """get_specialty for many ids with at most `max_workers` requests in flight."""
+        specialty_ids = list(specialty_ids)
+        if not specialty_ids:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(specialty_ids)), thread_name_prefix="academic"
+        ) as pool:
+            return dict(
+                zip(
+                    specialty_ids,
+                    pool.map(_in_context(self.get_specialty), specialty_ids),
+                    strict=True,
+                )
+            )
+
     def _call_get_specialty(self, specialty_id: int) -> dict | None:
         try:
             url = f"{self.BASE_URL}/especialidades/{specialty_id}"
-            response = requests.get(url, timeout=self.TIMEOUT)
+            response = self._get(url)
 
             if response.status_code == 200:
                 return response.json()
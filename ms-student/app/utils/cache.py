@@ -0,0 +1,261 @@
+import secrets
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from itertools import batched
+from typing import Any
+
+from django.core.cache import cache
+from django.db import transaction
+from django.dispatch import Signal
+from django_redis import get_redis_connection
+from redis.exceptions import WatchError
+
+from app.utils.cache_backend import REDIS_UNAVAILABLE
+from app.utils.server_timing import timed
+
+# Tag versions outlive every entry stamped with them. When one expires (or is evicted)
+# it comes back with a fresh random value, so it never matches a stamp still cached.
+TAG_TIMEOUT = 60 * 60 * 24
+
+# Keys per get_many/set_many call; django-redis sends each call as one round trip.
+BATCH_SIZE = 500
+
+# Sent with `tags` after they are invalidated. The tags double as HTTP surrogate keys
+# (app.utils.http_cache), so receivers can purge edge caches.
+tags_invalidated = Signal()
+
+STUDENT_LIST = "list:students"
+# Every cached student entry (by id, by specialty) is also registered under this tag,
+# so a bulk write retires all of them with one version bump.
+STUDENT_ENTRIES = "all:students"
+DOCUMENT_TYPE_LIST = "list:document_types"
+
+
+def student_key(id: int) -> str:
+    return f"student:{id}"
+
+
+def student_page_key(page: int, page_size: int) -> str:
+    return f"students:page:{page}:{page_size}"
+
+
+def students_by_specialty_key(specialty_id: int) -> str:
+    return f"students:specialty:{specialty_id}"
+
+
+def student_number_key(student_number: int) -> str:
+    return f"student_number:{student_number}"
+
+
+def exists_key(field: str, value) -> str:
+    return f"exists:{field}:{value}"
+
+
+def specialty_key(id: int) -> str:
+    return f"specialty:{id}"
+
+
+def document_type_key(id: int) -> str:
+    return f"document_type:{id}"
+
+
+def document_type_list_key() -> str:
+    return "document_types:all"
+
+
+def student_tag(id: int) -> str:
+    return f"student:{id}"
+
+
+def student_entry_tags(id: int) -> list[str]:
+    """Tags of the cached student_key(id) entry."""
+    return [student_tag(id), STUDENT_ENTRIES]
+
+
+def student_number_tag(student_number: int) -> str:
+    return f"student_number:{student_number}"
+
+
+def document_number_tag(document_number: str) -> str:
+    return f"document_number:{document_number}"
+
+
+def specialty_tag(specialty_id: int) -> str:
+    return f"specialty:{specialty_id}"
+
+
+def document_type_tag(id: int) -> str:
+    return f"document_type:{id}"
+
+
+def tag_version_key(tag: str) -> str:
+    return f"tag:{tag}"
+
+
+def student_tags(*students) -> list[str]:
+    """Every tag a change to `students` (e.g. before and after an update) invalidates."""
+    tags = {STUDENT_LIST}
+    for student in students:
+        tags.add(student_tag(student.id))
+        tags.add(student_number_tag(student.student_number))
+        tags.add(document_number_tag(student.document_number))
+        if student.specialty_id:
+            tags.add(specialty_tag(student.specialty_id))
+    return sorted(tags)
+
+
+def _new_version() -> int:
+    return secrets.randbits(62)
+
+
+def _get_many(keys: Iterable[str]) -> dict:
+    found = {}
+    for batch in batched(keys, BATCH_SIZE, strict=False):
+        found.update(cache.get_many(list(batch)))
+    return found
+
+
+def _set_many(data: Mapping[str, Any], timeout: int):
+    for batch in batched(data.items(), BATCH_SIZE, strict=False):
+        cache.set_many(dict(batch), timeout=timeout)
+
+
+def _tag_versions(tags: Iterable[str], found: Mapping[str, Any]) -> dict[str, int]:
+    versions = {tag: found.get(tag_version_key(tag)) for tag in tags}
+    missing = {tag: _new_version() for tag, version in versions.items() if version is None}
+    if missing:
+        # Overwriting a version written concurrently only costs extra misses: whoever
+        # reads the database under the value set here does so after this write.
+        _set_many({tag_version_key(tag): version for tag, version in missing.items()}, TAG_TIMEOUT)
+        versions.update(missing)
+    return versions
+
+
+def tag_versions(tags: Iterable[str]) -> dict[str, int]:
+    """
+    Current version of each tag: a generation that changes whenever the tag is
+    invalidated (or its version is evicted), e.g. for collection ETags.
+    """
+    tags = set(tags)
+    return _tag_versions(tags, _get_many(tag_version_key(tag) for tag in tags))
+
+
+def get_many_tagged(entries: Mapping[str, Sequence[str]]) -> dict[str, tuple[Any | None, tuple]]:
+    """
+    Look up several keys, each registered under its tags, fetching the entries and the
+    tag versions together in batched get_many calls. Returns {key: (value, stamp)}: value
+    is None when missing or stamped before one of its tags was invalidated, and the stamp
+    must be taken *before* reading the database and passed to set_tagged/set_many_tagged.
+    """
+    tags = {tag for key_tags in entries.values() for tag in key_tags}
+    found = _get_many([*entries, *(tag_version_key(tag) for tag in tags)])
+    versions = _tag_versions(tags, found)
+
+    results = {}
+    for key, key_tags in entries.items():
+        stamp = tuple(versions[tag] for tag in key_tags)
+        entry = found.get(key)
+        results[key] = (
+            (entry[1], stamp) if entry is not None and entry[0] == stamp else (None, stamp)
+        )
+    return results
+
+
+def get_tagged(key: str, tags: Sequence[str]) -> tuple[Any | None, tuple]:
+    return get_many_tagged({key: tags})[key]
+
+
+def set_many_tagged(entries: Mapping[str, tuple[Any, tuple]], timeout: int):
+    """Store {key: (value, stamp)}, with stamps from get_many_tagged."""
+    _set_many({key: (stamp, value) for key, (value, stamp) in entries.items()}, timeout)
+
+
+def set_tagged(key: str, value: Any, stamp: tuple, timeout: int):
+    cache.set(key, (stamp, value), timeout=timeout)
+
+
+def invalidate_tags(tags: Iterable[str]) -> dict[str, int]:
+    """Retire every entry registered under `tags`. Returns the new tag versions."""
+    versions = {tag: _new_version() for tag in tags}
+    _set_many({tag_version_key(tag): version for tag, version in versions.items()}, TAG_TIMEOUT)
+    tags_invalidated.send(sender=None, tags=list(versions))
+    return versions
+
+
+def invalidate_tags_on_commit(tags: Iterable[str]):
+    """
+    Invalidate `tags` once the surrounding transaction commits. Invalidating earlier lets
+    a concurrent reader cache the pre-commit row again; a reader that loaded the old row
+    under the old stamp can no longer be served once the new versions are written.
+    """
+    tags = list(tags)
+    transaction.on_commit(lambda: invalidate_tags(tags))
+
+
+def _set_if_newer(key: str, value: Any, stamp: tuple, timeout: int, version: Callable):
+    """
+    set_tagged, unless the entry already holds a value whose `version` is not older. The
+    read and the write are one compare-and-set (WATCH/MULTI): if another writer changes
+    the entry in between, it is deleted instead, so neither value can overwrite a newer one.
+    """
+    try:
+        client = get_redis_connection("default")
+    except NotImplementedError:
+        # Not a django-redis backend (a LocMemCache in benchmarks): nothing else writes
+        # between the read and the write.
+        current = cache.get(key)
+        if current is None or version(current[1]) < version(value):
+            set_tagged(key, value, stamp, timeout=timeout)
+        return
+    is_degraded = getattr(cache, "is_degraded", None)
+    if is_degraded is not None and is_degraded():
+        cache.delete(key)
+        return
+
+    codec = cache.client
+    redis_key = codec.make_key(key)
+    try:
+        with timed("cache"), client.pipeline() as pipe:
+            pipe.watch(redis_key)
+            current = pipe.get(redis_key)
+            if current is not None and version(codec.decode(current)[1]) >= version(value):
+                return
+            pipe.multi()
+            pipe.set(redis_key, codec.encode((stamp, value)), ex=timeout)
+            pipe.execute()
+    except WatchError:
+        cache.delete(key)
+    except REDIS_UNAVAILABLE:
+        # Goes to the fallback, which drops the key from Redis once it answers again.
+        cache.delete(key)
+
+
+def refresh_on_commit(
+    key: str,
+    value: Any,
+    tags: Sequence[str],
+    timeout: int,
+    invalidate: Iterable[str] = (),
+    version: Callable[[Any], Any] | None = None,
+):
+    """
+    Write-through variant of invalidate_tags_on_commit: after commit, invalidate
+    `invalidate`, then store `value` under `key` stamped with the versions of `tags`, new
+    for the ones just invalidated and current for the rest (so a shared tag such as
+    STUDENT_ENTRIES does not retire every other entry on each write). If the entry
+    already holds a value whose `version` is not older (another writer's callback ran
+    first) it is left alone, and if another writer refreshes it concurrently it is
+    deleted (see _set_if_newer); `invalidate` should include one of `tags`, so that entry
+    was retired and the next read goes to the database.
+    """
+    invalidate = list(invalidate)
+
+    def refresh():
+        versions = invalidate_tags(dict.fromkeys(invalidate))
+        versions.update(tag_versions(tag for tag in tags if tag not in versions))
+        stamp = tuple(versions[tag] for tag in tags)
+        if version is None:
+            set_tagged(key, value, stamp, timeout=timeout)
+        else:
+            _set_if_newer(key, value, stamp, timeout, version)
+
+    transaction.on_commit(refresh)
@@ -0,0 +1,218 @@
+import logging
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+from django_redis.cache import RedisCache
+from pybreaker import CircuitBreaker, CircuitBreakerError, CircuitBreakerListener
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from app.utils.server_timing import timed
+
+logger = logging.getLogger(__name__)
+
+# Errors that mean "Redis is unreachable or too slow", as opposed to a bad command.
+# socket.timeout is an OSError; django-redis re-raises the underlying error because
+# IGNORE_EXCEPTIONS is off.
+REDIS_UNAVAILABLE = (RedisConnectionError, RedisTimeoutError, OSError, CircuitBreakerError)
+
+
+class InstrumentedRedisCache(RedisCache):
+    """RedisCache that reports every round trip to the Server-Timing recorder."""
+
+    def get(self, *args, **kwargs):
+        with timed("cache"):
+            return super().get(*args, **kwargs)
+
+    def set(self, *args, **kwargs):
+        with timed("cache"):
+            return super().set(*args, **kwargs)
+
+    def add(self, *args, **kwargs):
+        with timed("cache"):
+            return super().add(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with timed("cache"):
+            return super().delete(*args, **kwargs)
+
+    def get_many(self, *args, **kwargs):
+        with timed("cache"):
+            return super().get_many(*args, **kwargs)
+
+    def set_many(self, *args, **kwargs):
+        with timed("cache"):
+            return super().set_many(*args, **kwargs)
+
+    def delete_many(self, *args, **kwargs):
+        with timed("cache"):
+            return super().delete_many(*args, **kwargs)
+
+    def incr(self, *args, **kwargs):
+        with timed("cache"):
+            return super().incr(*args, **kwargs)
+
+    def decr(self, *args, **kwargs):
+        with timed("cache"):
+            return super().decr(*args, **kwargs)
+
+    def has_key(self, *args, **kwargs):
+        with timed("cache"):
+            return super().has_key(*args, **kwargs)
+
+    def touch(self, *args, **kwargs):
+        with timed("cache"):
+            return super().touch(*args, **kwargs)
+
+
+class _BreakerLogger(CircuitBreakerListener):
+    def state_change(self, cb, old_state, new_state):
+        ResilientRedisCache.stats[f"breaker_{new_state.name}"] += 1
+        logger.warning(f"Redis cache breaker {old_state.name} -> {new_state.name}")
+
+
+class ResilientRedisCache(InstrumentedRedisCache):
+    """
+    Fail-open RedisCache. Connection errors and timeouts trip a circuit breaker and the
+    call is answered from a small in-process LRU (LocMemCache) instead of raising, so a
+    Redis outage costs hit rate rather than requests. Keys written while degraded are
+    deleted from Redis once it answers again, so invalidations missed during the outage
+    do not leave stale entries behind. State and counters are in `status()`.
+    """
+
+    breaker = CircuitBreaker(
+        fail_max=settings.CACHE_BREAKER_FAIL_MAX,
+        reset_timeout=settings.CACHE_BREAKER_RESET_TIMEOUT,
+        exclude=[ValueError],  # incr/decr of a missing key
+        listeners=[_BreakerLogger()],
+        name="redis_cache_breaker",
+    )
+    fallback = LocMemCache(
+        "sysacad-cache-fallback",
+        {
+            "TIMEOUT": settings.CACHE_FALLBACK_TIMEOUT,
+            "OPTIONS": {"MAX_ENTRIES": settings.CACHE_FALLBACK_MAX_ENTRIES},
+        },
+    )
+    stats = Counter()
+    _lock = threading.Lock()
+    _degraded = False
+    _missed_writes: set[str] = set()
+
+    @classmethod
+    def status(cls) -> dict:
+        return {
+            "status": "degraded" if cls._degraded else "ok",
+            "breaker": cls.breaker.current_state,
+            **cls.stats,
+        }
+
+    @classmethod
+    def is_degraded(cls) -> bool:
+        return cls._degraded
+
+    @classmethod
+    def reset(cls):
+        cls.breaker.close()
+        cls.fallback.clear()
+        cls.stats.clear()
+        with cls._lock:
+            cls._degraded = False
+            cls._missed_writes.clear()
+
+    def _call(self, name: str, *args, written_keys=(), **kwargs):
+        try:
+            if self._degraded:
+                self._replay_missed_writes()
+            result = self.breaker.call(getattr(super(), name), *args, **kwargs)
+        except REDIS_UNAVAILABLE as e:
+            return self._degrade(e, name, args, kwargs, written_keys)
+        if self._degraded:
+            self._recover()
+        return result
+
+    def _degrade(self, error, name, args, kwargs, written_keys):
+        cls = type(self)
+        with cls._lock:
+            if not cls._degraded:
+                cls._degraded = True
+                logger.warning(
+                    f"Redis cache unavailable, serving from in-process fallback: {error!r}"
+                )
+            if len(cls._missed_writes) < settings.CACHE_FALLBACK_MAX_ENTRIES:
+                cls._missed_writes.update(written_keys)
+            else:
+                cls.stats["missed_writes_dropped"] += len(written_keys)
+        cls.stats["fallback_calls"] += 1
+        cls.stats[f"fallback_{name}"] += 1
+        # Fallback entries never outlive CACHE_FALLBACK_TIMEOUT: other processes cannot
+        # invalidate them.
+        timeout = kwargs.get("timeout", DEFAULT_TIMEOUT)
+        if timeout is None or (
+            timeout is not DEFAULT_TIMEOUT and timeout > settings.CACHE_FALLBACK_TIMEOUT
+        ):
+            kwargs["timeout"] = settings.CACHE_FALLBACK_TIMEOUT
+        return getattr(self.fallback, name)(*args, **kwargs)
+
+    def _replay_missed_writes(self):
+        cls = type(self)
+        with cls._lock:
+            missed, cls._missed_writes = list(cls._missed_writes), set()
+        if not missed:
+            return
+        try:
+            self.breaker.call(super().delete_many, missed)
+        except REDIS_UNAVAILABLE:
+            with cls._lock:
+                cls._missed_writes.update(missed)
+            raise
+        logger.info(f"Dropped {len(missed)} Redis keys written while the cache was degraded")
+
+    def _recover(self):
+        cls = type(self)
+        with cls._lock:
+            if not cls._degraded or cls._missed_writes:
+                return
+            cls._degraded = False
+        self.fallback.clear()
+        cls.stats["recoveries"] += 1
+        logger.info("Redis cache recovered")
+
+    def get(self, key, default=None, version=None):
+        return self._call("get", key, default, version=version)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call("set", key, value, timeout=timeout, version=version, written_keys=[key])
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call("add", key, value, timeout=timeout, version=version, written_keys=[key])
+
+    def delete(self, key, version=None):
+        return self._call("delete", key, version=version, written_keys=[key])
+
+    def get_many(self, keys, version=None):
+        return self._call("get_many", keys, version=version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call(
+            "set_many", data, timeout=timeout, version=version, written_keys=list(data)
+        )
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        return self._call("delete_many", keys, version=version, written_keys=keys)
+
+    def incr(self, key, delta=1, version=None):
+        return self._call("incr", key, delta, version=version, written_keys=[key])
+
+    def decr(self, key, delta=1, version=None):
+        return self._call("decr", key, delta, version=version, written_keys=[key])
+
+    def has_key(self, key, version=None):
+        return self._call("has_key", key, version=version)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call("touch", key, timeout=timeout, version=version)
@@ -0,0 +1,217 @@
+"""
+Compact cache codec for django-redis (OPTIONS SERIALIZER / COMPRESSOR).
+
+Values are JSON where every container or non-JSON scalar is a tagged array, and model
+instances are stored as a tuple of their concrete field values instead of a pickle:
+
+    ["M", "student", 3735928559, [7, "Juan", ..., 730255, ...]]   tag, schema version, fields
+    ["R", "student", 3735928559, [7, ...], [8, ...]]             list of one model
+    ["T", 1718000000000000, ["L", ...], 120]                       tuple, list
+    ["d", "2000-05-15"], ["t", "2024-01-01T10:00:00+00:00"]
+
+Inside a model tuple, dates are stored as ordinals and datetimes as microseconds since the
+epoch (UTC), since the field types are known from the schema.
+
+The schema version is derived from the model's field names and types, so an entry written
+before a migration reads back as a miss instead of a half-populated instance. Anything
+that is not in this format (e.g. pickles from an older deploy) is a miss as well.
+"""
+
+import json
+import logging
+import zlib
+from datetime import UTC, date, datetime, timedelta
+from functools import cache
+from typing import Any
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models.base import ModelState
+from django_redis.compressors.zlib import ZlibCompressor
+from django_redis.serializers.base import BaseSerializer
+
+logger = logging.getLogger(__name__)
+
+# First byte of every encoded value. Never a valid zlib header, so values stored without
+# compression are told apart from compressed ones.
+FORMAT_VERSION = b"\x01"
+
+# Cacheable models by tag. The tag, not the class path, is what gets stored.
+CACHED_MODELS = {
+    "student": "app.Student",
+    "document_type": "app.DocumentType",
+}
+
+
+class StaleCacheEntry(ValueError):
+    """The entry was written by a different codec or model schema."""
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _datetime_to_int(value: datetime) -> int:
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _int_to_datetime(value: int) -> datetime:
+    # Float division is exact to the microsecond for any date before year 2200 and about
+    # twice as fast as adding a timedelta.
+    return datetime.fromtimestamp(value / 1_000_000, UTC)
+
+
+# Per internal field type: (encode, decode) inside a model tuple. Fields of any other
+# type are stored as they are and must hold JSON scalars.
+_FIELD_CODECS = {
+    "DateField": (date.toordinal, date.fromordinal),
+    "DateTimeField": (_datetime_to_int, _int_to_datetime),
+}
+
+
+@cache
+def _model_schema(tag: str):
+    model = apps.get_model(CACHED_MODELS[tag])
+    fields = model._meta.concrete_fields
+    attnames = [field.attname for field in fields]
+    # (position, encode, decode) for the fields that are not plain JSON scalars.
+    converters = [
+        (position, *_FIELD_CODECS[field.get_internal_type()])
+        for position, field in enumerate(fields)
+        if field.get_internal_type() in _FIELD_CODECS
+    ]
+    signature = ",".join(f"{field.attname}:{field.get_internal_type()}" for field in fields)
+    return model, attnames, converters, zlib.crc32(f"{FORMAT_VERSION.hex()}|{signature}".encode())
+
+
+@cache
+def _model_tags() -> dict:
+    return {apps.get_model(label): tag for tag, label in CACHED_MODELS.items()}
+
+
+_SCALARS = (type(None), bool, int, float, str)
+
+
+def _encode(value: Any):
+    if type(value) in _SCALARS:
+        return value
+    if isinstance(value, datetime):
+        return ["t", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, tuple):
+        return ["T", *map(_encode, value)]
+    if isinstance(value, list):
+        tag = _model_tags().get(type(value[0])) if value else None
+        if tag is not None and all(type(item) is type(value[0]) for item in value):
+            return _encode_rows(tag, value)
+        return ["L", *map(_encode, value)]
+    if isinstance(value, dict):
+        return ["D", *(_encode(item) for pair in value.items() for item in pair)]
+    tag = _model_tags().get(type(value))
+    if tag is not None:
+        return _encode_model(tag, value)
+    raise TypeError(f"{type(value).__name__} is not cacheable with the compact codec")
+
+
+def _model_row(instance, attnames, converters) -> list:
+    fields = instance.__dict__
+    row = [fields[name] for name in attnames]
+    for position, encode, _ in converters:
+        if (value := row[position]) is not None:
+            row[position] = encode(value)
+    return row
+
+
+def _encode_model(tag: str, instance) -> list:
+    _, attnames, converters, version = _model_schema(tag)
+    return ["M", tag, version, _model_row(instance, attnames, converters)]
+
+
+def _encode_rows(tag: str, instances: list) -> list:
+    """A list of instances of one model: the tag and version are written once."""
+    _, attnames, converters, version = _model_schema(tag)
+    return [
+        "R",
+        tag,
+        version,
+        *(_model_row(instance, attnames, converters) for instance in instances),
+    ]
+
+
+def _decode_rows(tag: str, version: int, rows) -> list:
+    model, attnames, converters, current = _model_schema(tag)
+    if version != current:
+        raise StaleCacheEntry(f"{tag} schema {version} != {current}")
+    width = len(attnames)
+    instances = []
+    for row in rows:
+        if len(row) != width:
+            raise StaleCacheEntry(f"{tag} row has {len(row)} fields, expected {width}")
+        for position, _, decode in converters:
+            if (value := row[position]) is not None:
+                row[position] = decode(value)
+        # Same shortcut pickle takes: fill __dict__ without running Model.__init__.
+        instance = model.__new__(model)
+        instance.__dict__.update(zip(attnames, row, strict=True))
+        state = instance._state = ModelState()
+        state.adding = False
+        state.db = "default"
+        instances.append(instance)
+    return instances
+
+
+def _decode(value: Any):
+    if type(value) is not list:
+        return value
+    kind = value[0]
+    if kind == "M":
+        return _decode_rows(value[1], value[2], value[3:])[0]
+    if kind == "R":
+        return _decode_rows(value[1], value[2], value[3:])
+    if kind == "L":
+        return [_decode(item) for item in value[1:]]
+    if kind == "T":
+        return tuple(_decode(item) for item in value[1:])
+    if kind == "D":
+        decoded = [_decode(item) for item in value[1:]]
+        return dict(zip(decoded[::2], decoded[1::2], strict=True))
+    if kind == "t":
+        return datetime.fromisoformat(value[1])
+    if kind == "d":
+        return date.fromisoformat(value[1])
+    raise StaleCacheEntry(f"Unknown tag {kind!r}")
+
+
+def dumps(value: Any) -> bytes:
+    return (
+        FORMAT_VERSION
+        + json.dumps(_encode(value), separators=(",", ":"), ensure_ascii=False).encode()
+    )
+
+
+def loads(data: bytes) -> Any:
+    if not data.startswith(FORMAT_VERSION):
+        raise StaleCacheEntry("Unknown cache format")
+    return _decode(json.loads(data[len(FORMAT_VERSION) :]))
+
+
+class CompactSerializer(BaseSerializer):
+    """django-redis serializer for the format above; stale entries load as None (a miss)."""
+
+    def dumps(self, value: Any) -> bytes:
+        return dumps(value)
+
+    def loads(self, value: bytes) -> Any:
+        try:
+            return loads(value)
+        except (ValueError, LookupError) as e:
+            logger.debug(f"Discarding unreadable cache entry: {e}")
+            return None
+
+
+class ThresholdZlibCompressor(ZlibCompressor):
+    """Only compresses values larger than CACHE_COMPRESS_MIN_BYTES."""
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.min_length = settings.CACHE_COMPRESS_MIN_BYTES
@@ -0,0 +1,45 @@
+"""
+Per-request deadline for outbound calls. DeadlineMiddleware gives each request
+REQUEST_DEADLINE_SECONDS (kept below the proxy's own timeout); clients size their
+timeouts, retries and backoff sleeps to `remaining()` instead of a fixed value, so one
+slow dependency cannot push a request past the point where the proxy gives up on it.
+Outside a request (workers, commands) there is no deadline.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """The request's deadline passed before an outbound call could complete."""
+
+
+@contextmanager
+def deadline_scope(seconds: float):
+    """Run the block with a deadline `seconds` from now, or the enclosing one if sooner."""
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left before the deadline (may be negative), or None without one."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def call_timeout(default: float) -> float:
+    """`default` capped to the time left. Raises DeadlineExceeded when none is left."""
+    left = remaining()
+    if left is None:
+        return default
+    if left <= 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+    return min(default, left)
@@ -0,0 +1,52 @@
+import logging
+
+import requests
+from django.conf import settings
+from django_redis import get_redis_connection
+
+from app.utils.cache_backend import REDIS_UNAVAILABLE
+
+logger = logging.getLogger(__name__)
+
+# Redis set of surrogate keys waiting to be purged. Being a set, a key invalidated by
+# many writes before the next purge is sent once.
+PENDING_KEY = "sysacad:edge_purge:pending"
+
+
+def queue_surrogate_keys(sender, tags, **kwargs):
+    """
+    tags_invalidated receiver: queue `tags` for the purge worker (`manage.py
+    purge_edge`) with one SADD, so writes never wait on the edge cache. Connected in
+    AppConfig.ready when EDGE_PURGE_URL is set. Failures are logged, not raised: edge
+    entries then expire with their s-maxage.
+    """
+    if not tags:
+        return
+    try:
+        get_redis_connection("default").sadd(PENDING_KEY, *tags)
+    except REDIS_UNAVAILABLE as e:
+        logger.warning(f"Could not queue {len(tags)} surrogate keys for edge purge: {e!r}")
+
+
+def purge_pending(batch_size: int, redis_client=None) -> int:
+    """
+    Pop up to `batch_size` queued surrogate keys and ask the edge cache at EDGE_PURGE_URL
+    to drop every response tagged with them. Returns how many keys were purged; if the
+    edge cache fails they are queued again and 0 is returned.
+    """
+    redis_client = redis_client or get_redis_connection("default")
+    keys = sorted(key.decode() for key in redis_client.spop(PENDING_KEY, batch_size))
+    if not keys:
+        return 0
+    try:
+        response = requests.post(
+            settings.EDGE_PURGE_URL,
+            json={"surrogate_keys": keys},
+            timeout=settings.EDGE_PURGE_TIMEOUT,
+        )
+        response.raise_for_status()
+    except requests.RequestException as e:
+        redis_client.sadd(PENDING_KEY, *keys)
+        logger.warning(f"Edge purge of {len(keys)} surrogate keys failed: {e}")
+        return 0
+    return len(keys)
@@ -0,0 +1,89 @@
+"""
+Strong ETags and the conditional-request checks built on them.
+
+An entity's ETag is derived from its id and `version` (`updated_at` for models without
+one); a collection's from the
+version of its cache tag (app.utils.cache.tag_versions), which changes every time the
+collection is invalidated, plus the request path (page, page size). Both can be
+computed from the cache alone, so a matching If-None-Match is answered with 304 before
+anything is loaded or serialized. Responses with ?expand= also hash the embedded data,
+so they are only compared once it has been fetched.
+"""
+
+import hashlib
+import json
+from datetime import UTC, datetime, timedelta
+
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class PreconditionFailed(Exception):
+    """If-Match did not hold: the entity changed since the client read it."""
+
+
+class ConcurrentUpdateError(Exception):
+    """An unconditional write kept losing the optimistic version check; retry it."""
+
+
+def entity_etag(entity) -> str:
+    version = getattr(entity, "version", None)
+    if version is not None:
+        return f'"{entity._meta.model_name}-{entity.pk}-v{version}"'
+    updated = (entity.updated_at - _EPOCH) // timedelta(microseconds=1)
+    return f'"{entity._meta.model_name}-{entity.pk}-{updated}"'
+
+
+def collection_etag(name: str, generation: int, *parts) -> str:
+    digest = hashlib.blake2b(repr((generation, *parts)).encode(), digest_size=8).hexdigest()
+    return f'"{name}-{digest}"'
+
+
+def _expansion_key(value) -> str:
+    # Embedded model instances (e.g. document types) by their own ETag.
+    return entity_etag(value) if hasattr(value, "_meta") else str(value)
+
+
+def expanded_etag(etag: str, expansions: dict) -> str:
+    """
+    ETag of a representation that also embeds `expansions` (?expand= data owned by other
+    services), which change without the entity or collection changing.
+    """
+    if not expansions:
+        return etag
+    digest = hashlib.blake2b(
+        json.dumps(expansions, sort_keys=True, default=_expansion_key).encode(), digest_size=8
+    ).hexdigest()
+    return f'{etag[:-1]}+{digest}"'
+
+
+def _strip_weak(etag: str) -> str:
+    return etag.removeprefix("W/")
+
+
+def if_none_match(request, etag: str) -> bool:
+    """True when the client already holds `etag` (weak comparison, as for GET/HEAD)."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    etags = parse_etags(header)
+    return "*" in etags or _strip_weak(etag) in map(_strip_weak, etags)
+
+
+def if_match_etags(request) -> list[str] | None:
+    """The If-Match header parsed, or None when the request is unconditional."""
+    header = request.headers.get("If-Match")
+    return parse_etags(header) if header else None
+
+
+def check_if_match(etags: list[str] | None, etag: str):
+    """Strong comparison: weak tags never match. Raises PreconditionFailed."""
+    if etags is not None and "*" not in etags and etag not in etags:
+        raise PreconditionFailed("The resource was modified since it was read (If-Match failed)")
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
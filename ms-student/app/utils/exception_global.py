@@ -2,10 +2,14 @@ import logging
 
 import requests
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from pybreaker import CircuitBreakerError
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import exception_handler
 
+from app.utils.deadline import DeadlineExceeded
+from app.utils.etag import ConcurrentUpdateError, PreconditionFailed
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,8 +20,11 @@ def custom_exception_handler(exc, context):
     view = context.get("view", None)
     view_name = view.__class__.__name__ if view else "Unknown"
 
-    # Handle HTTP errors from external microservices
-    if isinstance(exc, (requests.Timeout, requests.ConnectionError)):
+    # Handle HTTP errors from external microservices. An open breaker or a spent deadline
+    # is the same answer for the client: try again later.
+    if isinstance(
+        exc, (requests.Timeout, requests.ConnectionError, CircuitBreakerError, DeadlineExceeded)
+    ):
         logger.error(f"{view_name} - External service unavailable: {str(exc)}")
         return Response(
             {"error": "External service temporarily unavailable. Please try again later."},
@@ -31,6 +38,14 @@ def custom_exception_handler(exc, context):
             status=status.HTTP_502_BAD_GATEWAY,
         )
 
+    if isinstance(exc, PreconditionFailed):
+        logger.info(f"{view_name} - Precondition failed: {str(exc)}")
+        return Response({"error": str(exc)}, status=status.HTTP_412_PRECONDITION_FAILED)
+
+    if isinstance(exc, ConcurrentUpdateError):
+        logger.warning(f"{view_name} - Concurrent update: {str(exc)}")
+        return Response({"error": str(exc)}, status=status.HTTP_409_CONFLICT)
+
     if isinstance(exc, ObjectDoesNotExist):
         logger.warning(f"{view_name} - Resource not found: {str(exc)}")
         return Response(
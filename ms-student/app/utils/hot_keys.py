@@ -0,0 +1,62 @@
+import logging
+import random
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from app.utils.cache_backend import ResilientRedisCache
+
+logger = logging.getLogger(__name__)
+
+
+class HotKeyTracker:
+    """
+    Approximate read counts in a Redis sorted set. Only CACHE_READ_SAMPLE_RATE of the
+    reads pay the (pipelined) ZINCRBY, the set is trimmed to `max_size` members now and
+    then, and it expires when nothing is read for `ttl` seconds. Best effort: Redis
+    errors are logged and ignored, and nothing is sent while the cache is degraded.
+    """
+
+    TRIM_EVERY = 64
+
+    def __init__(
+        self, name: str, max_size: int = 10_000, ttl: int = 7 * 24 * 3600, redis_client=None
+    ):
+        self.key = f"sysacad:hot:{name}"
+        self.max_size = max_size
+        self.ttl = ttl
+        self._redis_client = redis_client
+
+    @property
+    def redis_client(self):
+        if self._redis_client is None:
+            self._redis_client = get_redis_connection("default")
+        return self._redis_client
+
+    def record(self, member):
+        if random.random() >= settings.CACHE_READ_SAMPLE_RATE or ResilientRedisCache.is_degraded():
+            return
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            pipeline.zincrby(self.key, 1, member)
+            if random.randrange(self.TRIM_EVERY) == 0:
+                pipeline.zremrangebyrank(self.key, 0, -(self.max_size + 1))
+                pipeline.expire(self.key, self.ttl)
+            pipeline.execute()
+        except (RedisError, OSError) as e:
+            logger.debug(f"Could not record read of {member} in {self.key}: {e!r}")
+
+    def top(self, limit: int) -> list[str]:
+        if limit <= 0:
+            return []
+        try:
+            members = self.redis_client.zrevrange(self.key, 0, limit - 1)
+        except (RedisError, OSError) as e:
+            logger.warning(f"Could not read {self.key}: {e!r}")
+            return []
+        return [member.decode() if isinstance(member, bytes) else member for member in members]
+
+
+# Singleton instance
+student_reads = HotKeyTracker("students")
@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from rest_framework import status
+
+CACHEABLE_STATUSES = (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED)
+
+
+class HttpCachePolicyMixin:
+    """
+    Cache headers for GET/HEAD responses so an edge cache (Traefik plugin, Varnish, a
+    CDN) can absorb read traffic. `cache_policies` maps an action to a policy name in
+    settings.HTTP_CACHE_POLICIES ({"cache_control": {...}, "vary": [...]}). Actions can
+    tag their response with surrogate keys via add_surrogate_keys(); the keys are the
+    cache tags from app.utils.cache, so a write that invalidates a tag (and sends
+    tags_invalidated) names the edge entries to purge as well.
+    """
+
+    cache_policies: dict[str, str] = {}
+
+    def initial(self, request, *args, **kwargs):
+        self._surrogate_keys = set()
+        super().initial(request, *args, **kwargs)
+
+    def add_surrogate_keys(self, *keys: str):
+        self._surrogate_keys.update(keys)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        policy_name = self.cache_policies.get(getattr(self, "action", None))
+        if (
+            policy_name is None
+            or request.method not in ("GET", "HEAD")
+            or response.status_code not in CACHEABLE_STATUSES
+        ):
+            return response
+        policy = settings.HTTP_CACHE_POLICIES[policy_name]
+        patch_cache_control(response, **policy.get("cache_control", {}))
+        patch_vary_headers(response, policy.get("vary", ()))
+        keys = getattr(self, "_surrogate_keys", None)
+        if keys:
+            response[settings.SURROGATE_KEY_HEADER] = " ".join(sorted(keys))
+        return response
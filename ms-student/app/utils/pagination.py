@@ -0,0 +1,59 @@
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class ServicePagePagination(PageNumberPagination):
+    """
+    PageNumberPagination over a service's `find_page(page, page_size)`, so a page (and
+    its total count) can be served from the cache instead of slicing a queryset here.
+    Responses keep the usual count/next/previous/results shape.
+    """
+
+    def paginate_service(self, service, request) -> list:
+        self.request = request
+        self.size = self.get_page_size(request)
+        raw_number = request.query_params.get(self.page_query_param, 1)
+        try:
+            self.number = int(raw_number)
+            if self.number < 1:
+                raise ValueError
+        except (TypeError, ValueError) as e:
+            raise NotFound(
+                self.invalid_page_message.format(page_number=raw_number, message="Invalid page.")
+            ) from e
+
+        entities, self.count = service.find_page(self.number, self.size)
+        if self.number > 1 and not entities:
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=raw_number, message="That page contains no results"
+                )
+            )
+        return entities
+
+    def get_next_link(self):
+        if self.number * self.size >= self.count:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.page_query_param, self.number + 1
+        )
+
+    def get_previous_link(self):
+        if self.number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.number - 1)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "count": self.count,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
@@ -0,0 +1,99 @@
+import logging
+import traceback
+from contextlib import ExitStack
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# Transaction bookkeeping depends on the caller (a TestCase wraps everything in a
+# savepoint, gunicorn runs in autocommit), so it never counts against a budget.
+_TRANSACTION_CONTROL_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def get_query_budget(view_class, action: str | None) -> int | None:
+    """Return the max queries declared for a view action via `query_budgets`, if any."""
+    if view_class is None or action is None:
+        return None
+    return getattr(view_class, "query_budgets", {}).get(action)
+
+
+class QueryRecorder:
+    """Records executed SQL (optionally with the Python stack) on every connection."""
+
+    def __init__(self, capture_stacks: bool = False):
+        self.capture_stacks = capture_stacks
+        self.queries: list[dict] = []
+        self._stack = None
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self._record))
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self._stack.close()
+        return False
+
+    def _record(self, execute, sql, params, many, context):
+        if not sql.lstrip().upper().startswith(_TRANSACTION_CONTROL_PREFIXES):
+            entry = {"sql": sql}
+            if self.capture_stacks:
+                entry["stack"] = "".join(traceback.format_stack()[:-2])
+            self.queries.append(entry)
+        return execute(sql, params, many, context)
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    def format_queries(self) -> str:
+        lines = []
+        for index, query in enumerate(self.queries, start=1):
+            lines.append(f"{index}. {query['sql']}")
+            if "stack" in query:
+                lines.append(query["stack"])
+        return "\n".join(lines)
+
+
+class QueryBudget(QueryRecorder):
+    """Fails with the offending SQL when the block runs more than `limit` queries."""
+
+    def __init__(self, limit: int, label: str = "", capture_stacks: bool = False):
+        super().__init__(capture_stacks=capture_stacks)
+        self.limit = limit
+        self.label = label
+
+    def __exit__(self, exc_type, exc_value, tb):
+        super().__exit__(exc_type, exc_value, tb)
+        if exc_type is None and self.count > self.limit:
+            raise QueryBudgetExceeded(
+                f"{self.label or 'Block'} ran {self.count} queries, budget is {self.limit}:\n"
+                f"{self.format_queries()}"
+            )
+        return False
+
+
+def assert_max_queries(limit: int, label: str = "", capture_stacks: bool = False) -> QueryBudget:
+    """
+    Test helper:
+
+        with assert_max_queries(2, "students list"):
+            client.get("/api/v1/students/")
+    """
+    return QueryBudget(limit, label=label, capture_stacks=capture_stacks)
+
+
+def assert_view_query_budget(view_class, action: str, capture_stacks: bool = False) -> QueryBudget:
+    """Test helper enforcing the budget a view declares for `action` in `query_budgets`."""
+    limit = get_query_budget(view_class, action)
+    if limit is None:
+        raise QueryBudgetExceeded(f"{view_class.__name__} declares no query budget for '{action}'")
+    return QueryBudget(
+        limit, label=f"{view_class.__name__}.{action}", capture_stacks=capture_stacks
+    )
@@ -0,0 +1,55 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+
+
+class ServerTimings:
+    """Accumulates per-phase durations for a single request."""
+
+    def __init__(self):
+        self.durations: dict[str, float] = defaultdict(float)
+        self.counts: dict[str, int] = defaultdict(int)
+
+    def add(self, phase: str, seconds: float):
+        self.durations[phase] += seconds
+        self.counts[phase] += 1
+
+    def header_value(self, total_seconds: float) -> str:
+        metrics = []
+        accounted = 0.0
+        for phase, seconds in self.durations.items():
+            accounted += seconds
+            metrics.append(f'{phase};dur={seconds * 1000:.2f};desc="{self.counts[phase]} calls"')
+        metrics.append(f"app;dur={max(total_seconds - accounted, 0.0) * 1000:.2f}")
+        metrics.append(f"total;dur={total_seconds * 1000:.2f}")
+        return ", ".join(metrics)
+
+
+_current_timings: ContextVar[ServerTimings | None] = ContextVar("server_timings", default=None)
+
+
+def activate(timings: ServerTimings) -> Token:
+    return _current_timings.set(timings)
+
+
+def deactivate(token: Token):
+    _current_timings.reset(token)
+
+
+def current() -> ServerTimings | None:
+    return _current_timings.get()
+
+
+@contextmanager
+def timed(phase: str):
+    # Single ContextVar lookup when timing is off, so call sites can stay instrumented in production.
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - start)
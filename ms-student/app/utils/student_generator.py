@@ -0,0 +1,155 @@
+import csv
+import io
+import random
+from collections.abc import Iterable, Iterator
+from datetime import date, timedelta
+from itertools import batched, islice
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from app.models import Student
+
+# fmt: off
+FIRST_NAMES = [
+    "Juan", "María", "Lucía", "Mateo", "Sofía", "Martín", "Valentina", "Santiago", "Camila",
+    "Benjamín", "Julieta", "Tomás", "Catalina", "Joaquín", "Agustina", "Facundo", "Florencia",
+    "Nicolás", "Micaela", "Ignacio", "Ana Laura", "Juan Pablo", "María José",
+]
+LAST_NAMES = [
+    "González", "Rodríguez", "Gómez", "Fernández", "López", "Díaz", "Martínez", "Pérez",
+    "García", "Sánchez", "Romero", "Sosa", "Álvarez", "Torres", "Ruiz", "Ramírez", "Flores",
+    "Benítez", "Acosta", "Medina", "Herrera", "Suárez", "Aguirre", "Pereyra", "Gutiérrez",
+    "Giménez", "Molina", "Silva", "Castro", "Rojas", "Ortiz", "Núñez", "Luna", "Juárez",
+    "Cabrera", "Ríos", "Ferreyra", "Godoy", "Morales", "Domínguez", "Moreno", "Peralta",
+    "Vega", "Carrizo", "Quiroga", "Castillo", "Ledesma", "Muñoz", "Ojeda", "Ponce", "Vera",
+    "San Martín", "Di Stéfano",
+]
+# fmt: on
+GENDERS = ["M", "F", "O"]
+# Default "today" for generated dates, fixed so that a seed gives the same rows on any day.
+REFERENCE_DATE = date(2025, 1, 1)
+DOCUMENT_NUMBER_BASE = 20_000_000
+
+COPY_COLUMNS = [
+    "first_name",
+    "last_name",
+    "document_number",
+    "birth_date",
+    "gender",
+    "student_number",
+    "enrollment_date",
+    "document_type_id",
+    "specialty_id",
+    "is_active",
+    "created_at",
+    "updated_at",
+    "version",
+]
+
+
+class StudentGenerator:
+    """
+    Deterministic stream of students that pass StudentSerializer validation: alphabetic
+    names, birth 17-60 years before `today`, enrollment 17+ years after birth and not after
+    `today`, unique sequential student numbers from `start_number` and document numbers
+    from `first_document_number` (20000000 + `start_number` by default).
+    """
+
+    def __init__(
+        self,
+        document_type_ids: list[int],
+        specialty_ids: list[int],
+        seed: int = 42,
+        start_number: int = 1,
+        today: date = REFERENCE_DATE,
+        first_document_number: int | None = None,
+    ):
+        self.document_type_ids = document_type_ids
+        self.specialty_ids = specialty_ids
+        self.rng = random.Random(seed)
+        self.start_number = start_number
+        self.today = today
+        self.first_document_number = first_document_number or DOCUMENT_NUMBER_BASE + start_number
+
+    def _dates(self) -> tuple[date, date]:
+        birth_date = self.today - timedelta(days=self.rng.randint(365 * 17 + 5, 365 * 60))
+        earliest_enrollment = birth_date + timedelta(days=365 * 17 + 5)
+        latest_enrollment = min(self.today, birth_date + timedelta(days=365 * 45))
+        span = (latest_enrollment - earliest_enrollment).days
+        return birth_date, earliest_enrollment + timedelta(days=self.rng.randint(0, span))
+
+    def __iter__(self) -> Iterator[Student]:
+        number, document_number = self.start_number, self.first_document_number
+        while True:
+            birth_date, enrollment_date = self._dates()
+            yield Student(
+                first_name=self.rng.choice(FIRST_NAMES),
+                last_name=self.rng.choice(LAST_NAMES),
+                document_number=str(document_number),
+                document_type_id=self.rng.choice(self.document_type_ids),
+                birth_date=birth_date,
+                gender=self.rng.choice(GENDERS),
+                student_number=number,
+                enrollment_date=enrollment_date,
+                specialty_id=self.rng.choice(self.specialty_ids),
+            )
+            number += 1
+            document_number += 1
+
+    def generate(self, count: int) -> Iterator[Student]:
+        return islice(iter(self), count)
+
+
+def bulk_insert(students: Iterable[Student], batch_size: int = 10_000, progress=None) -> int:
+    """Insert with bulk_create, one transaction per batch. Returns rows written."""
+    written = 0
+    for batch in batched(students, batch_size, strict=False):
+        with transaction.atomic():
+            Student.objects.bulk_create(batch, batch_size=batch_size)
+        written += len(batch)
+        if progress:
+            progress(written)
+    return written
+
+
+def _copy_row(student: Student, now: str) -> list:
+    """One CSV row for COPY, in COPY_COLUMNS order."""
+    return [
+        student.first_name,
+        student.last_name,
+        student.document_number,
+        student.birth_date.isoformat(),
+        student.gender,
+        student.student_number,
+        student.enrollment_date.isoformat(),
+        student.document_type_id,
+        student.specialty_id,
+        "t",
+        now,
+        now,
+        student.version,
+    ]
+
+
+def copy_insert(students: Iterable[Student], batch_size: int = 50_000, progress=None) -> int:
+    """Insert through PostgreSQL COPY FROM STDIN, one transaction per batch."""
+    if connection.vendor != "postgresql":
+        raise ValueError("COPY is only available on PostgreSQL")
+
+    columns = ", ".join(COPY_COLUMNS)
+    sql = f"COPY {Student._meta.db_table} ({columns}) FROM STDIN WITH (FORMAT csv)"
+    written = 0
+    for batch in batched(students, batch_size, strict=False):
+        now = timezone.now().isoformat()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for student in batch:
+            writer.writerow(_copy_row(student, now))
+        buffer.seek(0)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.cursor.copy_expert(sql, buffer)
+        written += len(batch)
+        if progress:
+            progress(written)
+    return written
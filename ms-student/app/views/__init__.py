@@ -1,6 +1,7 @@
 from .base_viewset import BaseViewSet as BaseViewSet
 from .document_type import DocumentTypeViewSet as DocumentTypeViewSet
 from .health import health_check as health_check
+from .job import JobViewSet as JobViewSet
 from .student import StudentViewSet as StudentViewSet
 
-__all__ = ["BaseViewSet", "StudentViewSet", "DocumentTypeViewSet", "health_check"]
+__all__ = ["BaseViewSet", "StudentViewSet", "DocumentTypeViewSet", "JobViewSet", "health_check"]
@@ -1,47 +1,109 @@
-from rest_framework import status, viewsets
-from rest_framework.pagination import PageNumberPagination
+from rest_framework import serializers, status, viewsets
 from rest_framework.response import Response
 
+from app.utils.etag import (
+    collection_etag,
+    entity_etag,
+    expanded_etag,
+    if_match_etags,
+    if_none_match,
+    not_modified,
+)
+from app.utils.http_cache import HttpCachePolicyMixin
+from app.utils.pagination import ServicePagePagination
+from app.utils.server_timing import timed
 
-class BaseViewSet(viewsets.ViewSet):
+
+class BaseViewSet(HttpCachePolicyMixin, viewsets.ViewSet):
     serializer_class = None
     service_class = None
     entity_name = "Entity"
     paginate = False
+    # Surrogate keys (cache tags) of list responses and, given its id, of one entity's.
+    list_surrogate_key: str | None = None
+    entity_surrogate_keys = None
+    # Max SQL queries per action on a cold cache, enforced by tests and QueryBudgetMiddleware.
+    query_budgets: dict[str, int] = {}
+    # Related data list and retrieve can embed with ?expand=a,b; see expand().
+    expandable: tuple[str, ...] = ()
 
     def get_service(self):
         if not hasattr(self, '_service_instance'):
             self._service_instance = self.service_class()
         return self._service_instance
 
+    def serialize(self, instance, **kwargs):
+        with timed("serialize"):
+            return self.serializer_class(instance, **kwargs).data
+
+    def get_expand(self, request) -> set[str]:
+        requested = {
+            name
+            for value in request.query_params.getlist("expand")
+            for name in value.split(",")
+            if name
+        }
+        unknown = sorted(requested - set(self.expandable))
+        if unknown:
+            raise serializers.ValidationError(
+                {
+                    "expand": f"Unsupported: {', '.join(unknown)}. "
+                    f"Allowed: {', '.join(self.expandable) or 'none'}."
+                }
+            )
+        return requested
+
+    def expand(self, entities: list, expand: set[str]) -> dict:
+        """Related data of `entities` for `expand`, passed to the serializer as context."""
+        return {}
+
     def list(self, request):
-        entities = self.get_service().find_all()
+        expand = self.get_expand(request)
+        # Services expose list_generation(); the path carries page and page size.
+        etag = collection_etag(
+            self.entity_name.lower(), self.get_service().list_generation(), request.get_full_path()
+        )
+        if self.list_surrogate_key:
+            self.add_surrogate_keys(self.list_surrogate_key)
+        if not expand and if_none_match(request, etag):
+            return not_modified(etag)
         if self.paginate:
-            paginator = PageNumberPagination()
-            paginated_entities = paginator.paginate_queryset(entities, request)
-            serializer = self.serializer_class(paginated_entities, many=True)
-            return paginator.get_paginated_response(serializer.data)
-        serializer = self.serializer_class(entities, many=True)
-        return Response(serializer.data)
+            paginator = ServicePagePagination()
+            entities = paginator.paginate_service(self.get_service(), request)
+        else:
+            entities = self.get_service().find_all()
+        context = {}
+        if expand:
+            context = self.expand(entities, expand)
+            etag = expanded_etag(etag, context)
+            if if_none_match(request, etag):
+                return not_modified(etag)
+        data = self.serialize(entities, many=True, context=context)
+        response = paginator.get_paginated_response(data) if self.paginate else Response(data)
+        response["ETag"] = etag
+        return response
 
     def retrieve(self, request, pk=None):
+        expand = self.get_expand(request)
         entity = self.get_service().find_by_id(int(pk))
         if entity is None:
             return Response(
                 {"error": f"{self.entity_name} not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        serializer = self.serializer_class(entity)
-        return Response(serializer.data)
+        if self.entity_surrogate_keys:
+            self.add_surrogate_keys(*self.entity_surrogate_keys(entity.id))
+        context = self.expand([entity], expand) if expand else {}
+        etag = expanded_etag(entity_etag(entity), context)
+        if if_none_match(request, etag):
+            return not_modified(etag)
+        return Response(self.serialize(entity, context=context), headers={"ETag": etag})
 
     def create(self, request):
         serializer = self.serializer_class(data=request.data)
         serializer.is_valid(raise_exception=True)
         entity = self.get_service().create(serializer.validated_data)
-        return Response(
-            self.serializer_class(entity).data,
-            status=status.HTTP_201_CREATED
-        )
+        return Response(self.serialize(entity), status=status.HTTP_201_CREATED)
 
     def update(self, request, pk=None):
         entity = self.get_service().find_by_id(int(pk))
@@ -52,8 +114,12 @@ class BaseViewSet(viewsets.ViewSet):
             )
         serializer = self.serializer_class(entity, data=request.data)
         serializer.is_valid(raise_exception=True)
-        updated_entity = self.get_service().update(int(pk), serializer.validated_data)
-        return Response(self.serializer_class(updated_entity).data)
+        updated_entity = self.get_service().update(
+            int(pk), serializer.validated_data, if_match=if_match_etags(request)
+        )
+        return Response(
+            self.serialize(updated_entity), headers={"ETag": entity_etag(updated_entity)}
+        )
 
     def partial_update(self, request, pk=None):
         entity = self.get_service().find_by_id(int(pk))
@@ -64,8 +130,12 @@ class BaseViewSet(viewsets.ViewSet):
             )
         serializer = self.serializer_class(entity, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
-        updated_entity = self.get_service().update(int(pk), serializer.validated_data)
-        return Response(self.serializer_class(updated_entity).data)
+        updated_entity = self.get_service().update(
+            int(pk), serializer.validated_data, if_match=if_match_etags(request)
+        )
+        return Response(
+            self.serialize(updated_entity), headers={"ETag": entity_etag(updated_entity)}
+        )
 
     def destroy(self, request, pk=None):
         result = self.get_service().delete_by_id(int(pk))
@@ -3,22 +3,35 @@ from rest_framework.response import Response
 
 from app.serializers import DocumentTypeSerializer
 from app.services import DocumentTypeService
+from app.utils.cache import DOCUMENT_TYPE_LIST, document_type_tag
+from app.utils.etag import collection_etag, entity_etag, if_none_match, not_modified
+from app.utils.http_cache import HttpCachePolicyMixin
+from app.utils.server_timing import timed
 
 
 class DocumentTypeViewSet(
-    mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet
+    HttpCachePolicyMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet
 ):
 
     serializer_class = DocumentTypeSerializer
     service_class = DocumentTypeService
+    query_budgets = {"list": 1, "retrieve": 1}
+    cache_policies = {"list": "document_types", "retrieve": "document_types"}
 
     def get_queryset(self):
         return self.service_class().find_all()
 
     def list(self, request, *args, **kwargs):
+        self.add_surrogate_keys(DOCUMENT_TYPE_LIST)
+        etag = collection_etag(
+            "document_types", self.service_class().list_generation(), request.get_full_path()
+        )
+        if if_none_match(request, etag):
+            return not_modified(etag)
         queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        with timed("serialize"):
+            data = self.get_serializer(queryset, many=True).data
+        return Response(data, status=status.HTTP_200_OK, headers={"ETag": etag})
 
     def retrieve(self, request, *args, **kwargs):
         try:
@@ -28,7 +41,12 @@ class DocumentTypeViewSet(
                     {"error": "Document type not found"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
-            serializer = self.get_serializer(instance)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            self.add_surrogate_keys(document_type_tag(instance.id))
+            etag = entity_etag(instance)
+            if if_none_match(request, etag):
+                return not_modified(etag)
+            with timed("serialize"):
+                data = self.get_serializer(instance).data
+            return Response(data, status=status.HTTP_200_OK, headers={"ETag": etag})
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -3,6 +3,8 @@ from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
+from app.utils.cache_backend import ResilientRedisCache
+
 
 @api_view(["GET"])
 def health_check(request):
@@ -10,7 +12,8 @@ def health_check(request):
         with connection.cursor() as cursor:
             cursor.execute("SELECT 1")
         return Response(
-            {"status": "healthy", "database": "connected"},
+            # A degraded cache is reported but does not make the service unhealthy.
+            {"status": "healthy", "database": "connected", "cache": ResilientRedisCache.status()},
             status=status.HTTP_200_OK,
         )
     except Exception as e:
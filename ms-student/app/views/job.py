@@ -0,0 +1,40 @@
+from django.urls import reverse
+from rest_framework import status, viewsets
+from rest_framework.response import Response
+
+from app.serializers import JobSerializer
+from app.services import JobService
+from app.utils.server_timing import timed
+
+
+class JobViewSet(viewsets.ViewSet):
+    """
+    Background jobs. POST queues one and answers 202 with its Location; workers
+    (`manage.py run_jobs`) run it in chunks, and GET reports status and progress.
+    """
+
+    service_class = JobService
+    idempotent_actions = ("create",)
+    query_budgets = {"retrieve": 1, "create": 3}
+
+    def create(self, request):
+        serializer = JobSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        job = self.service_class().enqueue(
+            serializer.validated_data["kind"], serializer.validated_data["params"]
+        )
+        with timed("serialize"):
+            data = JobSerializer(job).data
+        return Response(
+            data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Location": reverse("job-detail", args=[job.id])},
+        )
+
+    def retrieve(self, request, pk=None):
+        job = self.service_class().find_by_id(int(pk))
+        if job is None:
+            return Response({"error": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
+        with timed("serialize"):
+            data = JobSerializer(job).data
+        return Response(data)
@@ -1,5 +1,18 @@
-from app.serializers import StudentSerializer
-from app.services import StudentService
+from django.conf import settings
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from app.serializers import (
+    StudentBulkUpdateSerializer,
+    StudentChangeSerializer,
+    StudentExistsQuerySerializer,
+    StudentLookupSerializer,
+    StudentSerializer,
+)
+from app.services import DocumentTypeService, SpecialtyService, StudentService
+from app.utils.cache import STUDENT_LIST, student_entry_tags
+from app.utils.server_timing import timed
 from app.views.base_viewset import BaseViewSet
 
 
@@ -8,3 +21,98 @@ class StudentViewSet(BaseViewSet):
     service_class = StudentService
     entity_name = "Student"
     paginate = True
+    idempotent_actions = ("create", "bulk_update")
+    cache_policies = {"list": "students", "retrieve": "students", "exists": "student_exists"}
+    list_surrogate_key = STUDENT_LIST
+    entity_surrogate_keys = staticmethod(student_entry_tags)
+    query_budgets = {
+        "list": 2,
+        "retrieve": 1,
+        "create": 7,
+        "update": 8,
+        "partial_update": 6,
+        "destroy": 4,
+        "changes": 1,
+        "lookup": 3,
+        "exists": 3,
+        "bulk_update": 5,
+    }
+    expandable = ("specialty", "document_type")
+
+    def expand(self, students, expand):
+        context = {}
+        if "specialty" in expand:
+            # One cache read and at most one concurrent fan-out per page.
+            context["specialties"] = SpecialtyService().find_by_ids(
+                student.specialty_id for student in students
+            )
+        if "document_type" in expand:
+            context["document_types"] = DocumentTypeService().snapshot()
+        return context
+
+    @action(detail=False, methods=["get"])
+    def changes(self, request):
+        try:
+            limit = serializers.IntegerField(
+                min_value=1, max_value=settings.CHANGE_FEED_MAX_LIMIT
+            ).run_validation(request.query_params.get("limit", 100))
+        except serializers.ValidationError as e:
+            raise serializers.ValidationError({"limit": e.detail}) from e
+        students, next_cursor = self.get_service().find_changes(
+            request.query_params.get("since"), limit
+        )
+        with timed("serialize"):
+            results = StudentChangeSerializer(students, many=True).data
+        return Response(
+            {"results": results, "next_cursor": next_cursor, "has_more": len(students) == limit}
+        )
+
+    @action(detail=False, methods=["post"])
+    def lookup(self, request):
+        serializer = StudentLookupSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        service = self.get_service()
+        response = {}
+        # Keyed by the identifiers as sent; unknown ones map to null.
+        for field, find in (
+            ("ids", service.find_by_ids),
+            ("student_numbers", service.find_by_student_numbers),
+        ):
+            if field in serializer.validated_data:
+                found = find(serializer.validated_data[field])
+                response[field] = {
+                    str(identifier): (
+                        self.serialize(found[identifier]) if identifier in found else None
+                    )
+                    for identifier in serializer.validated_data[field]
+                }
+        return Response(response)
+
+    @action(detail=False, methods=["get"])
+    def exists(self, request):
+        """
+        Booleans only: {"id": {"7": true}, "document_number": {"123": false}}. HEAD (routed
+        here by DRF) answers 200 when every value exists and 404 otherwise.
+        """
+        serializer = StudentExistsQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        service = self.get_service()
+        results = {
+            field: {str(value): exists for value, exists in service.exists(field, values).items()}
+            for field, values in serializer.validated_data.items()
+        }
+        if request.method == "HEAD":
+            found = all(exists for answers in results.values() for exists in answers.values())
+            return Response(status=status.HTTP_200_OK if found else status.HTTP_404_NOT_FOUND)
+        return Response(results)
+
+    @action(detail=False, methods=["patch"], url_path="bulk")
+    def bulk_update(self, request):
+        """{"ids": [...]} or {"filter": {"specialty_id": 3}}, plus {"changes": {...}}."""
+        serializer = StudentBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        updated = self.get_service().bulk_update(
+            data["changes"], ids=data.get("ids"), filters=data.get("filter")
+        )
+        return Response({"updated": updated})
@@ -0,0 +1,132 @@
+"""
+Compare cache codecs on the values the services actually cache.
+
+    uv run python -m benchmarks.codec
+    uv run python -m benchmarks.codec --page-size 100 --iterations 2000 --output codec.json
+
+"pickle+zlib" is the previous setup (django-redis PickleSerializer + ZlibCompressor, which
+compresses anything over 15 bytes); "compact" is app.utils.cache_codec with its size
+threshold. For each value the encoded size and the encode/decode time per call (what a
+cache set/get pays on top of the Redis round trip) are reported. No database is needed.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=100, help="Students per cached list page")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--output", help="Write JSON here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def make_codecs():
+    from django_redis.compressors.zlib import ZlibCompressor
+    from django_redis.serializers.pickle import PickleSerializer
+
+    from app.utils.cache_codec import CompactSerializer, ThresholdZlibCompressor
+
+    return {
+        "pickle+zlib": (PickleSerializer({}), ZlibCompressor({})),
+        "compact": (CompactSerializer({}), ThresholdZlibCompressor({})),
+    }
+
+
+def make_values(page_size: int) -> dict:
+    from app.models import DocumentType, Student
+
+    now = datetime(2024, 3, 1, 12, 0, tzinfo=UTC)
+    document_type = DocumentType(id=1, name="DNI", description="Documento Nacional de Identidad")
+    document_type.created_at = document_type.updated_at = now
+
+    def student(i: int) -> Student:
+        s = Student(
+            id=i,
+            first_name="Juan",
+            last_name=f"Pérez {i}",
+            document_number=f"{30000000 + i}",
+            document_type_id=1,
+            birth_date=date(2000, 5, 15),
+            gender="M",
+            student_number=100000 + i,
+            enrollment_date=date(2020, 3, 1),
+            specialty_id=1 + i % 10,
+        )
+        s.created_at = s.updated_at = now
+        return s
+
+    stamp = (1709294400000000,)
+    return {
+        "student": (stamp, student(1)),
+        "students_page": (stamp, ([student(i) for i in range(1, page_size + 1)], 10_000)),
+        "document_type": (stamp, document_type),
+    }
+
+
+def measure(serializer, compressor, value, iterations: int) -> dict:
+    encoded = compressor.compress(serializer.dumps(value))
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        compressor.compress(serializer.dumps(value))
+    encode = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        try:
+            raw = compressor.decompress(encoded)
+        except Exception:
+            raw = encoded
+        serializer.loads(raw)
+    decode = (time.perf_counter() - start) / iterations
+
+    return {
+        "bytes": len(encoded),
+        "encode_us": round(encode * 1e6, 2),
+        "decode_us": round(decode * 1e6, 2),
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    import django
+
+    django.setup()
+
+    values = make_values(args.page_size)
+    results = {
+        name: {
+            codec: measure(serializer, compressor, value, args.iterations)
+            for codec, (serializer, compressor) in make_codecs().items()
+        }
+        for name, value in values.items()
+    }
+
+    lines = [f"{'value':<16}{'codec':<14}{'bytes':>8}{'encode µs':>12}{'decode µs':>12}"]
+    for name, codecs in results.items():
+        for codec, row in codecs.items():
+            lines.append(
+                f"{name:<16}{codec:<14}{row['bytes']:>8}{row['encode_us']:>12.2f}{row['decode_us']:>12.2f}"
+            )
+    print("\n".join(lines), file=sys.stderr)
+
+    report = json.dumps(
+        {"meta": {"page_size": args.page_size, "iterations": args.iterations}, "results": results},
+        indent=2,
+    )
+    if args.output:
+        Path(args.output).write_text(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Compare two benchmark reports produced by benchmarks.run.
+
+    uv run python -m benchmarks.compare baseline.json candidate.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+def load(path: str) -> dict:
+    return json.loads(Path(path).read_text())
+
+
+def _skipped(result: dict) -> bool:
+    # benchmarks.run reports {"skipped": reason} for actions it could not time.
+    return "skipped" in result or any(metric not in result for metric in METRICS)
+
+
+def compare(baseline: dict, candidate: dict) -> list[str]:
+    lines = [
+        f"baseline {baseline['meta'].get('commit')} vs candidate {candidate['meta'].get('commit')}",
+        f"{'action':<26}" + "".join(f"{metric:>22}" for metric in METRICS),
+    ]
+    for action, before in baseline["results"].items():
+        after = candidate["results"].get(action)
+        if after is None:
+            continue
+        if _skipped(before) or _skipped(after):
+            reason = before.get("skipped") or after.get("skipped") or "no timings"
+            lines.append(f"{action:<26}skipped: {reason}")
+            continue
+        cells = []
+        for metric in METRICS:
+            change = (
+                (after[metric] - before[metric]) / before[metric] * 100 if before[metric] else 0.0
+            )
+            cells.append(f"{before[metric]:>7.2f} → {after[metric]:>7.2f} {change:+5.0f}%")
+        lines.append(f"{action:<26}" + "".join(f"{cell:>22}" for cell in cells))
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark JSON reports")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    args = parser.parse_args(argv)
+    print("\n".join(compare(load(args.baseline), load(args.candidate))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Local stand-in for the academic service's /especialidades/{id} endpoint.
+
+    uv run python -m benchmarks.fake_academic --port 8080 --latency-ms 40 --jitter-ms 20 --failure-rate 0.05
+
+Point the student service at it with ACADEMIC_SERVICE_URL=http://localhost:8080. Latency,
+failure and timeout rates can be changed while a load test runs, to watch the circuit
+breaker open and recover:
+
+    curl -X PUT localhost:8080/__config -d '{"failure_rate": 1.0}'
+    curl localhost:8080/__stats
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SPECIALTY_PATH = re.compile(r"^/especialidades/(\d+)/?$")
+
+
+@dataclass
+class FaultConfig:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    failure_rate: float = 0.0
+    failure_status: int = 503
+    timeout_rate: float = 0.0
+    timeout_seconds: float = 10.0
+    specialties: int = 10
+
+
+class FakeAcademicState:
+    def __init__(self, config: FaultConfig, seed: int | None = None):
+        self.config = config
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "ok": 0, "not_found": 0, "failures": 0, "timeouts": 0}
+
+    def record(self, outcome: str):
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats[outcome] += 1
+
+    def update(self, changes: dict):
+        with self.lock:
+            for key, value in changes.items():
+                if not hasattr(self.config, key):
+                    raise ValueError(f"Unknown setting {key}")
+                setattr(self.config, key, type(getattr(self.config, key))(value))
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {"config": asdict(self.config), "stats": dict(self.stats)}
+
+    def draw(self) -> tuple[float, float]:
+        with self.lock:
+            return self.rng.random(), self.rng.uniform(-1.0, 1.0)
+
+
+def make_handler(state: FakeAcademicState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status: int, body: dict):
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            if self.path == "/__stats":
+                return self._send_json(200, state.snapshot())
+
+            match = SPECIALTY_PATH.match(self.path)
+            if not match:
+                return self._send_json(404, {"detail": "Not found"})
+
+            config = state.config
+            roll, jitter = state.draw()
+            time.sleep(max(0.0, config.latency_ms + jitter * config.jitter_ms) / 1000)
+
+            if roll < config.timeout_rate:
+                state.record("timeouts")
+                time.sleep(config.timeout_seconds)
+                return self._send_json(504, {"detail": "Simulated timeout"})
+            if roll < config.timeout_rate + config.failure_rate:
+                state.record("failures")
+                return self._send_json(config.failure_status, {"detail": "Simulated failure"})
+
+            specialty_id = int(match.group(1))
+            if not 1 <= specialty_id <= config.specialties:
+                state.record("not_found")
+                return self._send_json(404, {"detail": "Especialidad no encontrada"})
+
+            state.record("ok")
+            return self._send_json(
+                200, {"id": specialty_id, "nombre": f"Especialidad {specialty_id}"}
+            )
+
+        def do_PUT(self):
+            if self.path != "/__config":
+                return self._send_json(404, {"detail": "Not found"})
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                state.update(json.loads(self.rfile.read(length) or b"{}"))
+            except (ValueError, TypeError) as e:
+                return self._send_json(400, {"detail": str(e)})
+            return self._send_json(200, state.snapshot())
+
+    return Handler
+
+
+def make_server(host: str, port: int, config: FaultConfig, seed: int | None = None):
+    state = FakeAcademicState(config, seed=seed)
+    server = ThreadingHTTPServer((host, port), make_handler(state))
+    server.daemon_threads = True
+    server.state = state
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fake academic service for load tests")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.0, help="Fraction answered with --failure-status"
+    )
+    parser.add_argument("--failure-status", type=int, default=503)
+    parser.add_argument(
+        "--timeout-rate", type=float, default=0.0, help="Fraction that hang for --timeout-seconds"
+    )
+    parser.add_argument("--timeout-seconds", type=float, default=10.0)
+    parser.add_argument(
+        "--specialties", type=int, default=10, help="IDs 1..N exist, the rest are 404"
+    )
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    config = FaultConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+        timeout_rate=args.timeout_rate,
+        timeout_seconds=args.timeout_seconds,
+        specialties=args.specialties,
+    )
+    server = make_server(args.host, args.port, config, seed=args.seed)
+    print(f"Fake academic service on http://{args.host}:{args.port} {asdict(config)}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
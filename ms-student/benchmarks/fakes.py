@@ -0,0 +1,13 @@
+class FakeAcademicServiceClient:
+    """In-process stand-in for AcademicServiceClient so benchmarks never leave the process."""
+
+    def __init__(self, specialty_ids=range(1, 11)):
+        self.specialty_ids = set(specialty_ids)
+
+    def validate_specialty(self, specialty_id: int) -> bool:
+        return specialty_id in self.specialty_ids
+
+    def get_specialty(self, specialty_id: int) -> dict | None:
+        if specialty_id not in self.specialty_ids:
+            return None
+        return {"id": specialty_id, "nombre": f"Especialidad {specialty_id}"}
@@ -0,0 +1,157 @@
+// Mixed read/write load test for the student service.
+//
+//   python -m benchmarks.fake_academic --port 8080 --latency-ms 40 --jitter-ms 20 &
+//   ACADEMIC_SERVICE_URL=http://localhost:8080 gunicorn --workers 4 config.wsgi:application &
+//   k6 run -e BASE_URL=http://localhost:8000 -e VUS=50 -e DURATION=60s benchmarks/load_test.js
+//
+// Each iteration picks one operation according to WEIGHTS. The summary reports throughput,
+// p50/p95/p99 and error counts per endpoint (and writes them to SUMMARY_FILE as JSON).
+import http from 'k6/http';
+import { check } from 'k6';
+import { Counter, Trend } from 'k6/metrics';
+
+const BASE_URL = __ENV.BASE_URL || 'http://localhost:8000';
+const SPECIALTIES = parseInt(__ENV.SPECIALTIES || '10', 10);
+const SUMMARY_FILE = __ENV.SUMMARY_FILE || 'load_test_summary.json';
+
+const WEIGHTS = {
+    'students.list': 25,
+    'students.retrieve': 40,
+    'students.create': 12,
+    'students.partial_update': 10,
+    'students.destroy': 3,
+    'document_types.list': 5,
+    'document_types.retrieve': 5,
+};
+
+const ENDPOINTS = Object.keys(WEIGHTS);
+const latency = {};
+const errors = {};
+for (const name of ENDPOINTS) {
+    latency[name] = new Trend(`latency_${name.replace('.', '_')}`, true);
+    errors[name] = new Counter(`errors_${name.replace('.', '_')}`);
+}
+
+export const options = {
+    scenarios: {
+        mixed: {
+            executor: 'constant-vus',
+            vus: parseInt(__ENV.VUS || '20', 10),
+            duration: __ENV.DURATION || '30s',
+        },
+    },
+    summaryTrendStats: ['avg', 'med', 'p(95)', 'p(99)', 'max', 'count'],
+};
+
+const JSON_PARAMS = { headers: { 'Content-Type': 'application/json' } };
+
+export function setup() {
+    const students = http.get(`${BASE_URL}/api/v1/students/`).json('results') || [];
+    const documentTypes = http.get(`${BASE_URL}/api/v1/document-types/`).json() || [];
+    return {
+        studentIds: students.map((s) => s.id),
+        documentTypeIds: documentTypes.map((d) => d.id),
+    };
+}
+
+function pick(items) {
+    return items[Math.floor(Math.random() * items.length)];
+}
+
+function pickEndpoint() {
+    const total = ENDPOINTS.reduce((sum, name) => sum + WEIGHTS[name], 0);
+    let roll = Math.random() * total;
+    for (const name of ENDPOINTS) {
+        roll -= WEIGHTS[name];
+        if (roll < 0) return name;
+    }
+    return ENDPOINTS[0];
+}
+
+function newStudent(documentTypeIds) {
+    const unique = Date.now() * 1000 + Math.floor(Math.random() * 1000);
+    return JSON.stringify({
+        first_name: 'Carga',
+        last_name: 'Prueba',
+        document_number: `LT${unique}`,
+        document_type_id: pick(documentTypeIds),
+        birth_date: '2000-01-15',
+        gender: 'O',
+        student_number: unique % 2000000000,
+        enrollment_date: '2019-03-01',
+        specialty_id: 1 + Math.floor(Math.random() * SPECIALTIES),
+    });
+}
+
+const created = [];
+
+function request(name, data) {
+    let res;
+    switch (name) {
+        case 'students.list':
+            res = http.get(`${BASE_URL}/api/v1/students/?page=${1 + Math.floor(Math.random() * 5)}`);
+            break;
+        case 'students.retrieve':
+            res = http.get(`${BASE_URL}/api/v1/students/${pick(data.studentIds)}/`);
+            break;
+        case 'students.create':
+            res = http.post(`${BASE_URL}/api/v1/students/`, newStudent(data.documentTypeIds), JSON_PARAMS);
+            if (res.status === 201) created.push(res.json('id'));
+            break;
+        case 'students.partial_update': {
+            const id = created.length ? pick(created) : pick(data.studentIds);
+            res = http.patch(`${BASE_URL}/api/v1/students/${id}/`, JSON.stringify({ last_name: 'Actualizado' }), JSON_PARAMS);
+            break;
+        }
+        case 'students.destroy':
+            if (!created.length) return null;
+            res = http.del(`${BASE_URL}/api/v1/students/${created.pop()}/`);
+            break;
+        case 'document_types.list':
+            res = http.get(`${BASE_URL}/api/v1/document-types/`);
+            break;
+        case 'document_types.retrieve':
+            res = http.get(`${BASE_URL}/api/v1/document-types/${pick(data.documentTypeIds)}/`);
+            break;
+    }
+    return res;
+}
+
+export default function (data) {
+    const name = pickEndpoint();
+    const res = request(name, data);
+    if (!res) return;
+    latency[name].add(res.timings.duration);
+    // 4xx from validation (e.g. unknown specialty) is expected; 5xx is not.
+    if (!check(res, { 'no server error': (r) => r.status < 500 })) {
+        errors[name].add(1);
+    }
+}
+
+export function handleSummary(data) {
+    const seconds = data.state.testRunDurationMs / 1000;
+    const report = {};
+    const lines = [`${'endpoint'.padEnd(26)}${'req/s'.padStart(9)}${'p50'.padStart(9)}${'p95'.padStart(9)}${'p99'.padStart(9)}${'5xx'.padStart(7)}`];
+    for (const name of ENDPOINTS) {
+        const trend = data.metrics[`latency_${name.replace('.', '_')}`];
+        if (!trend) continue;
+        const errorMetric = data.metrics[`errors_${name.replace('.', '_')}`];
+        const row = {
+            requests: trend.values.count,
+            throughput_rps: trend.values.count / seconds,
+            p50_ms: trend.values.med,
+            p95_ms: trend.values['p(95)'],
+            p99_ms: trend.values['p(99)'],
+            server_errors: errorMetric ? errorMetric.values.count : 0,
+        };
+        report[name] = row;
+        lines.push(
+            `${name.padEnd(26)}${row.throughput_rps.toFixed(1).padStart(9)}${row.p50_ms.toFixed(1).padStart(9)}` +
+            `${row.p95_ms.toFixed(1).padStart(9)}${row.p99_ms.toFixed(1).padStart(9)}${String(row.server_errors).padStart(7)}`
+        );
+    }
+    return {
+        stdout: `\n${lines.join('\n')}\n`,
+        [SUMMARY_FILE]: JSON.stringify({ duration_s: seconds, endpoints: report }, null, 2),
+    };
+}
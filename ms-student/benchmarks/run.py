@@ -0,0 +1,269 @@
+"""
+Benchmark the student service hot paths through the Django test client.
+
+    uv run python -m benchmarks.run --students 10000 --database sqlite
+    uv run python -m benchmarks.run --students 1000000 --database postgres --output results.json
+
+Every StudentViewSet and DocumentTypeViewSet action is timed end to end (URL routing,
+DRF, services, cache and database). The academic service is replaced by an in-process
+fake so network latency never shows up in the numbers. Results are printed as JSON with
+p50/p95/p99 per action, tagged with the current git commit for cross-commit comparison.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+CACHE_BACKENDS = {
+    "locmem": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "dummy": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, default=10_000, help="Rows to seed (10k-1M)")
+    parser.add_argument("--database", choices=["sqlite", "postgres"], default="sqlite")
+    parser.add_argument(
+        "--sqlite-path",
+        default="benchmarks/bench.sqlite3",
+        help="SQLite file, relative to ms-student",
+    )
+    parser.add_argument(
+        "--cache",
+        choices=["redis", *CACHE_BACKENDS],
+        default="redis",
+        help="redis uses CACHES from settings; locmem/dummy isolate the database cost",
+    )
+    parser.add_argument("--iterations", type=int, default=200, help="Timed requests per action")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed requests per action")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write JSON here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def configure_django(args):
+    if args.database == "sqlite":
+        os.environ["DB_ENGINE"] = "django.db.backends.sqlite3"
+        os.environ["DB_NAME"] = args.sqlite_path
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+    import django
+
+    django.setup()
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    # Nearest-rank, so p99 of 200 samples is an actual observed latency.
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples: list[float]) -> dict:
+    values = sorted(sample * 1000 for sample in samples)
+    return {
+        "n": len(values),
+        "mean_ms": round(sum(values) / len(values), 3),
+        "min_ms": round(values[0], 3),
+        "p50_ms": round(percentile(values, 0.50), 3),
+        "p95_ms": round(percentile(values, 0.95), 3),
+        "p99_ms": round(percentile(values, 0.99), 3),
+        "max_ms": round(values[-1], 3),
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+class Benchmark:
+    # Actions that reuse the students added by students_create.
+    NEEDS_CREATED = {"students_update", "students_partial_update"}
+
+    def __init__(self, args):
+        from django.test import Client
+
+        from app.models import DocumentType, Student
+
+        self.args = args
+        self.client = Client()
+        self.rng = random.Random(args.seed)
+        self.student_ids = list(Student.objects.values_list("id", flat=True)[:10_000])
+        self.document_type_ids = list(DocumentType.objects.values_list("id", flat=True))
+        self.page_count = max(1, Student.objects.count() // 100)
+        self.next_number = (
+            Student.objects.order_by("-student_number")
+            .values_list("student_number", flat=True)
+            .first()
+            or 0
+        ) + 1_000_000
+        self.created: list[tuple[int, dict]] = []
+
+    def _student_payload(self, number: int) -> dict:
+        return {
+            "first_name": "Benchmark",
+            "last_name": "Student",
+            "document_number": f"B{number}",
+            "document_type_id": self.rng.choice(self.document_type_ids),
+            "birth_date": "2000-01-15",
+            "gender": "F",
+            "student_number": number,
+            "enrollment_date": "2019-03-01",
+            "specialty_id": 1,
+        }
+
+    def _json(self, method: str, url: str, payload: dict):
+        return getattr(self.client, method)(
+            url, json.dumps(payload), content_type="application/json"
+        )
+
+    def students_list(self, _i):
+        return self.client.get(
+            "/api/v1/students/", {"page": self.rng.randint(1, min(self.page_count, 10))}
+        )
+
+    def students_retrieve(self, _i):
+        return self.client.get(f"/api/v1/students/{self.rng.choice(self.student_ids)}/")
+
+    def students_create(self, _i):
+        self.next_number += 1
+        payload = self._student_payload(self.next_number)
+        response = self._json("post", "/api/v1/students/", payload)
+        if response.status_code == 201:
+            self.created.append((response.json()["id"], payload))
+        return response
+
+    def students_update(self, i):
+        student_id, payload = self.created[i % len(self.created)]
+        payload = {**payload, "first_name": "Updated" if i % 2 else "Benchmark"}
+        return self._json("put", f"/api/v1/students/{student_id}/", payload)
+
+    def students_partial_update(self, i):
+        student_id, _payload = self.created[i % len(self.created)]
+        last_name = "Patched" if i % 2 else "Student"
+        return self._json("patch", f"/api/v1/students/{student_id}/", {"last_name": last_name})
+
+    def students_destroy(self, _i):
+        student_id, _payload = self.created.pop()
+        return self.client.delete(f"/api/v1/students/{student_id}/")
+
+    def document_types_list(self, _i):
+        return self.client.get("/api/v1/document-types/")
+
+    def document_types_retrieve(self, _i):
+        return self.client.get(f"/api/v1/document-types/{self.rng.choice(self.document_type_ids)}/")
+
+    def run_action(self, name: str, iterations: int, warmup: int) -> dict:
+        action = getattr(self, name)
+        for i in range(warmup):
+            action(i)
+        samples, errors = [], 0
+        for i in range(iterations):
+            start = time.perf_counter()
+            response = action(i)
+            samples.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+        return {**summarize(samples), "errors": errors}
+
+    def run(self) -> dict:
+        # Order matters: creates feed the update/delete actions, deletes clean up last.
+        actions = {
+            "students.list": "students_list",
+            "students.retrieve": "students_retrieve",
+            "students.create": "students_create",
+            "students.update": "students_update",
+            "students.partial_update": "students_partial_update",
+            "document_types.list": "document_types_list",
+            "document_types.retrieve": "document_types_retrieve",
+        }
+        skipped = {"skipped": "every students.create request failed"}
+        results = {}
+        for label, name in actions.items():
+            if name in self.NEEDS_CREATED and not self.created:
+                results[label] = skipped
+            else:
+                results[label] = self.run_action(name, self.args.iterations, self.args.warmup)
+        if self.created:
+            results["students.destroy"] = self.run_action("students_destroy", len(self.created), 0)
+        else:
+            results["students.destroy"] = skipped
+            sys.stderr.write(
+                "students.create failed on every request; skipped update, partial_update "
+                "and destroy\n"
+            )
+        return results
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure_django(args)
+
+    from unittest.mock import patch
+
+    import django
+    from django.conf import settings
+    from django.core.cache import cache
+    from django.test.utils import override_settings
+
+    from benchmarks.fakes import FakeAcademicServiceClient
+    from benchmarks.seed import ensure_schema, seed_students
+
+    overrides = {
+        "DEBUG": False,
+        "ALLOWED_HOSTS": ["testserver"],
+        "SECURE_SSL_REDIRECT": False,
+        "QUERY_BUDGET_ENABLED": False,
+        "SERVER_TIMING_ENABLED": False,
+    }
+    if args.cache != "redis":
+        overrides["CACHES"] = {"default": CACHE_BACKENDS[args.cache]}
+
+    with (
+        override_settings(**overrides),
+        patch("app.services.student.academic_service_client", FakeAcademicServiceClient()),
+    ):
+        ensure_schema()
+        seed_start = time.perf_counter()
+        seeded = seed_students(args.students, seed=args.seed)
+        seed_seconds = time.perf_counter() - seed_start
+        cache.clear()
+        results = Benchmark(args).run()
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(UTC).isoformat(),
+            "students": args.students,
+            "seeded_rows": seeded,
+            "seed_seconds": round(seed_seconds, 2),
+            "database": settings.DATABASES["default"]["ENGINE"],
+            "cache": args.cache,
+            "iterations": args.iterations,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import io
+
+from django.apps import apps
+from django.core.management import call_command
+from django.db import connection
+
+from app.models import Student
+
+
+def ensure_schema():
+    """Create the app's tables directly when they are missing (migrations are not versioned)."""
+    existing = set(connection.introspection.table_names())
+    with connection.schema_editor() as editor:
+        for model in apps.get_app_config("app").get_models():
+            if model._meta.db_table not in existing:
+                editor.create_model(model)
+
+
+def seed_students(count: int, seed: int = 42, specialties: int = 10) -> int:
+    """Top the students table up to `count` rows with deterministic data; returns rows added."""
+    missing = count - Student.objects.count()
+    if missing <= 0:
+        return 0
+    call_command(
+        "generate_students",
+        missing,
+        seed=seed,
+        specialties=f"1-{specialties}",
+        stdout=io.StringIO(),
+    )
+    return missing
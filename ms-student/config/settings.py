@@ -30,6 +30,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "app.middleware.DeadlineMiddleware",
+    "app.middleware.ServerTimingMiddleware",
+    "app.middleware.QueryBudgetMiddleware",
+    "app.middleware.IdempotencyMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -125,17 +129,30 @@ REST_FRAMEWORK = {
 }
 
 
-# Django cache configuration - Redis for distributed caching
+# Django cache configuration - Redis for distributed caching. The backend fails open:
+# when Redis errors or times out it trips its own breaker and serves from a small
+# in-process LRU, so a Redis incident degrades hit rate instead of returning 500s.
+CACHE_SOCKET_TIMEOUT = float(os.getenv("CACHE_SOCKET_TIMEOUT", "0.25"))
+CACHE_BREAKER_FAIL_MAX = int(os.getenv("CACHE_BREAKER_FAIL_MAX", "5"))
+CACHE_BREAKER_RESET_TIMEOUT = int(os.getenv("CACHE_BREAKER_RESET_TIMEOUT", "30"))
+CACHE_FALLBACK_MAX_ENTRIES = int(os.getenv("CACHE_FALLBACK_MAX_ENTRIES", "1000"))
+CACHE_FALLBACK_TIMEOUT = int(os.getenv("CACHE_FALLBACK_TIMEOUT", "60"))
+# Compact field-tuple codec (app/utils/cache_codec.py); set to
+# django_redis.serializers.pickle.PickleSerializer to go back to pickles.
+CACHE_SERIALIZER = os.getenv("CACHE_SERIALIZER", "app.utils.cache_codec.CompactSerializer")
+CACHE_COMPRESS_MIN_BYTES = int(os.getenv("CACHE_COMPRESS_MIN_BYTES", "1024"))
+
 CACHES = {
     "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
+        "BACKEND": "app.utils.cache_backend.ResilientRedisCache",
         "LOCATION": f"redis://{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', '6379')}/0",
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
             "CONNECTION_POOL_KWARGS": {"max_connections": 50},
-            "SOCKET_CONNECT_TIMEOUT": 5,
-            "SOCKET_TIMEOUT": 5,
-            "COMPRESSOR": "django_redis.compressors.zlib.ZlibCompressor",
+            "SOCKET_CONNECT_TIMEOUT": CACHE_SOCKET_TIMEOUT,
+            "SOCKET_TIMEOUT": CACHE_SOCKET_TIMEOUT,
+            "SERIALIZER": CACHE_SERIALIZER,
+            "COMPRESSOR": "app.utils.cache_codec.ThresholdZlibCompressor",
             "IGNORE_EXCEPTIONS": False,
         },
         "KEY_PREFIX": "sysacad",
@@ -143,6 +160,114 @@ CACHES = {
     }
 }
 
+# Cache warm-up (manage.py warm_cache, and from each web worker at startup when enabled;
+# one worker per WARMUP_LOCK_TIMEOUT actually runs it). Rows per second are capped so the
+# warm-up is not a load spike itself. A sample of student reads feeds the "most-read" list.
+CACHE_WARMUP_ON_STARTUP = os.getenv("CACHE_WARMUP_ON_STARTUP", "False") == "True"
+CACHE_WARMUP_PAGES = int(os.getenv("CACHE_WARMUP_PAGES", "5"))
+CACHE_WARMUP_TOP_STUDENTS = int(os.getenv("CACHE_WARMUP_TOP_STUDENTS", "1000"))
+CACHE_WARMUP_RATE = float(os.getenv("CACHE_WARMUP_RATE", "500"))
+CACHE_READ_SAMPLE_RATE = float(os.getenv("CACHE_READ_SAMPLE_RATE", "0.05"))
+
+# Write-through: after a student is created or updated, the saved row is put in the
+# cache on commit instead of only invalidating it, so the next read is a hit.
+CACHE_WRITE_THROUGH = os.getenv("CACHE_WRITE_THROUGH", "False") == "True"
+
+# Server-Timing breakdown (db, cache, academic, serialize, render). Either on for every
+# request, or only for requests carrying X-Server-Timing-Token with this value.
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "False") == "True"
+SERVER_TIMING_TOKEN = os.getenv("SERVER_TIMING_TOKEN", "")
+
+# Per-action query budgets (`query_budgets` on the viewsets). Logs offending SQL when
+# exceeded; meant for development, so it follows DEBUG unless set explicitly.
+QUERY_BUDGET_ENABLED = os.getenv("QUERY_BUDGET_ENABLED", str(DEBUG)) == "True"
+
+# Change feed (/api/v1/students/changes/): rows younger than this are not served yet so
+# in-flight transactions cannot commit behind an already issued cursor.
+CHANGE_FEED_SETTLE_SECONDS = float(os.getenv("CHANGE_FEED_SETTLE_SECONDS", "2"))
+CHANGE_FEED_MAX_LIMIT = int(os.getenv("CHANGE_FEED_MAX_LIMIT", "1000"))
+
+# Batch reads (POST /api/v1/students/lookup/, GET /api/v1/students/exists/): max
+# identifiers per request
+STUDENT_LOOKUP_MAX_ITEMS = int(os.getenv("STUDENT_LOOKUP_MAX_ITEMS", "500"))
+# Bulk update (PATCH /api/v1/students/bulk/): max students one request may change
+STUDENT_BULK_MAX_ROWS = int(os.getenv("STUDENT_BULK_MAX_ROWS", "50000"))
+# Cache-Control max-age (seconds) of existence answers, for peer services and proxies
+STUDENT_EXISTS_MAX_AGE = int(os.getenv("STUDENT_EXISTS_MAX_AGE", "30"))
+# ?expand=specialty: academic service requests in flight at once for a page's specialties
+SPECIALTY_FETCH_CONCURRENCY = int(os.getenv("SPECIALTY_FETCH_CONCURRENCY", "8"))
+
+# HTTP caching for an edge cache in front of the API. Viewsets map actions to these
+# policies (`cache_policies`); responses also carry their cache tags in
+# SURROGATE_KEY_HEADER. Clients revalidate with ETags (max-age); shared caches keep
+# responses for s-maxage unless purged. When EDGE_PURGE_URL is set, every invalidated
+# tag is queued in Redis after the write commits and `manage.py purge_edge` POSTs the
+# queue there as {"surrogate_keys": [...]}, up to EDGE_PURGE_BATCH_SIZE keys per request,
+# every EDGE_PURGE_INTERVAL seconds.
+HTTP_CACHE_POLICIES = {
+    "document_types": {
+        "cache_control": {
+            "public": True,
+            "max_age": int(os.getenv("DOCUMENT_TYPES_MAX_AGE", "3600")),
+            "s_maxage": int(os.getenv("DOCUMENT_TYPES_EDGE_MAX_AGE", "86400")),
+        },
+        "vary": ["Accept"],
+    },
+    "students": {
+        "cache_control": {
+            "public": True,
+            "max_age": 0,
+            "s_maxage": int(os.getenv("STUDENTS_EDGE_MAX_AGE", "60")),
+        },
+        "vary": ["Accept"],
+    },
+    "student_exists": {
+        "cache_control": {"max_age": STUDENT_EXISTS_MAX_AGE},
+        "vary": ["Accept"],
+    },
+}
+SURROGATE_KEY_HEADER = os.getenv("SURROGATE_KEY_HEADER", "Surrogate-Key")
+EDGE_PURGE_URL = os.getenv("EDGE_PURGE_URL", "")
+EDGE_PURGE_TIMEOUT = float(os.getenv("EDGE_PURGE_TIMEOUT", "1"))
+EDGE_PURGE_BATCH_SIZE = int(os.getenv("EDGE_PURGE_BATCH_SIZE", "500"))
+EDGE_PURGE_INTERVAL = float(os.getenv("EDGE_PURGE_INTERVAL", "1"))
+
+# Idempotency-Key on POST (app/middleware/idempotency.py): how long responses are kept
+# for replay, how long a request holds its key while running (must exceed the slowest
+# create, academic service call included) and how long a duplicate waits for it.
+IDEMPOTENCY_TTL = int(os.getenv("IDEMPOTENCY_TTL", "86400"))
+IDEMPOTENCY_LOCK_TIMEOUT = int(os.getenv("IDEMPOTENCY_LOCK_TIMEOUT", "30"))
+IDEMPOTENCY_WAIT_TIMEOUT = float(os.getenv("IDEMPOTENCY_WAIT_TIMEOUT", "10"))
+
+# Outbound calls (app.utils.deadline, AcademicServiceClient). Each request gets
+# REQUEST_DEADLINE_SECONDS in total, below the proxy's timeout, and call timeouts, retries
+# and backoff sleeps are cut to what is left. Transient academic service failures are
+# retried ACADEMIC_SERVICE_RETRIES times with full-jitter backoff (base and cap in seconds);
+# with ACADEMIC_SERVICE_HEDGE_PERCENTILE set (e.g. 95) a read that takes longer than that
+# percentile of recent latencies is sent a second time, and the first answer wins.
+REQUEST_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "8"))
+ACADEMIC_SERVICE_RETRIES = int(os.getenv("ACADEMIC_SERVICE_RETRIES", "2"))
+ACADEMIC_SERVICE_BACKOFF = float(os.getenv("ACADEMIC_SERVICE_BACKOFF", "0.1"))
+ACADEMIC_SERVICE_BACKOFF_MAX = float(os.getenv("ACADEMIC_SERVICE_BACKOFF_MAX", "1"))
+ACADEMIC_SERVICE_HEDGE_PERCENTILE = float(os.getenv("ACADEMIC_SERVICE_HEDGE_PERCENTILE", "0"))
+
+# Transactional outbox relay (manage.py relay_outbox) -> Redis Stream
+OUTBOX_STREAM = os.getenv("OUTBOX_STREAM", "sysacad:students:events")
+OUTBOX_STREAM_MAXLEN = int(os.getenv("OUTBOX_STREAM_MAXLEN", "100000"))
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "500"))
+
+# Background jobs (POST /api/v1/jobs/, run by manage.py run_jobs): students per chunk,
+# how long a worker holds a job without committing a chunk before another may take it
+# over, attempts before a lost job is failed, and the idle poll interval (seconds).
+JOB_CHUNK_SIZE = int(os.getenv("JOB_CHUNK_SIZE", "500"))
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "60"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+# Specialty reconciliation job: distinct specialties per chunk (each chunk must finish
+# within the lease) and academic service requests in flight at once
+RECONCILE_CHUNK_SIZE = int(os.getenv("RECONCILE_CHUNK_SIZE", "50"))
+RECONCILE_CONCURRENCY = int(os.getenv("RECONCILE_CONCURRENCY", "8"))
+
 
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
@@ -5,3 +5,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+from django.conf import settings  # noqa: E402
+
+if settings.CACHE_WARMUP_ON_STARTUP:
+    from app.services.cache_warmup import start_background_warmup
+
+    start_background_warmup()
@@ -0,0 +1,44 @@
+from datetime import date
+
+import pytest
+from django.core.cache import cache
+
+from app.models import Student
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Invalidation runs on commit, which never happens inside a test transaction, so
+    # entries cached by one test would otherwise leak into the next.
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def create_student(request, db):
+    """
+    Factory for students that differ only by `index` (document and student numbers):
+    create_student(document_type, index, **fields). TestCase classes get it as
+    `self.create_student` with @pytest.mark.usefixtures("create_student").
+    """
+
+    def create(document_type, index, **fields):
+        return Student.objects.create(
+            **{
+                "first_name": "Juan",
+                "last_name": "Pérez",
+                "document_number": f"{30000000 + index}",
+                "birth_date": date(2000, 5, 15),
+                "gender": "M",
+                "student_number": 3000 + index,
+                "enrollment_date": date(2020, 3, 1),
+                "document_type": document_type,
+                "specialty_id": 1,
+                **fields,
+            }
+        )
+
+    if request.instance is not None:
+        request.instance.create_student = create
+    return create
@@ -0,0 +1,121 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from app.models import DocumentType, Student
+from app.serializers import StudentSerializer
+from app.utils.student_generator import (
+    COPY_COLUMNS,
+    REFERENCE_DATE,
+    StudentGenerator,
+    _copy_row,
+)
+
+
+class StudentGeneratorTest(TestCase):
+    def setUp(self):
+        self.document_type = DocumentType.objects.create(name="DNI")
+
+    def _generator(self, seed=7):
+        return StudentGenerator(
+            document_type_ids=[self.document_type.id],
+            specialty_ids=[1, 2, 3],
+            seed=seed,
+            start_number=500,
+            today=date(2025, 6, 1),
+        )
+
+    def test_same_seed_is_deterministic(self):
+        first = [(s.first_name, s.birth_date) for s in self._generator().generate(50)]
+        second = [(s.first_name, s.birth_date) for s in self._generator().generate(50)]
+        self.assertEqual(first, second)
+
+    def test_generated_students_pass_serializer_validation(self):
+        generator = StudentGenerator(
+            document_type_ids=[self.document_type.id], specialty_ids=[1, 2, 3], seed=3
+        )
+        for student in generator.generate(200):
+            serializer = StudentSerializer(
+                data={
+                    "first_name": student.first_name,
+                    "last_name": student.last_name,
+                    "document_number": student.document_number,
+                    "document_type_id": student.document_type_id,
+                    "birth_date": student.birth_date,
+                    "gender": student.gender,
+                    "student_number": student.student_number,
+                    "enrollment_date": student.enrollment_date,
+                    "specialty_id": student.specialty_id,
+                }
+            )
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+
+    def test_numbers_are_unique_and_sequential(self):
+        numbers = [s.student_number for s in self._generator().generate(100)]
+        self.assertEqual(numbers, list(range(500, 600)))
+
+    def test_copy_rows_cover_every_column(self):
+        # COPY skips model defaults, so every NOT NULL column has to be written.
+        required = {
+            f.column for f in Student._meta.concrete_fields if not (f.primary_key or f.null)
+        }
+        self.assertLessEqual(required, set(COPY_COLUMNS))
+        student = next(iter(self._generator().generate(1)))
+        row = dict(zip(COPY_COLUMNS, _copy_row(student, "2025-06-01T00:00:00+00:00"), strict=True))
+        self.assertEqual(row["version"], 1)
+        self.assertEqual(row["student_number"], 500)
+
+
+class GenerateStudentsCommandTest(TestCase):
+    def test_generates_requested_count_in_batches(self):
+        out = StringIO()
+        call_command(
+            "generate_students",
+            25,
+            batch_size=10,
+            specialties="4-5",
+            document_types="DNI,LC",
+            stdout=out,
+        )
+        self.assertEqual(Student.objects.count(), 25)
+        self.assertEqual(
+            set(Student.objects.values_list("specialty_id", flat=True).distinct()), {4, 5}
+        )
+        self.assertEqual(DocumentType.objects.count(), 2)
+        self.assertIn("Generated 25 students via bulk", out.getvalue())
+
+    def test_continues_after_existing_student_numbers(self):
+        call_command("generate_students", 5, stdout=StringIO())
+        call_command("generate_students", 5, stdout=StringIO())
+        numbers = sorted(Student.objects.values_list("student_number", flat=True))
+        self.assertEqual(numbers, list(range(1, 11)))
+
+    def test_document_numbers_skip_existing_ones(self):
+        # An existing student holds the document number the first generated one would get.
+        Student.objects.create(
+            first_name="Juan",
+            last_name="Pérez",
+            document_number="20000002",
+            birth_date=date(2000, 5, 15),
+            gender="M",
+            student_number=1,
+            enrollment_date=date(2020, 3, 1),
+            document_type=DocumentType.objects.create(name="DNI"),
+            specialty_id=1,
+        )
+        call_command("generate_students", 5, stdout=StringIO())
+        documents = list(Student.objects.values_list("document_number", flat=True))
+        self.assertEqual(len(set(documents)), 6)
+
+    def test_dates_follow_reference_date_not_current_day(self):
+        call_command("generate_students", 20, today=date(2010, 1, 1), stdout=StringIO())
+        latest = Student.objects.order_by("-enrollment_date").first().enrollment_date
+        self.assertLessEqual(latest, date(2010, 1, 1))
+        generator = StudentGenerator(document_type_ids=[1], specialty_ids=[1])
+        self.assertEqual(generator.today, REFERENCE_DATE)
+
+    def test_copy_requires_postgres(self):
+        with self.assertRaises(CommandError):
+            call_command("generate_students", 5, method="copy", stdout=StringIO())
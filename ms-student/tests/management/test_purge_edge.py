@@ -0,0 +1,25 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from django_redis import get_redis_connection
+
+from app.utils.edge_purge import PENDING_KEY, queue_surrogate_keys
+
+
+@override_settings(EDGE_PURGE_URL="http://edge.local/purge")
+class PurgeEdgeCommandTest(SimpleTestCase):
+    def setUp(self):
+        self.redis = get_redis_connection("default")
+        self.redis.delete(PENDING_KEY)
+        self.addCleanup(self.redis.delete, PENDING_KEY)
+
+    @patch("app.utils.edge_purge.requests.post")
+    def test_once_drains_every_batch(self, post):
+        queue_surrogate_keys(None, tags=[f"student:{id}" for id in range(5)])
+        out = StringIO()
+        call_command("purge_edge", once=True, batch_size=2, stdout=out)
+        self.assertEqual(post.call_count, 3)
+        self.assertEqual(self.redis.scard(PENDING_KEY), 0)
+        self.assertIn("Purged 5 surrogate keys", out.getvalue())
@@ -0,0 +1,21 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from app.models import Job
+
+
+class ReconcileSpecialtiesCommandTest(TestCase):
+    def test_queues_one_job_at_a_time(self):
+        out = StringIO()
+        call_command("reconcile_specialties", stdout=out)
+        job = Job.objects.get()
+        self.assertEqual(
+            (job.kind, job.status, job.total), ("students.reconcile_specialties", Job.QUEUED, 0)
+        )
+        self.assertIn(f"Queued reconciliation job {job.id}", out.getvalue())
+
+        call_command("reconcile_specialties", stdout=out)
+        self.assertEqual(Job.objects.count(), 1)
+        self.assertIn(f"Reconciliation job {job.id} is already queued", out.getvalue())
@@ -0,0 +1,27 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django_redis import get_redis_connection
+
+from app.models import OutboxEvent
+from app.repositories import OutboxEventRepository
+
+TEST_STREAM = "test:relay:events"
+
+
+@override_settings(OUTBOX_STREAM=TEST_STREAM)
+class RelayOutboxCommandTest(TestCase):
+    def setUp(self):
+        self.redis = get_redis_connection("default")
+        self.redis.delete(TEST_STREAM)
+        self.addCleanup(self.redis.delete, TEST_STREAM)
+
+    def test_once_drains_every_batch(self):
+        for aggregate_id in range(5):
+            OutboxEventRepository.create("student.created", aggregate_id, {"id": aggregate_id})
+        out = StringIO()
+        call_command("relay_outbox", once=True, batch_size=2, stdout=out)
+        self.assertEqual(self.redis.xlen(TEST_STREAM), 5)
+        self.assertFalse(OutboxEvent.objects.filter(published_at__isnull=True).exists())
+        self.assertIn("Published 5 events", out.getvalue())
@@ -0,0 +1,22 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from app.models import Job
+from app.repositories import JobRepository
+
+
+class RunJobsCommandTest(TestCase):
+    def test_once_runs_queued_jobs_and_exits(self):
+        job = JobRepository.create("students.delete", {"ids": [999]}, total=0)
+        out = StringIO()
+        call_command("run_jobs", once=True, worker_id="test", stdout=out)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.worker), (Job.SUCCEEDED, "test"))
+        self.assertIn(f"Job {job.id} (students.delete) succeeded", out.getvalue())
+
+    def test_once_without_jobs(self):
+        out = StringIO()
+        call_command("run_jobs", once=True, stdout=out)
+        self.assertEqual(out.getvalue(), "")
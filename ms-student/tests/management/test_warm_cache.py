@@ -0,0 +1,78 @@
+from io import StringIO
+from unittest.mock import Mock
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from app.models import DocumentType
+from app.services import CacheWarmupService, DocumentTypeService, StudentService
+from app.services.cache_warmup import RateLimiter
+from app.utils.cache import student_key
+from app.utils.hot_keys import HotKeyTracker
+
+
+@pytest.mark.usefixtures("create_student")
+class WarmCacheCommandTest(TestCase):
+    def setUp(self):
+        self.document_type = DocumentType.objects.create(name="DNI", description="DNI")
+        self.students = [self.create_student(self.document_type, index) for index in range(7)]
+        self.tracker = HotKeyTracker("test")
+        self.tracker.redis_client.delete(self.tracker.key)
+        self.addCleanup(self.tracker.redis_client.delete, self.tracker.key)
+        self.student_service = StudentService(academic_client=Mock(), read_tracker=self.tracker)
+
+    def test_preloads_pages_document_types_and_most_read_students(self):
+        hot = self.students[-1]
+        with override_settings(CACHE_READ_SAMPLE_RATE=1.0):
+            self.student_service.find_by_id(hot.id)
+        cache.delete(student_key(hot.id))
+
+        summary = CacheWarmupService(
+            student_service=self.student_service, read_tracker=self.tracker, limiter=RateLimiter(0)
+        ).warm(pages=5, page_size=3, top_students=10)
+        self.assertEqual(summary, {"document_types": 1, "page_students": 7, "hot_students": 1})
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.student_service.find_page(1, 3)[1], 7)
+            self.assertEqual(self.student_service.find_page(3, 3)[0], [self.students[6]])
+            self.assertEqual(self.student_service.find_by_id(hot.id), hot)
+            DocumentTypeService().find_all()
+            DocumentTypeService().find_by_id(self.document_type.id)
+
+    def test_document_types_are_cached_from_the_list_query(self):
+        DocumentType.objects.create(name="LC", description="Libreta Cívica")
+        service = DocumentTypeService()
+        warmup = CacheWarmupService(document_type_service=service, limiter=RateLimiter(0))
+        with self.assertNumQueries(1):
+            self.assertEqual(warmup.warm_document_types(), 2)
+        with self.assertNumQueries(0):
+            for document_type in service.find_all():
+                self.assertEqual(service.find_by_id(document_type.id), document_type)
+
+    def test_command_reports_counts(self):
+        out = StringIO()
+        call_command("warm_cache", pages=1, page_size=5, top=0, rate=0, stdout=out)
+        self.assertIn("Warmed 1 document types, 5 students on list pages", out.getvalue())
+
+
+class RateLimiterTest(TestCase):
+    def test_paces_units_per_second(self):
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        limiter = RateLimiter(100, clock=lambda: now[0], sleep=sleep)
+        limiter.wait(50)
+        limiter.wait(50)
+        limiter.wait(10)
+        self.assertEqual(sleeps, [0.5, 0.5])
+
+    def test_zero_rate_never_sleeps(self):
+        limiter = RateLimiter(0, sleep=Mock(side_effect=AssertionError))
+        for _ in range(3):
+            limiter.wait(1000)
@@ -0,0 +1,24 @@
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from app.middleware import DeadlineMiddleware
+from app.utils.deadline import remaining
+
+
+@override_settings(REQUEST_DEADLINE_SECONDS=8)
+class DeadlineMiddlewareTest(SimpleTestCase):
+    def _remaining(self, **headers) -> float | None:
+        seen = []
+        middleware = DeadlineMiddleware(lambda request: seen.append(remaining()))
+        middleware(RequestFactory().get("/", **headers))
+        return seen[0]
+
+    def test_request_gets_the_default_deadline(self):
+        self.assertTrue(7.5 < self._remaining() <= 8)
+        self.assertIsNone(remaining())
+
+    def test_caller_can_shorten_the_deadline(self):
+        self.assertTrue(0 < self._remaining(HTTP_X_REQUEST_TIMEOUT="0.5") <= 0.5)
+
+    def test_caller_cannot_extend_or_break_it(self):
+        self.assertTrue(7.5 < self._remaining(HTTP_X_REQUEST_TIMEOUT="60") <= 8)
+        self.assertTrue(7.5 < self._remaining(HTTP_X_REQUEST_TIMEOUT="soon") <= 8)
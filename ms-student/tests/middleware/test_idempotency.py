@@ -0,0 +1,116 @@
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app.middleware.idempotency import _cache_key
+from app.models import DocumentType, Student
+
+
+@patch("app.utils.academic_client.AcademicServiceClient.validate_specialty", return_value=True)
+class IdempotencyMiddlewareTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = "/api/v1/students/"
+        self.document_type = DocumentType.objects.create(name="DNI")
+        self.data = {
+            "first_name": "María",
+            "last_name": "García",
+            "document_number": "87654321",
+            "document_type_id": self.document_type.id,
+            "birth_date": "2001-08-20",
+            "gender": "F",
+            "student_number": 2002,
+            "enrollment_date": "2020-03-01",
+            "specialty_id": 2,
+        }
+
+    def _post(self, key="key-1", data=None, **extra):
+        return self.client.post(
+            self.url, data or self.data, format="json", HTTP_IDEMPOTENCY_KEY=key, **extra
+        )
+
+    def _lock_key(self, key="key-1"):
+        request = RequestFactory().post(self.url)
+        return f"{_cache_key(request, key)}:lock"
+
+    def test_replay_returns_stored_response_without_redoing_work(self, validate):
+        first = self._post()
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        with self.assertNumQueries(0):
+            replay = self._post()
+        self.assertEqual(replay.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(replay["Idempotent-Replayed"], "true")
+        self.assertEqual(replay.json(), first.json())
+        self.assertEqual(Student.objects.count(), 1)
+        validate.assert_called_once()
+
+    def test_different_keys_are_independent(self, _validate):
+        self._post("key-1")
+        second = self._post("key-2")
+        self.assertEqual(second.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(second.has_header("Idempotent-Replayed"))
+
+    def test_client_errors_are_replayed_too(self, _validate):
+        invalid = {**self.data, "gender": "X"}
+        self.assertEqual(self._post(data=invalid).status_code, status.HTTP_400_BAD_REQUEST)
+        replay = self._post(data=invalid)
+        self.assertEqual(replay.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(replay["Idempotent-Replayed"], "true")
+
+    def test_key_reused_with_different_body_is_rejected(self, _validate):
+        self._post()
+        response = self._post(data={**self.data, "first_name": "Ana"})
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+    def test_server_errors_are_not_stored(self, validate):
+        validate.side_effect = RuntimeError("boom")
+        self.client.raise_request_exception = False
+        self.assertEqual(self._post().status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        validate.side_effect = None
+        validate.return_value = True
+        self.assertEqual(self._post().status_code, status.HTTP_201_CREATED)
+
+    def test_requests_without_key_are_untouched(self, _validate):
+        self.client.post(self.url, self.data, format="json")
+        response = self.client.post(self.url, self.data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_concurrent_duplicate_waits_for_first_response(self, _validate):
+        # Same body under another key, so its stored response can stand in for the one
+        # the (simulated) concurrent request with key-1 finishes with.
+        first = self._post("other-key")
+        stored = cache.get(_cache_key(RequestFactory().post(self.url), "other-key"))
+        cache.add(self._lock_key(), "in progress", timeout=30)
+
+        def finish(_seconds):
+            cache.set(_cache_key(RequestFactory().post(self.url), "key-1"), stored)
+
+        with patch("app.middleware.idempotency.time.sleep", side_effect=finish) as sleep:
+            response = self._post()
+        sleep.assert_called_once()
+        self.assertEqual(response["Idempotent-Replayed"], "true")
+        self.assertEqual(response.json(), first.json())
+
+    @override_settings(IDEMPOTENCY_WAIT_TIMEOUT=0)
+    def test_duplicate_still_running_gets_conflict(self, _validate):
+        cache.add(self._lock_key(), "in progress", timeout=30)
+        response = self._post()
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response["Retry-After"], "1")
+        self.assertEqual(Student.objects.count(), 0)
+
+    @override_settings(IDEMPOTENCY_WAIT_TIMEOUT=10)
+    def test_duplicate_wait_stops_at_request_deadline(self, _validate):
+        cache.add(self._lock_key(), "in progress", timeout=30)
+        start = time.monotonic()
+        response = self._post(HTTP_X_REQUEST_TIMEOUT="0.2")
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertLess(time.monotonic() - start, 2)
+
+    def test_overlong_key_is_rejected(self, _validate):
+        response = self._post("k" * 256)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
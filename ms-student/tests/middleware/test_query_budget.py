@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from app.models import DocumentType
+from app.utils.query_budget import QueryBudgetExceeded, assert_max_queries
+from app.views import DocumentTypeViewSet
+
+
+class AssertMaxQueriesTest(TestCase):
+    def test_within_budget_passes(self):
+        with assert_max_queries(1) as budget:
+            list(DocumentType.objects.all())
+        self.assertEqual(budget.count, 1)
+
+    def test_over_budget_raises_with_sql(self):
+        with self.assertRaisesMessage(QueryBudgetExceeded, "document_types"):
+            with assert_max_queries(1, "two queries"):
+                list(DocumentType.objects.all())
+                list(DocumentType.objects.all())
+
+
+@override_settings(QUERY_BUDGET_ENABLED=True, DEBUG=True)
+class QueryBudgetMiddlewareTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        DocumentType.objects.create(name="DNI")
+
+    def test_reports_query_count_for_budgeted_action(self):
+        response = self.client.get("/api/v1/document-types/")
+        self.assertEqual(response["X-Query-Count"], "1")
+
+    def test_logs_sql_when_budget_exceeded(self):
+        with patch.object(DocumentTypeViewSet, "query_budgets", {"list": 0}):
+            with self.assertLogs("app.middleware.query_budget", level="WARNING") as logs:
+                self.client.get("/api/v1/document-types/")
+        self.assertIn("Query budget exceeded", logs.output[0])
+        self.assertIn("document_types", logs.output[0])
@@ -0,0 +1,74 @@
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app.models import DocumentType
+from app.utils import server_timing
+from app.utils.server_timing import ServerTimings, timed
+
+
+class ServerTimingsTest(TestCase):
+    def test_header_value_includes_phases_app_and_total(self):
+        timings = ServerTimings()
+        timings.add("db", 0.010)
+        timings.add("db", 0.005)
+        timings.add("cache", 0.002)
+        header = timings.header_value(0.050)
+        self.assertIn('db;dur=15.00;desc="2 calls"', header)
+        self.assertIn('cache;dur=2.00;desc="1 calls"', header)
+        self.assertIn("app;dur=33.00", header)
+        self.assertIn("total;dur=50.00", header)
+
+    def test_timed_is_noop_without_active_recorder(self):
+        with timed("db"):
+            pass
+        self.assertIsNone(server_timing.current())
+
+    def test_timed_records_into_active_recorder(self):
+        timings = ServerTimings()
+        token = server_timing.activate(timings)
+        try:
+            with timed("academic"):
+                pass
+        finally:
+            server_timing.deactivate(token)
+        self.assertEqual(timings.counts["academic"], 1)
+
+
+class ServerTimingMiddlewareTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.document_type = DocumentType.objects.create(
+            name="DNI", description="Documento Nacional de Identidad"
+        )
+        self.url = f"/api/v1/document-types/{self.document_type.id}/"
+
+    def test_header_absent_by_default(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(SERVER_TIMING_ENABLED=True)
+    def test_header_present_when_enabled(self):
+        response = self.client.get("/api/v1/document-types/9999/")
+        header = response["Server-Timing"]
+        self.assertIn("db;dur=", header)
+        self.assertIn("cache;dur=", header)
+        self.assertIn("total;dur=", header)
+
+    @override_settings(SERVER_TIMING_TOKEN="s3cret")
+    def test_header_present_with_trusted_token(self):
+        response = self.client.get(self.url, HTTP_X_SERVER_TIMING_TOKEN="s3cret")
+        self.assertIn("serialize;dur=", response["Server-Timing"])
+        self.assertIn("render;dur=", response["Server-Timing"])
+
+    @override_settings(SERVER_TIMING_TOKEN="s3cret")
+    def test_header_absent_with_wrong_token(self):
+        response = self.client.get(self.url, HTTP_X_SERVER_TIMING_TOKEN="guess")
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(SERVER_TIMING_TOKEN="s3cret")
+    def test_header_absent_with_non_ascii_token(self):
+        response = self.client.get(self.url, HTTP_X_SERVER_TIMING_TOKEN="sécret")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("Server-Timing", response)
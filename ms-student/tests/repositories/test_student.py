@@ -78,6 +78,33 @@ class StudentRepositoryTest(TestCase):
         updated = StudentRepository.update(self.student)
         self.assertEqual(updated.first_name, "Juan Carlos")
 
+    def test_update_bumps_version(self):
+        self.student.first_name = "Juan Carlos"
+        updated = StudentRepository.update(self.student, ["first_name"])
+        self.assertEqual(updated.version, 2)
+        stored = Student.objects.get(id=self.student.id)
+        self.assertEqual((stored.first_name, stored.version), ("Juan Carlos", 2))
+        self.assertEqual(stored.updated_at, updated.updated_at)
+
+    def test_update_from_stale_read_writes_nothing(self):
+        stale = Student.objects.get(id=self.student.id)
+        self.student.last_name = "Gómez"
+        StudentRepository.update(self.student)
+        stale.first_name = "Pedro"
+        self.assertIsNone(StudentRepository.update(stale, ["first_name"]))
+        stored = Student.objects.get(id=self.student.id)
+        self.assertEqual((stored.first_name, stored.last_name), ("Juan", "Gómez"))
+
+    def test_update_writes_only_given_fields(self):
+        self.student.first_name = "Pedro"
+        Student.objects.filter(id=self.student.id).update(last_name="Gómez")
+        StudentRepository.update(self.student, ["first_name"])
+        self.assertEqual(Student.objects.get(id=self.student.id).last_name, "Gómez")
+
+    def test_soft_delete_bumps_version(self):
+        StudentRepository.delete_by_id(self.student.id)
+        self.assertEqual(Student.objects.get(id=self.student.id).version, 2)
+
     def test_delete_by_id_existing(self):
         student = Student.objects.create(
             first_name="Test",
@@ -0,0 +1,229 @@
+from datetime import date, timedelta
+from unittest.mock import Mock
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from app.models import DocumentType, Job, OrphanedSpecialty, OutboxEvent, Student
+from app.repositories import JobRepository
+from app.services import JobService, StudentService
+from app.services.job import JobHandler
+from app.services.outbox import STUDENT_DELETED
+from app.services.student_jobs import (
+    BulkUpdateStudentsJob,
+    DeleteStudentsJob,
+    ReconcileSpecialtiesJob,
+)
+from app.utils.academic_client import AcademicServiceClient
+
+LEASE = timedelta(seconds=60)
+
+
+class CountingJob(JobHandler):
+    """Counts to params["to"] in steps of 2; fails at params["fail_at"]."""
+
+    kind = "test.count"
+
+    def count(self, params):
+        return params["to"]
+
+    def run_chunk(self, job, fetched):
+        params, position = job.params, job.checkpoint or 0
+        if position == params.get("fail_at"):
+            raise RuntimeError("boom")
+        step = min(2, params["to"] - position)
+        return step, position + step, position + step >= params["to"]
+
+
+@override_settings(JOB_MAX_ATTEMPTS=2)
+class JobServiceTest(TestCase):
+    def setUp(self):
+        self.service = JobService(handlers={CountingJob.kind: CountingJob})
+
+    def test_enqueue_records_total(self):
+        job = self.service.enqueue("test.count", {"to": 5})
+        self.assertEqual((job.status, job.total, job.processed), (Job.QUEUED, 5, 0))
+
+    def test_enqueue_rejects_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            self.service.enqueue("test.unknown", {})
+
+    def test_run_next_runs_every_chunk(self):
+        job = self.service.enqueue("test.count", {"to": 5})
+        self.assertEqual(self.service.run_next("w1").id, job.id)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.SUCCEEDED)
+        self.assertEqual((job.processed, job.progress, job.result), (5, 1.0, {"processed": 5}))
+        self.assertIsNotNone(job.finished_at)
+        self.assertIsNone(job.lease_expires_at)
+
+    def test_run_next_without_jobs(self):
+        self.assertIsNone(self.service.run_next("w1"))
+
+    def test_failed_chunk_marks_job_failed_and_keeps_checkpoint(self):
+        job = self.service.enqueue("test.count", {"to": 10, "fail_at": 4})
+        self.service.run_next("w1")
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertEqual((job.processed, job.checkpoint), (4, 4))
+        self.assertIn("RuntimeError: boom", job.error)
+
+    def test_stop_requeues_job_and_resumes_from_checkpoint(self):
+        job = self.service.enqueue("test.count", {"to": 6})
+        chunks = iter([False, True])
+        self.service.run_next("w1", should_stop=lambda: next(chunks))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.processed, job.checkpoint), (Job.QUEUED, 2, 2))
+        self.assertEqual((job.worker, job.attempts), ("", 0))
+
+        self.service.run_next("w2")
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.processed, job.worker), (Job.SUCCEEDED, 6, "w2"))
+
+    def test_expired_lease_is_taken_over(self):
+        job = JobRepository.create("test.count", {"to": 4})
+        claimed = JobRepository.claim_next("dead", LEASE, max_attempts=2)
+        Job.objects.filter(id=job.id).update(lease_expires_at=timezone.now() - LEASE)
+
+        self.service.run_next("w2")
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.worker, job.attempts), (Job.SUCCEEDED, "w2", 2))
+        # The old worker can no longer write progress.
+        self.assertFalse(JobRepository.save_progress(claimed, LEASE, processed=1))
+
+    def test_job_lost_on_last_attempt_is_failed(self):
+        job = JobRepository.create("test.count", {"to": 4})
+        Job.objects.filter(id=job.id).update(
+            status=Job.RUNNING, attempts=2, lease_expires_at=timezone.now() - LEASE
+        )
+        self.assertIsNone(self.service.run_next("w1"))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+
+
+@override_settings(JOB_CHUNK_SIZE=2)
+class StudentJobsTest(TestCase):
+    def setUp(self):
+        self.academic_client = Mock()
+        self.student_service = StudentService(academic_client=self.academic_client)
+        self.document_type = DocumentType.objects.create(name="DNI")
+        self.students = [
+            Student.objects.create(
+                first_name="Juan",
+                last_name="Pérez",
+                document_number=f"3000000{index}",
+                birth_date=date(2000, 5, 15),
+                gender="M",
+                student_number=3000 + index,
+                enrollment_date=date(2020, 3, 1),
+                document_type=self.document_type,
+                specialty_id=1 if index < 5 else 2,
+            )
+            for index in range(6)
+        ]
+
+    def _run(self, handler, params):
+        job, processed, chunks = Job(params=params), 0, 0
+        while True:
+            done, job.checkpoint, finished = handler.run_chunk(job, handler.fetch_chunk(job))
+            processed, chunks = processed + done, chunks + 1
+            if finished:
+                return processed, chunks
+
+    def test_bulk_update_in_chunks(self):
+        handler = BulkUpdateStudentsJob(self.student_service)
+        params = {"filter": {"specialty_id": 1}, "changes": {"specialty_id": 9}}
+        handler.prepare(params)
+        self.assertEqual(handler.count(params), 5)
+        self.assertEqual(self._run(handler, params), (5, 3))
+        self.assertEqual(Student.objects.filter(specialty_id=9).count(), 5)
+        # Validated once at enqueue time, not per chunk.
+        self.academic_client.validate_specialty.assert_called_once_with(9)
+
+    def test_delete_in_chunks(self):
+        handler = DeleteStudentsJob(self.student_service)
+        ids = [student.id for student in self.students[:4]]
+        self.assertEqual(self._run(handler, {"ids": ids}), (4, 3))
+        self.assertEqual(Student.objects.filter(is_active=True).count(), 2)
+        events = OutboxEvent.objects.filter(event_type=STUDENT_DELETED)
+        self.assertEqual(sorted(event.aggregate_id for event in events), ids)
+
+
+@override_settings(RECONCILE_CHUNK_SIZE=2, RECONCILE_CONCURRENCY=2)
+class ReconcileSpecialtiesJobTest(TestCase):
+    def setUp(self):
+        document_type = DocumentType.objects.create(name="DNI")
+        # 7 students over 3 specialties: 1 (known), 2 (removed, 4 students), 3 (unreachable).
+        for index, specialty_id in enumerate([1, 1, 2, 2, 2, 2, 3]):
+            Student.objects.create(
+                first_name="Juan",
+                last_name="Pérez",
+                document_number=f"3000000{index}",
+                birth_date=date(2000, 5, 15),
+                gender="M",
+                student_number=3000 + index,
+                enrollment_date=date(2020, 3, 1),
+                document_type=document_type,
+                specialty_id=specialty_id,
+            )
+        self.academic_client = AcademicServiceClient()
+        self.academic_client.validate_specialty = Mock(side_effect=self._validate_specialty)
+        self.service = JobService(
+            handlers={
+                ReconcileSpecialtiesJob.kind: lambda: ReconcileSpecialtiesJob(
+                    academic_client=self.academic_client
+                )
+            }
+        )
+
+    @staticmethod
+    def _validate_specialty(specialty_id):
+        if specialty_id == 3:
+            raise ConnectionError("academic service unreachable")
+        return specialty_id == 1
+
+    def test_checks_each_distinct_specialty_once(self):
+        job = self.service.enqueue(ReconcileSpecialtiesJob.kind, {})
+        self.assertEqual(job.total, 3)
+        self.service.run_next("w1")
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.SUCCEEDED)
+        self.assertEqual(
+            sorted(call.args[0] for call in self.academic_client.validate_specialty.call_args_list),
+            [1, 2, 3],
+        )
+        self.assertEqual(
+            job.result,
+            {
+                "specialties": 3,
+                "orphans": [{"specialty_id": 2, "students": 4}],
+                "orphaned_students": 4,
+                "unverified": [3],
+            },
+        )
+        orphan = OrphanedSpecialty.objects.get()
+        self.assertEqual((orphan.job_id, orphan.specialty_id, orphan.student_count), (job.id, 2, 4))
+
+    def test_deleted_students_are_ignored(self):
+        Student.objects.filter(specialty_id=2).update(is_active=False)
+        job = self.service.enqueue(ReconcileSpecialtiesJob.kind, {})
+        self.service.run_next("w1")
+        job.refresh_from_db()
+        self.assertEqual(job.result["orphans"], [])
+        self.assertFalse(OrphanedSpecialty.objects.exists())
+
+    def test_specialties_are_checked_outside_the_chunk_transaction(self):
+        depths = []
+        check_specialties = self.academic_client.check_specialties
+
+        def check(*args):
+            depths.append(len(connection.atomic_blocks))
+            return check_specialties(*args)
+
+        self.academic_client.check_specialties = check
+        self.service.enqueue(ReconcileSpecialtiesJob.kind, {})
+        outside = len(connection.atomic_blocks)
+        self.service.run_next("w1")
+        self.assertEqual(depths, [outside, outside])
@@ -0,0 +1,101 @@
+import json
+from datetime import date, timedelta
+from unittest.mock import Mock
+
+import pytest
+from django.db import transaction
+from django.test import override_settings
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from app.models import DocumentType, OutboxEvent, Student
+from app.services import OutboxService, StudentService
+
+TEST_STREAM = "test:students:events"
+
+
+@pytest.fixture
+def redis_stream():
+    redis = get_redis_connection("default")
+    redis.delete(TEST_STREAM)
+    with override_settings(OUTBOX_STREAM=TEST_STREAM):
+        yield redis
+    redis.delete(TEST_STREAM)
+
+
+@pytest.fixture
+def document_type(db):
+    return DocumentType.objects.create(name="DNI")
+
+
+@pytest.fixture
+def student_service():
+    mock_academic_client = Mock()
+    mock_academic_client.validate_specialty.return_value = True
+    return StudentService(academic_client=mock_academic_client)
+
+
+@pytest.fixture
+def student_data(document_type):
+    return {
+        "first_name": "Juan",
+        "last_name": "Pérez",
+        "document_number": "12345678",
+        "birth_date": date(2000, 5, 15),
+        "gender": "M",
+        "student_number": 1001,
+        "enrollment_date": date(2020, 3, 1),
+        "document_type_id": document_type.id,
+        "specialty_id": 1,
+    }
+
+
+@pytest.mark.django_db
+class TestOutboxRecording:
+    def test_create_update_delete_record_events_in_order(self, student_service, student_data):
+        student = student_service.create(student_data)
+        student_service.update(student.id, {"first_name": "Pedro"})
+        student_service.delete_by_id(student.id)
+
+        events = list(OutboxEvent.objects.filter(aggregate_id=student.id))
+        assert [e.event_type for e in events] == [
+            "student.created",
+            "student.updated",
+            "student.deleted",
+        ]
+        assert events[1].payload["first_name"] == "Pedro"
+        assert events[0].payload["birth_date"] == "2000-05-15"
+
+    def test_event_rolls_back_with_the_change(self, student_service, student_data):
+        with pytest.raises(RuntimeError), transaction.atomic():
+            student_service.create(student_data)
+            raise RuntimeError("abort")
+        assert not OutboxEvent.objects.exists()
+        assert not Student.objects.exists()
+
+
+@pytest.mark.django_db
+class TestOutboxPublishing:
+    def test_publish_pending_batches_into_stream(self, redis_stream):
+        service = OutboxService()
+        for aggregate_id in (1, 2, 3):
+            service.repository.create("student.updated", aggregate_id, {"id": aggregate_id})
+
+        assert service.publish_pending(batch_size=2) == 2
+        assert service.publish_pending(batch_size=2) == 1
+        assert service.publish_pending(batch_size=2) == 0
+
+        entries = redis_stream.xrange(TEST_STREAM)
+        assert [int(fields[b"aggregate_id"]) for _id, fields in entries] == [1, 2, 3]
+        assert json.loads(entries[0][1][b"payload"]) == {"id": 1}
+        assert not OutboxEvent.objects.filter(published_at__isnull=True).exists()
+
+    def test_purge_published_keeps_recent_and_pending(self, redis_stream):
+        service = OutboxService()
+        old = service.repository.create("student.updated", 1, {})
+        service.repository.create("student.updated", 2, {})
+        OutboxEvent.objects.filter(id=old.id).update(
+            published_at=timezone.now() - timedelta(days=10)
+        )
+        assert service.purge_published(timedelta(days=7)) == 1
+        assert OutboxEvent.objects.count() == 1
@@ -1,10 +1,21 @@
 from datetime import date
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
+from django.db.models import F
+from redis.client import Pipeline
 
 from app.models import DocumentType, Student
 from app.services import StudentService
+from app.utils.cache import (
+    STUDENT_ENTRIES,
+    get_tagged,
+    set_tagged,
+    student_entry_tags,
+    student_key,
+    tags_invalidated,
+)
+from app.utils.etag import ConcurrentUpdateError, PreconditionFailed, entity_etag
 
 
 @pytest.fixture
@@ -44,6 +55,21 @@ def existing_student(db, document_type):
     )
 
 
+@pytest.fixture
+def other_student(db, document_type):
+    return Student.objects.create(
+        first_name="Other",
+        last_name="Student",
+        document_number="22222222",
+        birth_date=date(2000, 1, 1),
+        gender="F",
+        student_number=9001,
+        enrollment_date=date(2020, 1, 1),
+        document_type=document_type,
+        specialty_id=2,
+    )
+
+
 @pytest.fixture
 def student_service():
     mock_academic_client = Mock()
@@ -103,6 +129,56 @@ class TestStudentService:
         updated = student_service.update(existing_student.id, {"first_name": "Updated"})
         assert updated.first_name == "Updated"
 
+    def test_update_retries_after_concurrent_write(self, student_service, existing_student):
+        real_find = student_service.student_repository.find_by_id
+        reads = []
+
+        def find_then_write_concurrently(id):
+            student = real_find(id)
+            if not reads:
+                Student.objects.filter(id=id).update(last_name="Gómez", version=F("version") + 1)
+            reads.append(student)
+            return student
+
+        with patch.object(
+            student_service.student_repository, "find_by_id", find_then_write_concurrently
+        ):
+            updated = student_service.update(existing_student.id, {"first_name": "Pedro"})
+        assert len(reads) == 2
+        assert (updated.first_name, updated.last_name, updated.version) == ("Pedro", "Gómez", 3)
+
+    def test_update_if_match_rejects_concurrent_write(self, student_service, existing_student):
+        etag = entity_etag(existing_student)
+        real_find = student_service.student_repository.find_by_id
+
+        def find_then_write_concurrently(id):
+            student = real_find(id)
+            Student.objects.filter(id=id).update(version=F("version") + 1)
+            return student
+
+        with patch.object(
+            student_service.student_repository, "find_by_id", find_then_write_concurrently
+        ):
+            with pytest.raises(PreconditionFailed):
+                student_service.update(
+                    existing_student.id, {"first_name": "Pedro"}, if_match=[etag]
+                )
+        assert Student.objects.get(id=existing_student.id).first_name == "Existing"
+
+    def test_update_gives_up_when_row_keeps_changing(self, student_service, existing_student):
+        real_find = student_service.student_repository.find_by_id
+
+        def find_then_write_concurrently(id):
+            student = real_find(id)
+            Student.objects.filter(id=id).update(version=F("version") + 1)
+            return student
+
+        with patch.object(
+            student_service.student_repository, "find_by_id", find_then_write_concurrently
+        ):
+            with pytest.raises(ConcurrentUpdateError):
+                student_service.update(existing_student.id, {"first_name": "Pedro"})
+
     def test_update_non_existing_raises_error(self, student_service):
         with pytest.raises(ValueError, match="does not exist"):
             student_service.update(9999, {"first_name": "Test"})
@@ -169,3 +245,218 @@ class TestStudentService:
         )
         assert updated.first_name == "Updated"
         assert updated.document_number == "11111111"
+
+
+@pytest.mark.django_db
+class TestStudentServiceCache:
+    def test_find_by_id_served_from_cache(
+        self, student_service, existing_student, django_assert_num_queries
+    ):
+        student_service.find_by_id(existing_student.id)
+        with django_assert_num_queries(0):
+            assert student_service.find_by_id(existing_student.id).id == existing_student.id
+
+    def test_update_refreshes_cached_student_after_commit(
+        self, student_service, existing_student, django_capture_on_commit_callbacks
+    ):
+        student_service.find_by_id(existing_student.id)
+        with django_capture_on_commit_callbacks(execute=True):
+            student_service.update(existing_student.id, {"first_name": "Changed"})
+        assert student_service.find_by_id(existing_student.id).first_name == "Changed"
+
+    def test_stale_read_is_not_served_after_invalidation(
+        self, student_service, existing_student, django_capture_on_commit_callbacks
+    ):
+        # A reader takes the stamp, loads the old row, and only writes it back after the
+        # writer has committed and invalidated.
+        key = student_key(existing_student.id)
+        _, stamp = get_tagged(key, student_entry_tags(existing_student.id))
+        stale = Student.objects.get(pk=existing_student.id)
+        with django_capture_on_commit_callbacks(execute=True):
+            student_service.update(existing_student.id, {"first_name": "Changed"})
+        set_tagged(key, stale, stamp, timeout=300)
+
+        assert student_service.find_by_id(existing_student.id).first_name == "Changed"
+
+    def test_invalidation_waits_for_commit(
+        self, student_service, existing_student, django_capture_on_commit_callbacks
+    ):
+        student_service.find_by_id(existing_student.id)
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            student_service.update(existing_student.id, {"first_name": "Changed"})
+        assert student_service.find_by_id(existing_student.id).first_name == "Existing"
+        assert len(callbacks) >= 1
+
+    def test_find_page_cached_until_list_changes(
+        self,
+        student_service,
+        existing_student,
+        student_data,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        assert student_service.find_page(1, 10) == ([existing_student], 1)
+        with django_assert_num_queries(0):
+            student_service.find_page(1, 10)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            student_service.create(student_data)
+        students, count = student_service.find_page(1, 10)
+        assert count == 2
+        assert len(students) == 2
+
+    def test_find_page_beyond_last_page_is_empty(self, student_service, existing_student):
+        assert student_service.find_page(3, 10) == ([], 1)
+
+    def test_write_through_update_is_a_cache_hit(
+        self,
+        settings,
+        student_service,
+        existing_student,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.CACHE_WRITE_THROUGH = True
+        student_service.find_by_id(existing_student.id)
+        with django_capture_on_commit_callbacks(execute=True):
+            student_service.update(existing_student.id, {"first_name": "Changed"})
+        with django_assert_num_queries(0):
+            assert student_service.find_by_id(existing_student.id).first_name == "Changed"
+
+    def test_write_through_create_is_a_cache_hit(
+        self,
+        settings,
+        student_service,
+        student_data,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.CACHE_WRITE_THROUGH = True
+        with django_capture_on_commit_callbacks(execute=True):
+            student = student_service.create(student_data)
+        with django_assert_num_queries(0):
+            assert student_service.find_by_id(student.id).student_number == 1001
+
+    def test_write_through_update_keeps_other_students_cached(
+        self,
+        settings,
+        student_service,
+        existing_student,
+        other_student,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.CACHE_WRITE_THROUGH = True
+        student_service.find_by_id(other_student.id)
+        invalidated = []
+
+        def record(sender, tags, **kwargs):
+            invalidated.extend(tags)
+
+        tags_invalidated.connect(record)
+        try:
+            with django_capture_on_commit_callbacks(execute=True):
+                student_service.update(existing_student.id, {"first_name": "Changed"})
+        finally:
+            tags_invalidated.disconnect(record)
+        assert STUDENT_ENTRIES not in invalidated
+        with django_assert_num_queries(0):
+            assert student_service.find_by_id(other_student.id) == other_student
+
+    def test_write_through_out_of_order_refresh_is_not_served(
+        self, settings, student_service, existing_student, django_capture_on_commit_callbacks
+    ):
+        settings.CACHE_WRITE_THROUGH = True
+        with django_capture_on_commit_callbacks() as first:
+            student_service.update(existing_student.id, {"first_name": "First"})
+        with django_capture_on_commit_callbacks() as second:
+            student_service.update(existing_student.id, {"first_name": "Second"})
+        # Commit order is first, second, but the callbacks run the other way round: the
+        # value written last carries the older stamp and must not be served.
+        for callback in [*second, *first]:
+            callback()
+        assert student_service.find_by_id(existing_student.id).first_name == "Second"
+
+    def test_write_through_concurrent_refresh_is_not_served(
+        self, settings, student_service, existing_student, django_capture_on_commit_callbacks
+    ):
+        settings.CACHE_WRITE_THROUGH = True
+        student_service.find_by_id(existing_student.id)
+        with django_capture_on_commit_callbacks() as first:
+            student_service.update(existing_student.id, {"first_name": "First"})
+        with django_capture_on_commit_callbacks() as second:
+            student_service.update(existing_student.id, {"first_name": "Second"})
+        multi = Pipeline.multi
+
+        def interleaved(pipe):
+            # The second writer's callback runs between the first one's read and write.
+            while second:
+                second.pop(0)()
+            return multi(pipe)
+
+        with patch.object(Pipeline, "multi", interleaved):
+            for callback in first:
+                callback()
+        assert student_service.find_by_id(existing_student.id).first_name == "Second"
+
+    def test_write_through_retires_list_pages(
+        self,
+        settings,
+        student_service,
+        existing_student,
+        student_data,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.CACHE_WRITE_THROUGH = True
+        student_service.find_page(1, 10)
+        with django_capture_on_commit_callbacks(execute=True):
+            student_service.create(student_data)
+        assert student_service.find_page(1, 10)[1] == 2
+
+    def test_find_by_specialty_invalidated_when_student_changes_specialty(
+        self, student_service, existing_student, django_capture_on_commit_callbacks
+    ):
+        assert student_service.find_by_specialty(1) == [existing_student]
+        assert student_service.find_by_specialty(2) == []
+        with django_capture_on_commit_callbacks(execute=True):
+            student_service.update(existing_student.id, {"specialty_id": 2})
+        assert student_service.find_by_specialty(1) == []
+        assert student_service.find_by_specialty(2) == [existing_student]
+
+    def test_delete_invalidates_student_and_lists(
+        self, student_service, existing_student, django_capture_on_commit_callbacks
+    ):
+        student_service.find_by_id(existing_student.id)
+        student_service.find_page(1, 10)
+        with django_capture_on_commit_callbacks(execute=True):
+            student_service.delete_by_id(existing_student.id)
+        assert student_service.find_by_id(existing_student.id) is None
+        assert student_service.find_page(1, 10) == ([], 0)
+
+    def test_find_by_ids_reads_cache_and_loads_misses_in_one_query(
+        self, student_service, existing_student, other_student, django_assert_num_queries
+    ):
+        student_service.find_by_id(existing_student.id)
+        with django_assert_num_queries(1):
+            found = student_service.find_by_ids([other_student.id, existing_student.id, 99999])
+        assert list(found) == [other_student.id, existing_student.id]
+        with django_assert_num_queries(0):
+            found = student_service.find_by_ids([other_student.id])
+        assert found[other_student.id] == other_student
+
+    def test_find_by_student_numbers_follows_number_changes(
+        self,
+        student_service,
+        existing_student,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        number = existing_student.student_number
+        assert student_service.find_by_student_numbers([number, 1]) == {number: existing_student}
+        with django_assert_num_queries(0):
+            assert list(student_service.find_by_student_numbers([number])) == [number]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            student_service.update(existing_student.id, {"student_number": 77777})
+        assert student_service.find_by_student_numbers([number]) == {}
+        assert student_service.find_by_student_numbers([77777])[77777].id == existing_student.id
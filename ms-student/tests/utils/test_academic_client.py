@@ -0,0 +1,92 @@
+import threading
+from unittest.mock import Mock, patch
+
+import requests
+from django.test import SimpleTestCase, override_settings
+
+from app.utils.academic_client import AcademicServiceClient
+from app.utils.deadline import DeadlineExceeded, deadline_scope
+
+
+def response(status_code: int, json=None) -> Mock:
+    return Mock(status_code=status_code, json=Mock(return_value=json))
+
+
+@override_settings(
+    ACADEMIC_SERVICE_RETRIES=2, ACADEMIC_SERVICE_BACKOFF=0.1, ACADEMIC_SERVICE_HEDGE_PERCENTILE=0
+)
+@patch("app.utils.academic_client.time.sleep")
+@patch("app.utils.academic_client.requests.get")
+class AcademicServiceClientTest(SimpleTestCase):
+    def setUp(self):
+        self.client = AcademicServiceClient()
+        AcademicServiceClient.breaker.close()
+        AcademicServiceClient.latencies.clear()
+        self.addCleanup(AcademicServiceClient.breaker.close)
+        self.addCleanup(AcademicServiceClient.latencies.clear)
+
+    def test_transient_failure_is_retried_with_jittered_backoff(self, get, sleep):
+        get.side_effect = [requests.ConnectionError(), response(503), response(200)]
+        self.assertTrue(self.client.validate_specialty(1))
+        self.assertEqual(get.call_count, 3)
+        first, second = (call.args[0] for call in sleep.call_args_list)
+        self.assertTrue(0 <= first <= 0.1 and 0 <= second <= 0.2)
+
+    def test_retries_are_bounded(self, get, _sleep):
+        get.side_effect = requests.ConnectionError()
+        with self.assertRaises(requests.ConnectionError):
+            self.client.validate_specialty(1)
+        self.assertEqual(get.call_count, 3)
+
+    def test_definitive_answers_are_not_retried(self, get, _sleep):
+        get.return_value = response(404)
+        self.assertFalse(self.client.validate_specialty(1))
+        get.assert_called_once()
+
+    def test_timeout_is_capped_to_the_deadline_and_propagated(self, get, _sleep):
+        get.return_value = response(200, {"id": 1})
+        with deadline_scope(2):
+            self.assertEqual(self.client.get_specialty(1), {"id": 1})
+        timeout = get.call_args.kwargs["timeout"]
+        self.assertLessEqual(timeout, 2)
+        self.assertAlmostEqual(
+            float(get.call_args.kwargs["headers"]["X-Request-Timeout"]), timeout, 2
+        )
+
+    def test_no_call_after_the_deadline(self, get, _sleep):
+        with deadline_scope(-1), self.assertRaises(DeadlineExceeded):
+            self.client.validate_specialty(1)
+        get.assert_not_called()
+        self.assertEqual(AcademicServiceClient.breaker.fail_counter, 0)
+
+    def test_no_backoff_past_the_deadline(self, get, sleep):
+        get.side_effect = requests.ConnectionError()
+        with override_settings(ACADEMIC_SERVICE_BACKOFF=10, ACADEMIC_SERVICE_BACKOFF_MAX=10):
+            with deadline_scope(0.001), self.assertRaises(requests.ConnectionError):
+                with patch("app.utils.academic_client.random.uniform", return_value=5):
+                    self.client.validate_specialty(1)
+        get.assert_called_once()
+        sleep.assert_not_called()
+
+    @override_settings(ACADEMIC_SERVICE_HEDGE_PERCENTILE=95)
+    def test_slow_read_is_hedged(self, get, _sleep):
+        for _ in range(20):
+            AcademicServiceClient.latencies.add(0.01)
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def slow_then_fast(url, timeout, headers):
+            if get.call_count == 1:
+                release.wait(5)
+                return response(200, {"id": 1, "from": "first"})
+            return response(200, {"id": 1, "from": "hedge"})
+
+        get.side_effect = slow_then_fast
+        self.assertEqual(self.client.get_specialty(1), {"id": 1, "from": "hedge"})
+        self.assertEqual(get.call_count, 2)
+
+    @override_settings(ACADEMIC_SERVICE_HEDGE_PERCENTILE=95)
+    def test_no_hedging_without_enough_samples(self, get, _sleep):
+        get.return_value = response(200, {"id": 1})
+        self.client.get_specialty(1)
+        get.assert_called_once()
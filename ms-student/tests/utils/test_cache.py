@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from app.utils import cache as tagged_cache
+from app.utils.cache import (
+    get_many_tagged,
+    get_tagged,
+    invalidate_tags,
+    set_many_tagged,
+    set_tagged,
+)
+
+
+class TaggedCacheTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_entry_is_served_until_a_tag_is_invalidated(self):
+        _, stamp = get_tagged("student:1", ["student:1", "specialty:3"])
+        set_tagged("student:1", "row", stamp, timeout=60)
+        self.assertEqual(get_tagged("student:1", ["student:1", "specialty:3"])[0], "row")
+
+        invalidate_tags(["specialty:3"])
+        self.assertIsNone(get_tagged("student:1", ["student:1", "specialty:3"])[0])
+
+    def test_one_tag_retires_every_entry_registered_under_it(self):
+        entries = {f"students:page:{page}:10": ["list:students"] for page in range(1, 4)}
+        found = get_many_tagged(entries)
+        set_many_tagged({key: (f"page {key}", stamp) for key, (_, stamp) in found.items()}, 60)
+        self.assertTrue(all(value for value, _ in get_many_tagged(entries).values()))
+
+        invalidate_tags(["list:students"])
+        self.assertTrue(all(value is None for value, _ in get_many_tagged(entries).values()))
+
+    def test_lookup_of_many_keys_is_one_get_many(self):
+        entries = {f"student:{id}": [f"student:{id}"] for id in range(50)}
+        with (
+            patch.object(cache, "get_many", wraps=cache.get_many) as get_many,
+            patch.object(cache, "set_many", wraps=cache.set_many) as set_many,
+        ):
+            get_many_tagged(entries)
+        self.assertEqual(get_many.call_count, 1)
+        # Missing tag versions are created together, not one add per tag.
+        self.assertEqual(set_many.call_count, 1)
+
+    def test_invalidation_is_batched(self):
+        tags = [f"student:{id}" for id in range(25)]
+        with (
+            patch.object(tagged_cache, "BATCH_SIZE", 10),
+            patch.object(cache, "set_many", wraps=cache.set_many) as set_many,
+        ):
+            versions = invalidate_tags(tags)
+        self.assertEqual(set_many.call_count, 3)
+        self.assertEqual(set(versions), set(tags))
+
+    def test_lost_tag_version_does_not_revive_old_entries(self):
+        _, stamp = get_tagged("student:1", ["student:1"])
+        set_tagged("student:1", "row", stamp, timeout=60)
+        cache.delete("tag:student:1")  # evicted
+        self.assertIsNone(get_tagged("student:1", ["student:1"])[0])
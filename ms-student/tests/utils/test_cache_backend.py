@@ -0,0 +1,88 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from app.utils.cache_backend import ResilientRedisCache
+
+OPTIONS = {
+    "CLIENT_CLASS": "django_redis.client.DefaultClient",
+    "SOCKET_CONNECT_TIMEOUT": 0.1,
+    "SOCKET_TIMEOUT": 0.1,
+}
+
+
+def make_cache(location):
+    return ResilientRedisCache(location, {"OPTIONS": OPTIONS, "KEY_PREFIX": "resilient-test"})
+
+
+class ResilientRedisCacheTest(SimpleTestCase):
+    def setUp(self):
+        ResilientRedisCache.reset()
+        self.down = make_cache("redis://localhost:1/0")  # nothing listens on port 1
+        self.up = make_cache(settings.CACHES["default"]["LOCATION"])
+        self.up.clear()
+        self.addCleanup(ResilientRedisCache.reset)
+
+    def test_reads_fail_open_when_redis_is_down(self):
+        self.assertIsNone(self.down.get("student:1"))
+        self.assertEqual(self.down.get_many(["a", "b"]), {})
+        self.assertEqual(ResilientRedisCache.status()["status"], "degraded")
+
+    def test_writes_go_to_in_process_fallback(self):
+        self.down.set("student:1", {"id": 1}, timeout=300)
+        self.assertEqual(self.down.get("student:1"), {"id": 1})
+        self.assertTrue(self.down.add("gen:student:1", 1))
+        self.assertEqual(self.down.incr("gen:student:1"), 2)
+
+    def test_incr_of_missing_key_still_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.up.incr("missing")
+        with self.assertRaises(ValueError):
+            self.down.incr("missing")
+        self.assertEqual(ResilientRedisCache.breaker.fail_counter, 1)
+
+    def test_breaker_opens_and_short_circuits(self):
+        for _ in range(settings.CACHE_BREAKER_FAIL_MAX):
+            self.down.get("student:1")
+        self.assertEqual(ResilientRedisCache.breaker.current_state, "open")
+        # A healthy backend is not tried either while the breaker is open.
+        self.up.set("student:2", "fallback-only")
+        self.assertIsNone(cache.get("resilient-test:1:student:2"))
+        self.assertEqual(ResilientRedisCache.status()["breaker_open"], 1)
+
+    def test_recovery_drops_keys_written_while_degraded(self):
+        self.up.set("student:1", "stale")
+        self.down.delete("student:1")  # invalidation lost while Redis was unreachable
+        self.down.set("student:3", "local")
+
+        self.assertIsNone(self.up.get("student:1"))
+        self.assertEqual(ResilientRedisCache.status()["status"], "ok")
+        self.assertEqual(ResilientRedisCache.status()["recoveries"], 1)
+        self.assertIsNone(ResilientRedisCache.fallback.get("student:3"))
+
+    def test_fallback_timeout_is_capped(self):
+        self.down.set("student:1", "local", timeout=None)
+        key = ResilientRedisCache.fallback.make_key("student:1")
+        expires = ResilientRedisCache.fallback._expire_info[key]
+        self.assertLessEqual(expires, time.time() + settings.CACHE_FALLBACK_TIMEOUT)
+
+
+class HealthCheckCacheStatusTest(TestCase):
+    def setUp(self):
+        ResilientRedisCache.reset()
+        self.addCleanup(ResilientRedisCache.reset)
+
+    def test_reports_cache_status(self):
+        response = APIClient().get("/health/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["cache"]["status"], "ok")
+
+    def test_degraded_cache_keeps_service_healthy(self):
+        make_cache("redis://localhost:1/0").get("student:1")
+        response = APIClient().get("/health/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], "healthy")
+        self.assertEqual(response.data["cache"]["status"], "degraded")
@@ -0,0 +1,85 @@
+import pickle
+import zlib
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from app.models import DocumentType, Student
+from app.utils import cache_codec
+from app.utils.cache_codec import CompactSerializer, ThresholdZlibCompressor, dumps, loads
+
+
+class CompactCodecTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.document_type = DocumentType.objects.create(
+            name="DNI", description="Documento Nacional de Identidad"
+        )
+        cls.student = Student.objects.create(
+            first_name="Juan",
+            last_name="Pérez",
+            document_number="12345678",
+            birth_date=date(2000, 5, 15),
+            gender="M",
+            student_number=1001,
+            enrollment_date=date(2020, 3, 1),
+            document_type=cls.document_type,
+            specialty_id=1,
+        )
+
+    def test_student_round_trip(self):
+        student = loads(dumps(self.student))
+        self.assertIsInstance(student, Student)
+        self.assertFalse(student._state.adding)
+        for field in Student._meta.concrete_fields:
+            self.assertEqual(getattr(student, field.attname), getattr(self.student, field.attname))
+
+    def test_versioned_page_round_trip(self):
+        entry = ((1718000000000000,), ([self.student], 1))
+        stamp, (students, count) = loads(dumps(entry))
+        self.assertEqual(stamp, (1718000000000000,))
+        self.assertEqual(students, [self.student])
+        self.assertEqual(count, 1)
+
+    def test_mixed_list_round_trip(self):
+        value = [self.student, self.document_type, None]
+        self.assertEqual(loads(dumps(value)), value)
+
+    def test_scalars_and_dicts_round_trip(self):
+        value = {
+            "a": [1, 2.5, None, True],
+            3: ("x", date(2020, 1, 1)),
+            "when": self.student.created_at,
+        }
+        self.assertEqual(loads(dumps(value)), value)
+
+    def test_smaller_than_pickle(self):
+        self.assertLess(len(dumps(self.student)), len(pickle.dumps(self.student)))
+
+    def test_schema_change_reads_as_miss(self):
+        data = dumps(self.student).replace(
+            str(cache_codec._model_schema("student")[3]).encode(), b"1", 1
+        )
+        self.assertIsNone(CompactSerializer({}).loads(data))
+
+    def test_legacy_pickle_reads_as_miss(self):
+        self.assertIsNone(CompactSerializer({}).loads(pickle.dumps(self.student)))
+
+    def test_unknown_type_is_rejected(self):
+        with self.assertRaises(TypeError):
+            dumps(object())
+
+    def test_cache_round_trip_through_redis(self):
+        cache.set("codec-test", (1, [self.student]))
+        self.assertEqual(cache.get("codec-test"), (1, [self.student]))
+
+
+class ThresholdZlibCompressorTest(TestCase):
+    @override_settings(CACHE_COMPRESS_MIN_BYTES=100)
+    def test_compresses_only_above_threshold(self):
+        compressor = ThresholdZlibCompressor({})
+        small = dumps("x" * 10)
+        large = dumps("x" * 1000)
+        self.assertEqual(compressor.compress(small), small)
+        self.assertEqual(zlib.decompress(compressor.compress(large)), large)
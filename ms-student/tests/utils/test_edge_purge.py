@@ -0,0 +1,56 @@
+from unittest.mock import patch
+
+import requests
+from django.test import SimpleTestCase, override_settings
+from django_redis import get_redis_connection
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.utils.edge_purge import PENDING_KEY, purge_pending, queue_surrogate_keys
+
+
+@override_settings(EDGE_PURGE_URL="http://edge.local/purge", EDGE_PURGE_TIMEOUT=0.5)
+class EdgePurgeTest(SimpleTestCase):
+    def setUp(self):
+        self.redis = get_redis_connection("default")
+        self.redis.delete(PENDING_KEY)
+        self.addCleanup(self.redis.delete, PENDING_KEY)
+
+    @patch("app.utils.edge_purge.requests.post")
+    def test_queueing_does_not_call_the_edge_cache(self, post):
+        queue_surrogate_keys(None, tags=["student:7", "list:students"])
+        post.assert_not_called()
+        self.assertEqual(self.redis.scard(PENDING_KEY), 2)
+
+    @patch("app.utils.edge_purge.requests.post")
+    def test_keys_invalidated_by_several_writes_are_purged_once(self, post):
+        queue_surrogate_keys(None, tags=["student:7", "list:students"])
+        queue_surrogate_keys(None, tags=["student:8", "list:students"])
+        self.assertEqual(purge_pending(10), 3)
+        post.assert_called_once_with(
+            "http://edge.local/purge",
+            json={"surrogate_keys": ["list:students", "student:7", "student:8"]},
+            timeout=0.5,
+        )
+        self.assertEqual(self.redis.scard(PENDING_KEY), 0)
+
+    @patch("app.utils.edge_purge.requests.post")
+    def test_one_request_per_batch(self, post):
+        queue_surrogate_keys(None, tags=[f"student:{id}" for id in range(5)])
+        self.assertEqual(purge_pending(2), 2)
+        self.assertEqual(post.call_count, 1)
+        self.assertEqual(self.redis.scard(PENDING_KEY), 3)
+
+    @patch("app.utils.edge_purge.requests.post", side_effect=requests.ConnectionError("down"))
+    def test_failed_purge_requeues_the_keys(self, _post):
+        queue_surrogate_keys(None, tags=["student:7"])
+        with self.assertLogs("app.utils.edge_purge", "WARNING"):
+            self.assertEqual(purge_pending(10), 0)
+        self.assertEqual(self.redis.smembers(PENDING_KEY), {b"student:7"})
+
+    @patch(
+        "app.utils.edge_purge.get_redis_connection",
+        side_effect=RedisConnectionError("down"),
+    )
+    def test_queue_failures_do_not_propagate(self, _connection):
+        with self.assertLogs("app.utils.edge_purge", "WARNING"):
+            queue_surrogate_keys(None, tags=["student:7"])
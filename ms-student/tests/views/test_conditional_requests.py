@@ -0,0 +1,122 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app.models import DocumentType, Student
+from app.services import DocumentTypeService
+
+
+@patch("app.utils.academic_client.AcademicServiceClient.validate_specialty", return_value=True)
+class StudentConditionalRequestTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.document_type = DocumentType.objects.create(name="DNI")
+        self.student = Student.objects.create(
+            first_name="Juan",
+            last_name="Pérez",
+            document_number="30000000",
+            birth_date=date(2000, 5, 15),
+            gender="M",
+            student_number=3000,
+            enrollment_date=date(2020, 3, 1),
+            document_type=self.document_type,
+            specialty_id=1,
+        )
+        self.url = f"/api/v1/students/{self.student.id}/"
+
+    def test_retrieve_returns_strong_etag(self, _validate):
+        response = self.client.get(self.url)
+        self.assertTrue(response["ETag"].startswith(f'"student-{self.student.id}-'))
+
+    def test_matching_if_none_match_is_not_modified_without_queries(self, _validate):
+        etag = self.client.get(self.url)["ETag"]
+        with (
+            self.assertNumQueries(0),
+            patch("app.views.student.StudentViewSet.serialize") as serialize,
+        ):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=f'"other", W/{etag}')
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+        serialize.assert_not_called()
+
+    def test_etag_changes_after_update(self, _validate):
+        etag = self.client.get(self.url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            updated = self.client.patch(self.url, {"first_name": "Pedro"}, format="json")
+        self.assertNotEqual(updated["ETag"], etag)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], updated["ETag"])
+
+    def test_list_etag_follows_list_generation(self, _validate):
+        etag = self.client.get("/api/v1/students/")["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/v1/students/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertNotEqual(self.client.get("/api/v1/students/?page_size=5")["ETag"], etag)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(self.url, {"first_name": "Pedro"}, format="json")
+        response = self.client.get("/api/v1/students/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["first_name"], "Pedro")
+
+    def test_if_match_current_etag_allows_update(self, _validate):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.patch(
+            self.url, {"first_name": "Pedro"}, format="json", HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_if_match_stale_etag_rejects_lost_update(self, _validate):
+        stale = self.client.get(self.url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(self.url, {"first_name": "Pedro"}, format="json")
+        response = self.client.patch(
+            self.url, {"last_name": "Gómez"}, format="json", HTTP_IF_MATCH=stale
+        )
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.student.refresh_from_db()
+        self.assertEqual(self.student.last_name, "Pérez")
+
+    def test_if_match_weak_etag_never_matches(self, _validate):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.patch(
+            self.url, {"first_name": "Pedro"}, format="json", HTTP_IF_MATCH=f"W/{etag}"
+        )
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+    def test_if_match_star_requires_existing_student(self, _validate):
+        response = self.client.patch(
+            self.url, {"first_name": "Pedro"}, format="json", HTTP_IF_MATCH="*"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class DocumentTypeConditionalRequestTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.document_type = DocumentType.objects.create(name="DNI")
+
+    def test_list_not_modified_until_document_types_change(self):
+        etag = self.client.get("/api/v1/document-types/")["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/v1/document-types/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            DocumentTypeService().create({"name": "PASAPORTE"})
+        response = self.client.get("/api/v1/document-types/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+    def test_retrieve_not_modified(self):
+        url = f"/api/v1/document-types/{self.document_type.id}/"
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(etag[1:].split("-")[0], "documenttype")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
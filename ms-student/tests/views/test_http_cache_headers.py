@@ -0,0 +1,76 @@
+from datetime import date
+
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app.models import DocumentType, Student
+from app.services import DocumentTypeService
+from app.utils.cache import tags_invalidated
+
+
+class HttpCacheHeadersTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.document_type = DocumentType.objects.create(name="DNI")
+        self.student = Student.objects.create(
+            first_name="Juan",
+            last_name="Pérez",
+            document_number="30000000",
+            birth_date=date(2000, 5, 15),
+            gender="M",
+            student_number=3000,
+            enrollment_date=date(2020, 3, 1),
+            document_type=self.document_type,
+            specialty_id=1,
+        )
+
+    def test_document_type_list_is_cacheable_at_the_edge(self):
+        response = self.client.get("/api/v1/document-types/")
+        self.assertEqual(response["Cache-Control"], "public, max-age=3600, s-maxage=86400")
+        self.assertIn("Accept", response["Vary"])
+        self.assertEqual(response["Surrogate-Key"], "list:document_types")
+
+    def test_document_type_retrieve_has_entity_surrogate_key(self):
+        response = self.client.get(f"/api/v1/document-types/{self.document_type.id}/")
+        self.assertEqual(response["Surrogate-Key"], f"document_type:{self.document_type.id}")
+
+    def test_student_responses_use_student_policy(self):
+        detail = self.client.get(f"/api/v1/students/{self.student.id}/")
+        self.assertEqual(detail["Cache-Control"], "public, max-age=0, s-maxage=60")
+        self.assertEqual(detail["Surrogate-Key"], f"all:students student:{self.student.id}")
+        self.assertEqual(self.client.get("/api/v1/students/")["Surrogate-Key"], "list:students")
+
+    def test_not_modified_keeps_cache_headers(self):
+        url = f"/api/v1/students/{self.student.id}/"
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertIn(f"student:{self.student.id}", response["Surrogate-Key"].split())
+
+    def test_errors_and_writes_are_not_cacheable(self):
+        missing = self.client.get("/api/v1/students/999999/")
+        self.assertFalse(missing.has_header("Cache-Control"))
+        lookup = self.client.post("/api/v1/students/lookup/", {"ids": [1]}, format="json")
+        self.assertFalse(lookup.has_header("Surrogate-Key"))
+
+    @override_settings(SURROGATE_KEY_HEADER="Cache-Tag")
+    def test_surrogate_key_header_is_configurable(self):
+        response = self.client.get("/api/v1/document-types/")
+        self.assertEqual(response["Cache-Tag"], "list:document_types")
+
+    def test_writes_signal_invalidated_keys(self):
+        received = []
+
+        def receiver(sender, tags, **kwargs):
+            received.extend(tags)
+
+        tags_invalidated.connect(receiver)
+        self.addCleanup(tags_invalidated.disconnect, receiver)
+        with self.captureOnCommitCallbacks(execute=True):
+            DocumentTypeService().update(self.document_type.id, {"description": "Documento"})
+            self.client.delete(f"/api/v1/students/{self.student.id}/")
+        self.assertIn(f"document_type:{self.document_type.id}", received)
+        self.assertIn("list:document_types", received)
+        self.assertIn(f"student:{self.student.id}", received)
+        self.assertIn("list:students", received)
@@ -0,0 +1,80 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app.models import DocumentType, Job, Student
+from app.services import JobService
+
+
+@patch("app.utils.academic_client.AcademicServiceClient.validate_specialty", return_value=True)
+class JobViewSetTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = "/api/v1/jobs/"
+        document_type = DocumentType.objects.create(name="DNI")
+        for index in range(3):
+            Student.objects.create(
+                first_name="Juan",
+                last_name="Pérez",
+                document_number=f"3000000{index}",
+                birth_date=date(2000, 5, 15),
+                gender="M",
+                student_number=3000 + index,
+                enrollment_date=date(2020, 3, 1),
+                document_type=document_type,
+                specialty_id=1,
+            )
+
+    def _create(self, **data):
+        return self.client.post(self.url, data, format="json")
+
+    def test_create_queues_job(self, validate):
+        response = self._create(
+            kind="students.bulk_update",
+            params={"filter": {"specialty_id": 1}, "changes": {"specialty_id": 9}},
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        job = Job.objects.get()
+        self.assertEqual(response["Location"], f"/api/v1/jobs/{job.id}/")
+        self.assertEqual((response.data["status"], response.data["total"]), (Job.QUEUED, 3))
+        self.assertEqual(response.data["progress"], 0.0)
+        validate.assert_called_once_with(9)
+        # Nothing is changed until a worker runs the job.
+        self.assertFalse(Student.objects.filter(specialty_id=9).exists())
+
+    def test_create_rejects_unknown_kind(self, _validate):
+        response = self._create(kind="students.explode", params={})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("kind", response.data)
+
+    def test_create_validates_params(self, _validate):
+        response = self._create(kind="students.bulk_update", params={"ids": [1]})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("changes", response.data["params"])
+
+    def test_create_rejects_missing_specialty(self, validate):
+        validate.return_value = False
+        response = self._create(
+            kind="students.bulk_update", params={"ids": [1], "changes": {"specialty_id": 9}}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Job.objects.exists())
+
+    def test_retrieve_reports_progress(self, _validate):
+        response = self._create(kind="students.delete", params={"filter": {"specialty_id": 1}})
+        job_id = response.data["id"]
+        JobService().run_next("w1")
+
+        response = self.client.get(f"{self.url}{job_id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], Job.SUCCEEDED)
+        self.assertEqual((response.data["processed"], response.data["progress"]), (3, 1.0))
+        self.assertEqual(response.data["result"], {"processed": 3})
+        self.assertFalse(Student.objects.filter(is_active=True).exists())
+
+    def test_retrieve_not_found(self, _validate):
+        response = self.client.get(f"{self.url}999/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,148 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app.models import DocumentType, Student
+from app.utils.query_budget import assert_view_query_budget
+from app.views import DocumentTypeViewSet, JobViewSet, StudentViewSet
+
+
+@patch("app.utils.academic_client.AcademicServiceClient.validate_specialty", return_value=True)
+class StudentQueryBudgetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.document_type = DocumentType.objects.create(
+            name="DNI", description="Documento Nacional de Identidad"
+        )
+        # Enough rows that a per-row query in the serializer blows every budget.
+        self.students = [
+            Student.objects.create(
+                first_name="Juan",
+                last_name="Pérez",
+                document_number=f"1234567{index}",
+                birth_date=date(2000, 5, 15),
+                gender="M",
+                student_number=1000 + index,
+                enrollment_date=date(2020, 3, 1),
+                document_type=self.document_type,
+                specialty_id=1,
+            )
+            for index in range(10)
+        ]
+        self.detail_url = f"/api/v1/students/{self.students[0].id}/"
+        self.valid_data = {
+            "first_name": "María",
+            "last_name": "García",
+            "document_number": "87654321",
+            "document_type_id": self.document_type.id,
+            "birth_date": "2001-08-20",
+            "gender": "F",
+            "student_number": 2002,
+            "enrollment_date": "2020-03-01",
+            "specialty_id": 2,
+        }
+
+    def test_list(self, _validate):
+        with assert_view_query_budget(StudentViewSet, "list"):
+            response = self.client.get("/api/v1/students/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 10)
+
+    @patch("app.utils.academic_client.AcademicServiceClient.get_specialty", return_value=None)
+    def test_list_with_expand(self, _get_specialty, _validate):
+        with assert_view_query_budget(StudentViewSet, "list"):
+            response = self.client.get("/api/v1/students/?expand=specialty")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve(self, _validate):
+        with assert_view_query_budget(StudentViewSet, "retrieve"):
+            response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_create(self, _validate):
+        with assert_view_query_budget(StudentViewSet, "create"):
+            response = self.client.post("/api/v1/students/", self.valid_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_update(self, _validate):
+        with assert_view_query_budget(StudentViewSet, "update"):
+            response = self.client.put(self.detail_url, self.valid_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_partial_update(self, _validate):
+        with assert_view_query_budget(StudentViewSet, "partial_update"):
+            response = self.client.patch(self.detail_url, {"first_name": "Pedro"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_changes(self, _validate):
+        with self.settings(CHANGE_FEED_SETTLE_SECONDS=0):
+            with assert_view_query_budget(StudentViewSet, "changes"):
+                response = self.client.get("/api/v1/students/changes/")
+        self.assertEqual(len(response.data["results"]), 10)
+
+    def test_exists(self, _validate):
+        ids = ",".join(str(student.id) for student in self.students)
+        with assert_view_query_budget(StudentViewSet, "exists"):
+            response = self.client.get(
+                "/api/v1/students/exists/",
+                {"id": ids, "student_number": "1000,1001", "document_number": "12345670"},
+            )
+        self.assertTrue(all(response.data["id"].values()))
+
+    def test_bulk_update(self, _validate):
+        with assert_view_query_budget(StudentViewSet, "bulk_update"):
+            response = self.client.patch(
+                "/api/v1/students/bulk/",
+                {
+                    "filter": {"specialty_id": 1},
+                    "changes": {"specialty_id": 2, "document_type_id": self.document_type.id},
+                },
+                format="json",
+            )
+        self.assertEqual(response.data["updated"], 10)
+
+    def test_destroy(self, _validate):
+        with assert_view_query_budget(StudentViewSet, "destroy"):
+            response = self.client.delete(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_job_create_and_retrieve(self, _validate):
+        with assert_view_query_budget(JobViewSet, "create"):
+            response = self.client.post(
+                "/api/v1/jobs/",
+                {
+                    "kind": "students.bulk_update",
+                    "params": {
+                        "filter": {"specialty_id": 1},
+                        "changes": {"document_type_id": self.document_type.id},
+                    },
+                },
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        with assert_view_query_budget(JobViewSet, "retrieve"):
+            response = self.client.get(response["Location"])
+        self.assertEqual(response.data["total"], 10)
+
+
+class DocumentTypeQueryBudgetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        for name in ("DNI", "LC", "LE", "PASAPORTE"):
+            self.document_type = DocumentType.objects.create(name=name)
+
+    def test_list(self):
+        with assert_view_query_budget(DocumentTypeViewSet, "list"):
+            response = self.client.get("/api/v1/document-types/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve(self):
+        with assert_view_query_budget(DocumentTypeViewSet, "retrieve"):
+            response = self.client.get(f"/api/v1/document-types/{self.document_type.id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
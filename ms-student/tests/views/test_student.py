@@ -1,10 +1,13 @@
 from datetime import date
+from unittest.mock import patch
 
 from django.test import TestCase
+from pybreaker import CircuitBreakerError
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from app.models import DocumentType, Student
+from app.utils.deadline import DeadlineExceeded
 
 
 class StudentViewSetTest(TestCase):
@@ -43,6 +46,21 @@ class StudentViewSetTest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertGreaterEqual(len(response.data), 1)
 
+    def test_list_students_paginated_response(self):
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.data["count"], 1)
+        self.assertIsNone(response.data["next"])
+        self.assertIsNone(response.data["previous"])
+        self.assertEqual(response.data["results"][0]["id"], self.student.id)
+
+    def test_list_students_page_out_of_range(self):
+        response = self.client.get(self.list_url, {"page": 5})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_list_students_invalid_page(self):
+        response = self.client.get(self.list_url, {"page": "abc"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_retrieve_student(self):
         response = self.client.get(self.detail_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -96,6 +114,18 @@ class StudentViewSetTest(TestCase):
         response = self.client.post(self.list_url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_create_student_academic_service_unavailable(self):
+        for error in (DeadlineExceeded("Request deadline exceeded"), CircuitBreakerError()):
+            with (
+                self.subTest(error=type(error).__name__),
+                patch(
+                    "app.utils.academic_client.AcademicServiceClient.validate_specialty",
+                    side_effect=error,
+                ),
+            ):
+                response = self.client.post(self.list_url, self.valid_data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
     def test_update_student(self):
         data = {
             "first_name": "Juan Carlos",
@@ -0,0 +1,104 @@
+from unittest.mock import patch
+
+import pytest
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app.models import DocumentType, OutboxEvent, Student
+from app.repositories import StudentRepository
+from app.services import StudentService
+from app.services.outbox import STUDENT_UPDATED
+
+
+@pytest.mark.usefixtures("create_student")
+@patch("app.utils.academic_client.AcademicServiceClient.validate_specialty", return_value=True)
+class StudentBulkUpdateTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = "/api/v1/students/bulk/"
+        self.document_type = DocumentType.objects.create(name="DNI")
+        self.students = [
+            self.create_student(self.document_type, index, specialty_id=1 + index % 2)
+            for index in range(4)
+        ]
+
+    def test_filter_moves_cohort_with_one_specialty_check(self, validate):
+        response = self.client.patch(
+            self.url, {"filter": {"specialty_id": 1}, "changes": {"specialty_id": 9}}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"updated": 2})
+        validate.assert_called_once_with(9)
+        self.assertEqual(Student.objects.filter(specialty_id=9).count(), 2)
+        self.assertEqual(Student.objects.filter(specialty_id=2).count(), 2)
+
+    def test_ids_update_bumps_version_and_records_events(self, _validate):
+        ids = [self.students[0].id, self.students[3].id]
+        self.client.patch(self.url, {"ids": ids, "changes": {"specialty_id": 9}}, format="json")
+        moved = Student.objects.filter(id__in=ids)
+        self.assertEqual({(s.specialty_id, s.version) for s in moved}, {(9, 2)})
+        self.assertTrue(all(s.updated_at > self.students[0].updated_at for s in moved))
+        events = OutboxEvent.objects.filter(event_type=STUDENT_UPDATED)
+        self.assertEqual(sorted(e.aggregate_id for e in events), sorted(ids))
+        self.assertEqual({e.payload["specialty_id"] for e in events}, {9})
+
+    def test_cached_students_are_invalidated_on_commit(self, _validate):
+        student = self.students[0]
+        self.client.get(f"/api/v1/students/{student.id}/")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                self.url, {"ids": [student.id], "changes": {"specialty_id": 9}}, format="json"
+            )
+        response = self.client.get(f"/api/v1/students/{student.id}/")
+        self.assertEqual(response.data["specialty_id"], 9)
+
+    def test_soft_deleted_students_are_skipped(self, _validate):
+        StudentRepository.delete_by_id(self.students[0].id)
+        response = self.client.patch(
+            self.url, {"filter": {"specialty_id": 1}, "changes": {"specialty_id": 9}}, format="json"
+        )
+        self.assertEqual(response.data, {"updated": 1})
+
+    def test_unknown_specialty_changes_nothing(self, validate):
+        validate.return_value = False
+        response = self.client.patch(
+            self.url, {"filter": {"specialty_id": 1}, "changes": {"specialty_id": 9}}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Student.objects.filter(specialty_id=9).exists())
+
+    def test_requires_exactly_one_selector_and_supported_fields(self, _validate):
+        for body in (
+            {"changes": {"specialty_id": 9}},
+            {"ids": [1], "filter": {"specialty_id": 1}, "changes": {"specialty_id": 9}},
+            {"ids": [1], "changes": {"student_number": 9}},
+            {"filter": {"last_name": 1}, "changes": {"specialty_id": 9}},
+            {"filter": {}, "changes": {"specialty_id": 9}},
+        ):
+            with self.subTest(body=body):
+                response = self.client.patch(self.url, body, format="json")
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch("app.services.student.BULK_BATCH_SIZE", 2)
+    def test_each_batch_commits_on_its_own(self, _validate):
+        # A failure in the second batch leaves the first one applied, with its events.
+        with patch(
+            "app.services.outbox.OutboxService.record_students_updated",
+            autospec=True,
+            side_effect=[None, RuntimeError("outbox unavailable")],
+        ):
+            with self.assertRaises(RuntimeError):
+                StudentService().bulk_update(
+                    {"specialty_id": 9}, ids=[s.id for s in self.students], validate=False
+                )
+        moved = Student.objects.filter(specialty_id=9).values_list("id", flat=True)
+        self.assertEqual(sorted(moved), [self.students[0].id, self.students[1].id])
+
+    @override_settings(STUDENT_BULK_MAX_ROWS=1)
+    def test_too_many_matches_are_rejected(self, _validate):
+        response = self.client.patch(
+            self.url, {"filter": {"specialty_id": 1}, "changes": {"specialty_id": 9}}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Student.objects.filter(specialty_id=9).exists())
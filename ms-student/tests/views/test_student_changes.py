@@ -0,0 +1,63 @@
+import pytest
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app.models import DocumentType
+from app.repositories import StudentRepository
+
+
+@pytest.mark.usefixtures("create_student")
+@override_settings(CHANGE_FEED_SETTLE_SECONDS=0)
+class StudentChangeFeedTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = "/api/v1/students/changes/"
+        self.document_type = DocumentType.objects.create(name="DNI")
+        self.students = [self.create_student(self.document_type, index) for index in range(3)]
+
+    def test_without_cursor_returns_everything_in_order(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [change["id"] for change in response.data["results"]]
+        self.assertEqual(ids, [student.id for student in self.students])
+        self.assertFalse(response.data["has_more"])
+        self.assertFalse(response.data["results"][0]["deleted"])
+
+    def test_cursor_pages_through_changes(self):
+        first = self.client.get(self.url, {"limit": 2})
+        self.assertTrue(first.data["has_more"])
+        second = self.client.get(self.url, {"since": first.data["next_cursor"], "limit": 2})
+        self.assertEqual([c["id"] for c in second.data["results"]], [self.students[2].id])
+        third = self.client.get(self.url, {"since": second.data["next_cursor"]})
+        self.assertEqual(third.data["results"], [])
+        self.assertEqual(third.data["next_cursor"], second.data["next_cursor"])
+
+    def test_updates_and_soft_deletes_appear_after_cursor(self):
+        cursor = self.client.get(self.url).data["next_cursor"]
+        student = self.students[0]
+        student.first_name = "Pedro"
+        student.save()
+        StudentRepository.delete_by_id(self.students[1].id)
+
+        response = self.client.get(self.url, {"since": cursor})
+        changes = {change["id"]: change for change in response.data["results"]}
+        self.assertEqual(changes[student.id]["first_name"], "Pedro")
+        tombstone = changes[self.students[1].id]
+        self.assertTrue(tombstone["deleted"])
+        self.assertIsNotNone(tombstone["deleted_at"])
+        self.assertNotIn("first_name", tombstone)
+
+    @override_settings(CHANGE_FEED_SETTLE_SECONDS=3600)
+    def test_recent_changes_are_held_back(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["results"], [])
+
+    def test_invalid_cursor_returns_400(self):
+        response = self.client.get(self.url, {"since": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_limit_out_of_range_returns_400(self):
+        response = self.client.get(self.url, {"limit": 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("limit", response.data)
@@ -0,0 +1,95 @@
+from datetime import date
+from unittest.mock import Mock
+
+import pytest
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app.models import DocumentType
+from app.repositories import StudentRepository
+from app.services import StudentService
+
+
+@pytest.mark.usefixtures("create_student")
+@override_settings(STUDENT_EXISTS_MAX_AGE=30)
+class StudentExistsTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = "/api/v1/students/exists/"
+        self.document_type = DocumentType.objects.create(name="DNI")
+        self.students = [self.create_student(self.document_type, index) for index in range(2)]
+
+    def test_returns_booleans_per_field(self):
+        first, second = self.students
+        response = self.client.get(
+            self.url,
+            {
+                "id": f"{first.id},999999",
+                "student_number": second.student_number,
+                "document_number": "30000000,nope",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            {
+                "id": {str(first.id): True, "999999": False},
+                "student_number": {str(second.student_number): True},
+                "document_number": {"30000000": True, "nope": False},
+            },
+        )
+        self.assertEqual(response["Cache-Control"], "max-age=30")
+
+    def test_answers_are_cached_including_negatives(self):
+        params = {"id": f"{self.students[0].id},999999", "document_number": "missing"}
+        self.client.get(self.url, params)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, params)
+        self.assertFalse(response.data["document_number"]["missing"])
+
+    def test_cached_negative_is_invalidated_by_create(self):
+        self.client.get(self.url, {"student_number": 4000})
+        with self.captureOnCommitCallbacks(execute=True):
+            StudentService(academic_client=Mock()).create(
+                {
+                    "first_name": "Ana",
+                    "last_name": "López",
+                    "document_number": "40000000",
+                    "birth_date": date(2000, 5, 15),
+                    "gender": "F",
+                    "student_number": 4000,
+                    "enrollment_date": date(2020, 3, 1),
+                    "document_type_id": self.document_type.id,
+                    "specialty_id": 1,
+                }
+            )
+        response = self.client.get(self.url, {"student_number": 4000})
+        self.assertTrue(response.data["student_number"]["4000"])
+
+    def test_soft_deleted_students_do_not_exist(self):
+        StudentRepository.delete_by_id(self.students[0].id)
+        response = self.client.get(self.url, {"id": self.students[0].id})
+        self.assertFalse(response.data["id"][str(self.students[0].id)])
+
+    def test_head_reports_existence_in_status(self):
+        found = self.client.head(self.url, {"document_number": "30000001"})
+        self.assertEqual(found.status_code, status.HTTP_200_OK)
+        self.assertEqual(found.content, b"")
+        missing = self.client.head(self.url, {"id": f"{self.students[0].id},999999"})
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_repeated_params_are_accepted(self):
+        response = self.client.get(f"{self.url}?id={self.students[0].id}&id={self.students[1].id}")
+        self.assertEqual(list(response.data["id"].values()), [True, True])
+
+    def test_missing_or_invalid_values_are_rejected(self):
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {"id": "abc"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("id", response.data)
+
+    @override_settings(STUDENT_LOOKUP_MAX_ITEMS=2)
+    def test_too_many_values_are_rejected(self):
+        response = self.client.get(self.url, {"id": "1,2", "student_number": "3"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
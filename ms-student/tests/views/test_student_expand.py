@@ -0,0 +1,166 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app.models import DocumentType, Student
+from app.serializers import StudentSerializer
+from app.services import DocumentTypeService
+from app.utils.cache import specialty_key
+
+SPECIALTIES = {
+    1: {"id": 1, "nombre": "Ingeniería en Sistemas"},
+    2: {"id": 2, "nombre": "Ingeniería Civil"},
+}
+
+
+def get_specialty(self, specialty_id):
+    return SPECIALTIES.get(specialty_id)
+
+
+@patch(
+    "app.utils.academic_client.AcademicServiceClient.get_specialty",
+    autospec=True,
+    side_effect=get_specialty,
+)
+class StudentExpandSpecialtyTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        document_type = DocumentType.objects.create(name="DNI")
+        # Six students over three specialties; specialty 3 is unknown to the academic service.
+        self.students = [
+            Student.objects.create(
+                first_name="Juan",
+                last_name="Pérez",
+                document_number=f"3000000{index}",
+                birth_date=date(2000, 5, 15),
+                gender="M",
+                student_number=3000 + index,
+                enrollment_date=date(2020, 3, 1),
+                document_type=document_type,
+                specialty_id=[1, 1, 2, 2, 1, 3][index],
+            )
+            for index in range(6)
+        ]
+
+    def test_list_fetches_each_distinct_specialty_once(self, get_specialty):
+        response = self.client.get("/api/v1/students/?expand=specialty")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sorted(call.args[1] for call in get_specialty.call_args_list), [1, 2, 3])
+        by_id = {row["id"]: row for row in response.data["results"]}
+        self.assertEqual(by_id[self.students[0].id]["specialty"], SPECIALTIES[1])
+        self.assertEqual(by_id[self.students[2].id]["specialty"], SPECIALTIES[2])
+        self.assertIsNone(by_id[self.students[5].id]["specialty"])
+
+    def test_specialties_are_cached(self, get_specialty):
+        self.client.get("/api/v1/students/?expand=specialty")
+        self.assertEqual(cache.get(specialty_key(1)), SPECIALTIES[1])
+        get_specialty.reset_mock()
+
+        self.client.get(f"/api/v1/students/{self.students[0].id}/?expand=specialty")
+        get_specialty.assert_not_called()
+        # Unknown specialties are remembered too, until their short entry expires.
+        url = f"/api/v1/students/{self.students[5].id}/?expand=specialty"
+        self.assertIsNone(self.client.get(url).data["specialty"])
+        get_specialty.assert_not_called()
+        cache.delete(specialty_key(3))
+        self.client.get(url)
+        get_specialty.assert_called_once()
+
+    def test_unreachable_specialties_are_not_fetched_on_every_page(self, get_specialty):
+        get_specialty.side_effect = None
+        get_specialty.return_value = None  # what get_specialty returns when the call fails
+        self.client.get("/api/v1/students/?expand=specialty")
+        self.assertEqual(get_specialty.call_count, 3)
+        response = self.client.get("/api/v1/students/?expand=specialty")
+        self.assertEqual(get_specialty.call_count, 3)
+        self.assertTrue(all(row["specialty"] is None for row in response.data["results"]))
+
+    def test_without_expand_nothing_is_fetched(self, get_specialty):
+        response = self.client.get(f"/api/v1/students/{self.students[0].id}/")
+        self.assertNotIn("specialty", response.data)
+        get_specialty.assert_not_called()
+
+    def test_unknown_expand_is_rejected(self, _get_specialty):
+        response = self.client.get("/api/v1/students/?expand=specialty,grades")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("grades", str(response.data["expand"]))
+
+    def test_etag_covers_the_embedded_specialty(self, _get_specialty):
+        url = f"/api/v1/students/{self.students[0].id}/"
+        plain = self.client.get(url)["ETag"]
+        expanded = self.client.get(f"{url}?expand=specialty")["ETag"]
+        self.assertNotEqual(plain, expanded)
+        self.assertEqual(
+            self.client.get(f"{url}?expand=specialty", HTTP_IF_NONE_MATCH=expanded).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+
+        cache.set(specialty_key(1), {"id": 1, "nombre": "Ingeniería en Sistemas de Información"})
+        response = self.client.get(f"{url}?expand=specialty", HTTP_IF_NONE_MATCH=expanded)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], expanded)
+
+
+class StudentExpandDocumentTypeTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.dni = DocumentType.objects.create(
+            name="DNI", description="Documento Nacional de Identidad"
+        )
+        self.passport = DocumentType.objects.create(name="PASAPORTE", description="Pasaporte")
+        self.students = [
+            Student.objects.create(
+                first_name="Juan",
+                last_name="Pérez",
+                document_number=f"3000000{index}",
+                birth_date=date(2000, 5, 15),
+                gender="M",
+                student_number=3000 + index,
+                enrollment_date=date(2020, 3, 1),
+                document_type=[self.dni, self.passport][index % 2],
+                specialty_id=1,
+            )
+            for index in range(4)
+        ]
+
+    def test_list_embeds_document_types_without_queries(self):
+        DocumentTypeService().snapshot()
+        self.client.get("/api/v1/students/")  # warm the page
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/v1/students/?expand=document_type")
+        by_id = {row["id"]: row for row in response.data["results"]}
+        self.assertEqual(
+            by_id[self.students[1].id]["document_type"],
+            {"id": self.passport.id, "name": "PASAPORTE", "description": "Pasaporte"},
+        )
+        self.assertEqual(by_id[self.students[0].id]["document_type"]["name"], "DNI")
+
+    def test_both_expansions(self):
+        with patch(
+            "app.utils.academic_client.AcademicServiceClient.get_specialty",
+            return_value=SPECIALTIES[1],
+        ):
+            response = self.client.get(
+                f"/api/v1/students/{self.students[0].id}/?expand=specialty&expand=document_type"
+            )
+        self.assertEqual(response.data["specialty"], SPECIALTIES[1])
+        self.assertEqual(response.data["document_type"]["id"], self.dni.id)
+
+    def test_snapshot_follows_document_type_updates(self):
+        url = f"/api/v1/students/{self.students[0].id}/?expand=document_type"
+        etag = self.client.get(url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            DocumentTypeService().update(self.dni.id, {"description": "DNI argentino"})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["document_type"]["description"], "DNI argentino")
+
+    def test_loaded_relation_is_used(self):
+        student = Student.objects.select_related("document_type").get(id=self.students[0].id)
+        with self.assertNumQueries(0):
+            data = StudentSerializer(student, context={"document_types": {}}).data
+        self.assertEqual(data["document_type"]["name"], "DNI")
@@ -0,0 +1,79 @@
+import pytest
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app.models import DocumentType
+from app.repositories import StudentRepository
+
+
+@pytest.mark.usefixtures("create_student")
+class StudentLookupTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = "/api/v1/students/lookup/"
+        self.document_type = DocumentType.objects.create(name="DNI")
+        self.students = [self.create_student(self.document_type, index) for index in range(3)]
+
+    def test_results_are_keyed_by_input_identifier(self):
+        first, second, _ = self.students
+        response = self.client.post(
+            self.url,
+            {"ids": [second.id, 999999], "student_numbers": [first.student_number, 1]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data["ids"]), [str(second.id), "999999"])
+        self.assertEqual(
+            response.data["ids"][str(second.id)]["student_number"], second.student_number
+        )
+        self.assertIsNone(response.data["ids"]["999999"])
+        self.assertEqual(
+            response.data["student_numbers"][str(first.student_number)]["id"], first.id
+        )
+        self.assertIsNone(response.data["student_numbers"]["1"])
+
+    def test_only_requested_groups_are_returned(self):
+        response = self.client.post(self.url, {"ids": [self.students[0].id]}, format="json")
+        self.assertEqual(list(response.data), ["ids"])
+
+    def test_second_lookup_is_served_from_cache(self):
+        payload = {
+            "ids": [student.id for student in self.students],
+            "student_numbers": [student.student_number for student in self.students],
+        }
+        self.client.post(self.url, payload, format="json")
+        with self.assertNumQueries(0):
+            response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(len(response.data["student_numbers"]), 3)
+
+    def test_misses_are_fetched_with_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                self.url, {"ids": [student.id for student in self.students]}, format="json"
+            )
+        self.assertTrue(all(response.data["ids"].values()))
+
+    def test_soft_deleted_students_are_not_found(self):
+        deleted = self.students[0]
+        StudentRepository.delete_by_id(deleted.id)
+        response = self.client.post(
+            self.url, {"student_numbers": [deleted.student_number]}, format="json"
+        )
+        self.assertIsNone(response.data["student_numbers"][str(deleted.student_number)])
+
+    def test_empty_lookup_is_rejected(self):
+        response = self.client.post(self.url, {"ids": []}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(STUDENT_LOOKUP_MAX_ITEMS=2)
+    def test_too_many_identifiers_are_rejected(self):
+        response = self.client.post(
+            self.url, {"ids": [1, 2], "student_numbers": [3000]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_identifiers_are_rejected(self):
+        response = self.client.post(self.url, {"ids": ["abc"]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("ids", response.data)